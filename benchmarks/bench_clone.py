@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+Compares the ways of deriving a '-next' RC from an existing one, for an RC with many containers:
+copy.deepcopy() of the whole object, a JSON round trip of its model, and clone().
+
+Usage: python -m benchmarks.bench_clone [containers] [rounds]
+"""
+
+import copy
+import sys
+import timeit
+from benchmarks.fixtures import make_rc
+from kubernetes import K8sReplicationController
+from kubernetes.models.v1 import ReplicationController
+
+
+def json_round_trip(rc, name):
+    copied = K8sReplicationController(config=rc.config, name=name)
+    copied.model = ReplicationController(model=rc.config.json_codec.loads(rc.as_json()))
+    copied.set_name(name=name)
+    return copied
+
+
+def deep_copy(rc, name):
+    copied = copy.deepcopy(rc)
+    copied.set_name(name=name)
+    return copied
+
+
+def run(containers=50, rounds=5, number=100):
+    rc = make_rc(containers)
+    candidates = [
+        ('copy.deepcopy', lambda: deep_copy(rc, 'frontend-next')),
+        ('json round trip', lambda: json_round_trip(rc, 'frontend-next')),
+        ('clone', lambda: rc.clone(name='frontend-next'))
+    ]
+
+    for label, func in candidates:
+        assert func().as_dict() == rc.clone(name='frontend-next').as_dict()
+
+    print('fixture: RC with {0} containers, best of {1} rounds of {2} copies'.format(containers, rounds, number))
+    results = dict()
+    for label, func in candidates:
+        best = min(timeit.repeat(func, number=number, repeat=rounds)) / number
+        results[label] = best
+        print('{0:<16} {1:8.3f} ms per copy'.format(label, best * 1000))
+    print('speedup over deepcopy: {0:.2f}x'.format(results['copy.deepcopy'] / results['clone']))
+    return results
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:]]
+    run(*args)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+Compares the installed JsonCodec backends: decoding a 10k-pod list, encoding it back.
+
+Usage: python -m benchmarks.bench_codec [pods] [rounds]
+"""
+
+import sys
+import timeit
+from benchmarks.fixtures import make_pod_list, pod_list_json
+from kubernetes.utils.JsonCodec import JsonCodec, PREFERRED_CODECS
+
+
+def run(pods=10000, rounds=5):
+    payload = pod_list_json(pods)
+    document = make_pod_list(pods)
+    size_mb = len(payload) / (1024.0 * 1024.0)
+
+    print('fixture: {0} pods, {1:.1f} MB, best of {2} rounds'.format(pods, size_mb, rounds))
+    for name in PREFERRED_CODECS:
+        try:
+            codec = JsonCodec(name=name)
+        except SyntaxError:
+            print('{0:<12} not installed'.format(name))
+            continue
+        loads = min(timeit.repeat(lambda: codec.loads(payload), number=1, repeat=rounds))
+        dumps = min(timeit.repeat(lambda: codec.dumps(document), number=1, repeat=rounds))
+        print('{0:<12} loads {1:8.1f} MB/s   dumps {2:8.1f} MB/s'.format(name, size_mb / loads, size_mb / dumps))
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:]]
+    run(*args)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+Compares json.loads + convert() with the single-pass decode() on a 10k-pod list response.
+
+Usage: python -m benchmarks.bench_decode [pods] [rounds]
+"""
+
+import json
+import sys
+import timeit
+from benchmarks.fixtures import pod_list_json
+from kubernetes.utils.ConvertData import convert, decode
+
+
+def run(pods=10000, rounds=5):
+    payload = pod_list_json(pods)
+    size_mb = len(payload) / (1024.0 * 1024.0)
+
+    assert decode(payload) == convert(json.loads(payload))
+
+    candidates = [
+        ('json.loads + convert', lambda: convert(json.loads(payload))),
+        ('decode', lambda: decode(payload))
+    ]
+
+    print('fixture: {0} pods, {1:.1f} MB, best of {2} rounds'.format(pods, size_mb, rounds))
+    results = dict()
+    for label, func in candidates:
+        best = min(timeit.repeat(func, number=1, repeat=rounds))
+        results[label] = best
+        print('{0:<24} {1:8.3f} s {2:8.1f} MB/s'.format(label, best, size_mb / best))
+    print('speedup: {0:.2f}x'.format(results['json.loads + convert'] / results['decode']))
+    return results
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:]]
+    run(*args)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+Reports the bytes per pod held by a list of pods, as raw dicts, as Pod models and as CompactPod models.
+
+Pod models are built the way informer lookups build them: over a copy of the dict, without a snapshot.
+CompactPod models share the raw dicts, as K8sInformer.list_compact() does; their figure includes the dicts.
+
+Usage: python -m benchmarks.bench_memory [pods]
+"""
+
+import gc
+import sys
+from benchmarks.fixtures import pod_list_json
+from kubernetes.models.v1 import CompactPod, Pod
+from kubernetes.utils.JsonCodec import get_codec
+from kubernetes.utils.ModelCopy import copy_model
+
+
+def _slots(cls):
+    names = list()
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return names
+
+
+def deep_size(obj, seen=None):
+    """
+    :return: The bytes held by [obj] and everything it references, counting shared objects once.
+    """
+
+    seen = set() if seen is None else seen
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, type):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set)):
+            stack.extend(current)
+        else:
+            if hasattr(current, '__dict__'):
+                stack.append(current.__dict__)
+            for name in _slots(type(current)):
+                if hasattr(current, name):
+                    stack.append(getattr(current, name))
+    return size
+
+
+def run(pods=20000):
+    items = get_codec().loads(pod_list_json(pods))['items']
+    gc.collect()
+
+    raw = deep_size(items)
+    full = deep_size([Pod(model=copy_model(item)) for item in items])
+    compact = deep_size([CompactPod(model=item) for item in items])
+
+    print('fixture: {0} pods'.format(pods))
+    for label, size in [('raw dicts', raw), ('Pod', full), ('CompactPod', compact)]:
+        print('{0:<12} {1:10.0f} bytes per pod {2:8.1f} MB'.format(label, size / float(pods), size / (1024.0 * 1024.0)))
+    print('CompactPod over raw dicts: {0:.0f} bytes per pod'.format((compact - raw) / float(pods)))
+    return dict(raw=raw, full=full, compact=compact)
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:]]
+    run(*args)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import json
+
+
+def make_pod(i=0):
+    name = 'frontend-{0:05d}'.format(i)
+    return {
+        'kind': 'Pod',
+        'apiVersion': 'v1',
+        'metadata': {
+            'name': name,
+            'namespace': 'default',
+            'selfLink': '/api/v1/namespaces/default/pods/{0}'.format(name),
+            'uid': '6e2f1c1e-{0:04x}-11e6-8b6e-0800272f9cda'.format(i % 65536),
+            'resourceVersion': str(100000 + i),
+            'creationTimestamp': '2016-07-01T12:00:00Z',
+            'labels': {'name': 'frontend', 'rc_version': '2', 'tier': 'web'},
+            'annotations': {'kubernetes.io/created-by': '{"kind":"SerializedReference"}'}
+        },
+        'spec': {
+            'containers': [{
+                'name': 'nginx',
+                'image': 'nginx:1.11',
+                'args': ['-g', 'daemon off;'],
+                'ports': [{'containerPort': 80, 'protocol': 'TCP'}],
+                'resources': {'limits': {'cpu': '100m', 'memory': '64Mi'}},
+                'env': [{'name': 'TIER', 'value': 'web'}, {'name': 'INDEX', 'value': str(i)}],
+                'volumeMounts': [{'name': 'default-token', 'mountPath': '/var/run/secrets', 'readOnly': True}],
+                'imagePullPolicy': 'IfNotPresent',
+                'terminationMessagePath': '/dev/termination-log'
+            }],
+            'volumes': [{'name': 'default-token', 'secret': {'secretName': 'default-token'}}],
+            'restartPolicy': 'Always',
+            'dnsPolicy': 'ClusterFirst',
+            'nodeName': 'node-{0}'.format(i % 20),
+            'serviceAccountName': 'default',
+            'terminationGracePeriodSeconds': 30
+        },
+        'status': {
+            'phase': 'Running',
+            'conditions': [{'type': 'Ready', 'status': 'True', 'lastTransitionTime': '2016-07-01T12:00:05Z'}],
+            'hostIP': '10.0.0.{0}'.format(i % 20),
+            'podIP': '172.17.{0}.{1}'.format(i // 250, i % 250),
+            'startTime': '2016-07-01T12:00:00Z',
+            'containerStatuses': [{
+                'name': 'nginx',
+                'ready': True,
+                'restartCount': 0,
+                'image': 'nginx:1.11',
+                'imageID': 'docker://sha256:0d409d33b27e47423b049f7f863faa08655a8c901749c2b25b93ca67d01a470d',
+                'containerID': 'docker://{0:064x}'.format(i),
+                'state': {'running': {'startedAt': '2016-07-01T12:00:04Z'}}
+            }]
+        }
+    }
+
+
+def make_pod_list(count=10000):
+    return {
+        'kind': 'PodList',
+        'apiVersion': 'v1',
+        'metadata': {'selfLink': '/api/v1/namespaces/default/pods', 'resourceVersion': str(100000 + count)},
+        'items': [make_pod(i) for i in range(count)]
+    }
+
+
+def pod_list_json(count=10000):
+    return json.dumps(make_pod_list(count))
+
+
+def make_rc(containers=50):
+    from kubernetes import K8sConfig, K8sContainer, K8sReplicationController
+    rc = K8sReplicationController(config=K8sConfig(kubeconfig=None), name='frontend', replicas=3)
+    for i in range(containers):
+        container = K8sContainer(name='sidecar-{0:03d}'.format(i), image='nginx:1.11')
+        container.add_port(container_port=8000 + i, name='http-{0}'.format(i))
+        for j in range(5):
+            container.add_env(k='VAR_{0}'.format(j), v=str(j))
+        container.add_volume_mount(name='default-token', mount_path='/var/run/secrets', read_only=True)
+        container.set_readiness_probe(handler='httpGet', path='/healthz', port=8000 + i)
+        container.set_liveness_probe(handler='tcpSocket', port=8000 + i)
+        rc.add_container(container=container)
+    return rc
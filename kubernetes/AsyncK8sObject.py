@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+from kubernetes.K8sObject import K8sObject
+
+
+class AsyncK8sObject(object):
+    """
+    Non-blocking counterpart of K8sObject.
+
+    Calls that reach the API server are queued on the config's shared WorkerPool and return a Future right
+    away. Everything else (model getters and setters) is handed to the wrapped object and runs in place;
+    methods returning the wrapped object return this one instead, so calls can still be chained.
+
+    """
+
+    def __init__(self, config=None, name=None, obj_type=None, obj=None):
+        """
+        :param obj: The blocking object to wrap. If None, one is built from the other arguments.
+        """
+
+        if obj is None:
+            obj = self._build(config=config, name=name, obj_type=obj_type)
+        if not isinstance(obj, K8sObject):
+            raise SyntaxError('AsyncK8sObject: obj: [ {0} ] must be a K8sObject.'.format(obj.__class__.__name__))
+        self.obj = obj
+
+    @staticmethod
+    def _build(config=None, name=None, obj_type=None):
+        return K8sObject(config=config, name=name, obj_type=obj_type)
+
+    def __getattr__(self, item):
+        if item == 'obj':
+            raise AttributeError(item)
+        attr = getattr(self.obj, item)
+        if not callable(attr):
+            return attr
+
+        def local_call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            return self if result is self.obj else result
+        return local_call
+
+    def __str__(self):
+        return str(self.obj)
+
+    @property
+    def pool(self):
+        return self.obj.config.worker_pool
+
+    # ------------------------------------------------------------------------------------- remote API calls
+
+    def _remote_call(self, func, *args, **kwargs):
+        result = func(*args, **kwargs)
+        return self if result is self.obj else result
+
+    def _submit(self, func, *args, **kwargs):
+        return self.pool.submit(self._remote_call, func, *args, **kwargs)
+
+    def create(self):
+        return self._submit(self.obj.create)
+
+    def update(self, force=False):
+        return self._submit(self.obj.update, force=force)
+
+    def update_changes(self, patch_type='merge'):
+        return self._submit(self.obj.update_changes, patch_type=patch_type)
+
+    def patch(self, data=None, patch_type='strategic'):
+        return self._submit(self.obj.patch, data=data, patch_type=patch_type)
+
+    def patch_labels(self, labels=None):
+        return self._submit(self.obj.patch_labels, labels=labels)
+
+    def patch_annotations(self, annotations=None):
+        return self._submit(self.obj.patch_annotations, annotations=annotations)
+
+    def delete(self):
+        return self._submit(self.obj.delete)
+
+    def get_model(self):
+        return self._submit(self.obj.get_model)
+
+    def get_list(self, data=None):
+        return self._submit(self.obj.get_list, data=data)
+
+    def list(self):
+        return self._submit(self.obj.list)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import time
+from kubernetes.AsyncK8sObject import AsyncK8sObject
+from kubernetes.K8sConfig import K8sConfig
+from kubernetes.K8sInformer import K8sInformer
+from kubernetes.K8sPod import K8sPod
+from kubernetes.K8sReplicationController import K8sReplicationController
+from kubernetes.K8sRollout import DEFAULT_MAX_SURGE, DEFAULT_MAX_UNAVAILABLE
+from kubernetes.K8sExceptions import TimeoutException
+from kubernetes.utils.Future import Future
+
+
+class AsyncK8sReplicationController(AsyncK8sObject):
+
+    def __init__(self, config=None, name=None, image=None, replicas=0, obj=None):
+        if obj is None:
+            obj = K8sReplicationController(config=config, name=name, image=image, replicas=replicas)
+        AsyncK8sObject.__init__(self, obj=obj)
+
+    def get(self):
+        return self._submit(self.obj.get)
+
+    # -------------------------------------------------------------------------------------  scale
+
+    def get_scale(self):
+        return self._submit(self.obj.get_scale)
+
+    def set_scale(self, replicas=None):
+        return self._submit(self.obj.set_scale, replicas=replicas)
+
+    # -------------------------------------------------------------------------------------  patch
+
+    def scale_patch(self, replicas=None):
+        return self._submit(self.obj.scale_patch, replicas=replicas)
+
+    # -------------------------------------------------------------------------------------  wait for replicas
+
+    def wait_for_replicas(self, replicas=None, labels=None, timeout=None, callback=None):
+        """
+        Resolves once exactly [replicas] pods match [labels], and all of them are ready.
+
+        Uses the config's shared Pod informer instead of a thread: each wait is a handler run on pod events and
+        after each list, so any number of waits cost one watch between them, and none holds a worker.
+
+        :param callback: Called as callback(ready, current, desired) whenever the pod counts change.
+        :return: A Future resolving to this object, or to a TimeoutException after [timeout] seconds.
+        """
+
+        if replicas is None:
+            raise SyntaxError('ReplicationController: replicas: [ {0} ] cannot be None.'.format(replicas))
+        if not isinstance(replicas, int) or replicas < 0:
+            raise SyntaxError('ReplicationController: replicas: [ {0} ] must be a positive integer.'.format(replicas))
+        if callback is not None and not callable(callback):
+            raise SyntaxError('ReplicationController: callback: [ {0} ] must be callable.'.format(callback))
+
+        if labels is None:
+            labels = self.obj.get_pod_labels()
+
+        config = self.obj.config
+        informer = K8sInformer.shared(config=config, obj_type='Pod')
+        future = Future()
+        last_progress = [None]
+
+        def stop_checking():
+            informer.remove_handler(check)
+            informer.remove_sync_handler(check)
+
+        def check(*args):
+            pods = informer.store.by_selector(selector=labels)
+            ready = len([pod for pod in pods if K8sPod.is_pod_ready(pod)])
+            progress = (ready, len(pods))
+            if progress != last_progress[0]:
+                last_progress[0] = progress
+                if callback is not None:
+                    callback(ready, len(pods), replicas)
+            if len(pods) == replicas and (replicas == 0 or ready == len(pods)):
+                stop_checking()
+                future.set_result(self)
+
+        def expire():
+            stop_checking()
+            ready, current = last_progress[0] or (0, 0)
+            message = 'ReplicationController: timed out after [ {0} ]s waiting for [ {1} ] replicas with labels ' \
+                      '[ {2} ]: [ {3} ] ready out of [ {4} ].'.format(timeout, replicas, labels, ready, current)
+            future.set_exception(TimeoutException(message))
+
+        informer.add_handler(check)
+        informer.add_sync_handler(check)
+        if timeout is not None:
+            config.worker_pool.call_later(timeout, expire)
+        if informer.has_synced():
+            check()
+        return future
+
+    # -------------------------------------------------------------------------------------  get by name
+
+    @staticmethod
+    def get_by_name(config=None, name=None, refetch=False):
+        if config is not None and not isinstance(config, K8sConfig):
+            raise SyntaxError('AsyncK8sReplicationController: config: [ {0} ] must be a K8sConfig.'.format(config))
+        if config is None:
+            config = K8sConfig()
+        pool = config.worker_pool
+        return pool.submit(lambda: [AsyncK8sReplicationController(obj=rc) for rc in
+                                    K8sReplicationController.get_by_name(config=config, name=name, refetch=refetch)])
+
+    # -------------------------------------------------------------------------------------  resize
+
+    def resize(self, replicas=None, timeout=None):
+        """
+        Sets the replica count through the scale subresource and waits for it, without blocking.
+
+        The write and the final fetch each hold a worker for one small request; the wait holds none. Poll the
+        returned future with done(), or block on it with wait(timeout) or result(timeout).
+
+        :return: A Future resolving to this object, fetched once the replicas are ready.
+        """
+
+        if not isinstance(replicas, int) or replicas < 0:
+            raise SyntaxError('ReplicationController: replicas: [ {0} ] must be a positive integer.'.format(replicas))
+
+        def wait(scale):
+            labels = K8sReplicationController.get_scale_selector(scale)
+            if labels:
+                return self.wait_for_replicas(replicas=replicas, labels=labels, timeout=timeout)
+            # no selector in the Scale: the RC's own, once fetched.
+            return self.get().chain(lambda obj: self.wait_for_replicas(
+                replicas=replicas, labels=self.obj.get_selector(), timeout=timeout))
+
+        return self.set_scale(replicas=replicas).chain(wait).chain(lambda waited: self.get()).chain(lambda obj: self)
+
+    # -------------------------------------------------------------------------------------  rolling update
+
+    @staticmethod
+    def rolling_update(config=None, name=None, image=None, container_name=None, new_rc=None, wait_seconds=0,
+                       max_surge=DEFAULT_MAX_SURGE, max_unavailable=DEFAULT_MAX_UNAVAILABLE, timeout=None,
+                       callback=None):
+        """
+        Non-blocking K8sReplicationController.rolling_update, with the same phases and checkpoints.
+
+        Each API call holds a worker for one small request; waiting for pods holds none, as in resize(): the
+        waits are handlers on the shared Pod informer, and [wait_seconds] is a timer. Any number of updates can
+        run on the pool at once.
+
+        :return: A Future resolving to the K8sReplicationController [name] once it runs the new pods.
+        """
+
+        if config is not None and not isinstance(config, K8sConfig):
+            raise SyntaxError('AsyncK8sReplicationController: config: [ {0} ] must be a K8sConfig.'.format(config))
+        if config is None:
+            config = K8sConfig()
+        if isinstance(new_rc, AsyncK8sReplicationController):
+            new_rc = new_rc.obj
+        pool = config.worker_pool
+
+        def roll(started):
+            current_rc, next_rc, rollout = started
+            if rollout is None:
+                return pool.submit(K8sReplicationController._finish_rolling_update, name=name,
+                                   current_rc=current_rc, next_rc=next_rc)
+            return AsyncK8sReplicationController._run_rollout(rollout=rollout).chain(lambda done: pool.submit(
+                AsyncK8sReplicationController._rename, name=name, rollout=rollout))
+
+        return pool.submit(K8sReplicationController._start_rolling_update, config=config, name=name, image=image,
+                           container_name=container_name, new_rc=new_rc, wait_seconds=wait_seconds,
+                           max_surge=max_surge, max_unavailable=max_unavailable, timeout=timeout,
+                           callback=callback).chain(roll)
+
+    @staticmethod
+    def _rename(name=None, rollout=None):
+        rollout.phase = 'rename'
+        rollout.save_checkpoint()
+        return K8sReplicationController._finish_rolling_update(name=name, current_rc=rollout.current_rc,
+                                                               next_rc=rollout.next_rc)
+
+    @staticmethod
+    def _run_rollout(rollout=None):
+        """
+        K8sRollout.run(), one step at a time: scale operations are queued on the pool, and the waits for pods
+        are informer handlers, so no worker is held in between.
+
+        :return: A Future resolving to [rollout] once it's complete.
+        """
+
+        pool = rollout.next_rc.config.worker_pool
+        finished = Future()
+        rollout.started = time.time()
+
+        def wait_ready(rc, replicas):
+            return AsyncK8sReplicationController(obj=rc).wait_for_replicas(
+                replicas=replicas, labels=rc.get_selector(), timeout=rollout.step_timeout)
+
+        def pause(result):
+            paused = Future()
+            pool.call_later(rollout.wait_seconds, paused.set_result, result)
+            return paused
+
+        def step(scaled):
+            started, metrics = scaled
+            if not metrics['waited']:
+                return pool.submit(rollout._end_step, started, metrics)
+            ready = wait_ready(rollout.next_rc, metrics['new_replicas'])
+            if rollout.wait_seconds:
+                ready = ready.chain(pause)
+            return ready.chain(lambda result: pool.submit(rollout._end_step, started, metrics))
+
+        def complete():
+            rollout.phase = 'complete'
+            rollout.save_checkpoint()
+            rollout.elapsed = time.time() - rollout.started
+            return rollout
+
+        def settle(future):
+            if future.exception() is not None:
+                finished.set_exception(future.exception())
+            else:
+                finished.set_result(rollout)
+
+        def next_step(future=None):
+            if future is not None and future.exception() is not None:
+                settle(future)
+            elif not rollout.is_done():
+                pool.submit(rollout._scale).chain(step).add_done_callback(next_step)
+            else:
+                ready = Future.gather([
+                    wait_ready(rollout.next_rc, rollout.replicas),
+                    wait_ready(rollout.current_rc, 0)
+                ])
+                ready.chain(lambda result: pool.submit(complete)).add_done_callback(settle)
+
+        if rollout.phase == 'complete':
+            finished.set_result(rollout)
+        else:
+            next_step()
+        return finished
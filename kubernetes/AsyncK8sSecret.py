@@ -0,0 +1,21 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+from kubernetes.AsyncK8sObject import AsyncK8sObject
+from kubernetes.K8sSecret import K8sSecret
+
+
+class AsyncK8sSecret(AsyncK8sObject):
+
+    def __init__(self, config=None, name=None, obj=None):
+        if obj is None:
+            obj = K8sSecret(config=config, name=name)
+        AsyncK8sObject.__init__(self, obj=obj)
+
+    def get(self):
+        return self._submit(self.obj.get)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+from kubernetes.AsyncK8sObject import AsyncK8sObject
+from kubernetes.K8sConfig import K8sConfig
+from kubernetes.K8sService import K8sService
+
+
+class AsyncK8sService(AsyncK8sObject):
+
+    def __init__(self, config=None, name=None, obj=None):
+        if obj is None:
+            obj = K8sService(config=config, name=name)
+        AsyncK8sObject.__init__(self, obj=obj)
+
+    def get(self):
+        return self._submit(self.obj.get)
+
+    # ------------------------------------------------------------------------------------- filtering
+
+    @staticmethod
+    def get_by_name(config=None, name=None, refetch=False):
+        if config is not None and not isinstance(config, K8sConfig):
+            raise SyntaxError('AsyncK8sService: config: [ {0} ] must be a K8sConfig.'.format(config))
+        if config is None:
+            config = K8sConfig()
+        pool = config.worker_pool
+        return pool.submit(lambda: [AsyncK8sService(obj=svc) for svc in
+                                    K8sService.get_by_name(config=config, name=name, refetch=refetch)])
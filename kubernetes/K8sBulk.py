@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import math
+import time
+from kubernetes.K8sObject import K8sObject
+from kubernetes.AsyncK8sObject import AsyncK8sObject
+from kubernetes.K8sExceptions import ConflictException
+from kubernetes.utils.Future import Future
+from kubernetes.utils.WorkerPool import WorkerPool
+
+VALID_ACTIONS = ['apply', 'create', 'update', 'delete']
+DEFAULT_CONCURRENCY = 10
+
+
+class K8sBulk(object):
+    """
+    Runs one action (create, update, delete, or apply: create, then merge-patch if it already exists) on many
+    objects at once, [concurrency] at a time.
+
+    A failure is recorded against its object and doesn't stop the batch. Objects built from the same K8sConfig
+    share its keep-alive connections; keep [concurrency] at or below the config's pool_maxsize to reuse them all.
+
+    """
+
+    def __init__(self, objects=None, action='apply', concurrency=DEFAULT_CONCURRENCY):
+        if objects is None:
+            raise SyntaxError('K8sBulk: objects: [ {0} ] cannot be None.'.format(objects))
+        objects = [obj.obj if isinstance(obj, AsyncK8sObject) else obj for obj in objects]
+        for obj in objects:
+            if not isinstance(obj, K8sObject):
+                raise SyntaxError('K8sBulk: object: [ {0} ] must be a K8sObject.'.format(obj.__class__.__name__))
+        if action not in VALID_ACTIONS:
+            valid = ", ".join(VALID_ACTIONS)
+            raise SyntaxError('K8sBulk: action: [ {0} ] must be in: [ {1} ]'.format(action, valid))
+        if not isinstance(concurrency, int) or concurrency < 1:
+            raise SyntaxError('K8sBulk: concurrency: [ {0} ] must be a positive integer.'.format(concurrency))
+
+        self.objects = objects
+        self.action = action
+        self.concurrency = concurrency
+        self.results = list()
+        self.elapsed = None
+
+    def _run_one(self, obj):
+        result = dict(object=obj, action=self.action, success=False, error=None, latency=None)
+        started = time.time()
+        try:
+            if self.action == 'apply':
+                try:
+                    obj.create()
+                    result['action'] = 'create'
+                except ConflictException:
+                    # a PUT of the local model would reset the fields the server owns, such as a Service's
+                    # clusterIP, which can't change; a merge patch leaves them alone.
+                    obj.patch(data=obj.as_dict(), patch_type='merge')
+                    result['action'] = 'update'
+            else:
+                getattr(obj, self.action)()
+            result['success'] = True
+        except Exception as err:
+            result['error'] = err
+        result['latency'] = time.time() - started
+        return result
+
+    def run(self):
+        pool = WorkerPool(workers=min(self.concurrency, max(len(self.objects), 1)))
+        started = time.time()
+        try:
+            futures = [pool.submit(self._run_one, obj) for obj in self.objects]
+            self.results = Future.gather(futures).result()
+        finally:
+            pool.close()
+        self.elapsed = time.time() - started
+        return self
+
+    # ------------------------------------------------------------------------------------- results
+
+    def get_failures(self):
+        return [result for result in self.results if not result['success']]
+
+    @staticmethod
+    def _percentile(ordered, percent):
+        if not ordered:
+            return None
+        rank = int(math.ceil(percent / 100.0 * len(ordered)))
+        return ordered[max(rank, 1) - 1]
+
+    def get_stats(self):
+        latencies = sorted(result['latency'] for result in self.results)
+        succeeded = len([result for result in self.results if result['success']])
+        elapsed = self.elapsed or 0
+        return dict(
+            total=len(self.results),
+            succeeded=succeeded,
+            failed=len(self.results) - succeeded,
+            elapsed=elapsed,
+            throughput=len(self.results) / elapsed if elapsed > 0 else None,
+            p50=self._percentile(latencies, 50),
+            p90=self._percentile(latencies, 90),
+            p99=self._percentile(latencies, 99),
+            max=latencies[-1] if latencies else None
+        )
+
+    @staticmethod
+    def apply_many(objects=None, action='apply', concurrency=DEFAULT_CONCURRENCY):
+        """
+        :return: The finished K8sBulk; see its results and get_stats().
+        """
+        return K8sBulk(objects=objects, action=action, concurrency=concurrency).run()
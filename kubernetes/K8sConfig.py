@@ -8,8 +8,14 @@
 
 import re
 from os.path import expanduser, isfile
-import yaml
 from yaml import YAMLError
+from kubernetes.utils.KubeConfigLoader import load_kubeconfig
+from kubernetes.utils.JsonCodec import get_codec
+from kubernetes.utils.WorkerPool import WorkerPool, DEFAULT_WORKERS
+from kubernetes.utils.RateLimiter import RateLimiter
+from kubernetes.utils.RetryPolicy import RetryPolicy
+from kubernetes.utils.HttpSession import HttpSession, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, \
+    DEFAULT_POOL_IDLE_TIMEOUT
 
 DEFAULT_KUBECONFIG = "{0}/.kube/config".format(expanduser("~"))
 DEFAULT_API_HOST = "localhost:8888"
@@ -24,10 +30,14 @@ VALID_HOST_RE = re.compile(r'^(http[s]?\:\/\/)?([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-
 
 class K8sConfig:
     def __init__(self, kubeconfig=DEFAULT_KUBECONFIG, api_host=DEFAULT_API_HOST, auth=None, cert=None,
-                 namespace=DEFAULT_NAMESPACE, pull_secret=None, token=None, version=DEFAULT_API_VERSION):
+                 namespace=DEFAULT_NAMESPACE, pull_secret=None, token=None, version=DEFAULT_API_VERSION,
+                 pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 pool_idle_timeout=DEFAULT_POOL_IDLE_TIMEOUT, json_codec=None, max_body_size=None,
+                 async_workers=DEFAULT_WORKERS, qps=None, burst=None, retry_policy=None):
         """
         Pulls configuration from a kubeconfig file, if present, otherwise accepts user-defined parameters.s
         See http://kubernetes.io/docs/user-guide/kubeconfig-file/ for information on the kubeconfig file.
+        Parsed kubeconfig files are cached process-wide and only re-read when they change on disk.
 
         :param kubeconfig: Absolute path to the kubeconfig file, if any.
         :param api_host: Absolute URI where the API server resides.
@@ -36,15 +46,28 @@ class K8sConfig:
         :param pull_secret: The password to use when pulling images from the container repository.
         :param token: An authentication token. Mutually exclusive with 'auth'.
         :param version: The version of the API to target. Defaults to 'v1'.
+        :param pool_connections: The number of per-host keep-alive connection pools to keep.
+        :param pool_maxsize: The maximum number of keep-alive connections per host.
+        :param pool_idle_timeout: Seconds after which idle pooled connections are closed. None disables eviction.
+        :param json_codec: 'auto', 'simplejson' or 'stdlib'. Defaults to $K8S_JSON_CODEC, or 'auto'.
+        :param max_body_size: Refuse API responses larger than this many bytes. None means no limit.
+        :param async_workers: The number of threads running the AsyncK8s* objects' API calls.
+        :param qps: Limit requests to the API server to this many per second. None means no limit.
+        :param burst: The number of requests allowed at once, above qps. Defaults to qps.
+        :param retry_policy: A RetryPolicy for transient API failures. None sends every request once.
         """
 
+        if max_body_size is not None and (not isinstance(max_body_size, int) or max_body_size < 1):
+            raise SyntaxError('K8sConfig: max_body_size: [ {0} ] must be a positive integer.'.format(max_body_size))
+        if retry_policy is not None and not isinstance(retry_policy, RetryPolicy):
+            raise SyntaxError('K8sConfig: retry_policy: [ {0} ] must be a RetryPolicy.'.format(retry_policy))
+
         dotconf = None
         if kubeconfig is not None:
             if not isfile(kubeconfig):
                 raise SyntaxError('K8sConfig: kubeconfig: [ {0} ] doesn\'t exist.'.format(kubeconfig))
             try:
-                with open(kubeconfig, 'r') as stream:
-                    dotconf = yaml.load(stream)
+                dotconf = load_kubeconfig(kubeconfig)
             except YAMLError:
                 raise SyntaxError('K8sConfig: kubeconfig: [ {0} ] is not a valid json file.'.format(kubeconfig))
 
@@ -115,8 +138,28 @@ class K8sConfig:
 
             self.api_host = api_host
             self.auth = auth
+            self.ca_cert = None
             self.cert = cert
             self.namespace = namespace
             self.pull_secret = pull_secret
             self.token = token
             self.version = version
+
+        # every K8sObject built from this config shares the same keep-alive connection pool.
+        self.session = HttpSession(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            idle_timeout=pool_idle_timeout
+        )
+
+        self.json_codec = get_codec(json_codec)
+        self.max_body_size = max_body_size
+
+        # every AsyncK8s* object built from this config queues its API calls on the same workers.
+        self.worker_pool = WorkerPool(workers=async_workers)
+
+        # every K8sObject built from this config draws from the same token bucket.
+        self.rate_limiter = RateLimiter(qps=qps, burst=burst) if qps is not None else None
+
+        # every K8sObject built from this config retries transient failures under the same policy.
+        self.retry_policy = retry_policy
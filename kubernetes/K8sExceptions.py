@@ -20,3 +20,23 @@ class UnprocessableEntityException(Exception):
 class BadRequestException(Exception):
     def __init__(self, *args, **kwargs):
         super(BadRequestException, self).__init__(*args, **kwargs)
+
+
+class GoneException(Exception):
+    def __init__(self, *args, **kwargs):
+        super(GoneException, self).__init__(*args, **kwargs)
+
+
+class TimeoutException(Exception):
+    def __init__(self, *args, **kwargs):
+        super(TimeoutException, self).__init__(*args, **kwargs)
+
+
+class ResponseTooLargeException(Exception):
+    def __init__(self, *args, **kwargs):
+        super(ResponseTooLargeException, self).__init__(*args, **kwargs)
+
+
+class ConflictException(BadRequestException):
+    def __init__(self, *args, **kwargs):
+        super(ConflictException, self).__init__(*args, **kwargs)
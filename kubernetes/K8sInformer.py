@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import threading
+from kubernetes.K8sConfig import K8sConfig
+from kubernetes.K8sObject import K8sObject
+from kubernetes.K8sPod import K8sPod
+from kubernetes.K8sReplicationController import K8sReplicationController
+from kubernetes.K8sSecret import K8sSecret
+from kubernetes.K8sService import K8sService
+from kubernetes.models.v1.CompactPod import CompactPod
+from kubernetes.models.v1.Pod import Pod
+from kubernetes.models.v1.ReplicationController import ReplicationController
+from kubernetes.models.v1.Secret import Secret
+from kubernetes.models.v1.Service import Service
+from kubernetes.utils.ModelCopy import copy_model
+from kubernetes.utils.ObjectStore import ObjectStore, DEFAULT_INDEXERS
+from kubernetes.K8sExceptions import GoneException
+
+OBJECT_CLASSES = {
+    'Pod': (K8sPod, Pod),
+    'ReplicationController': (K8sReplicationController, ReplicationController),
+    'Secret': (K8sSecret, Secret),
+    'Service': (K8sService, Service)
+}
+
+DEFAULT_WATCH_WINDOW = 60
+DEFAULT_RETRY_DELAY = 1.0
+
+_shared = dict()
+_shared_lock = threading.Lock()
+
+
+class K8sInformer(object):
+    """
+    Keeps a local, indexed copy of every object of one type in the configured namespace.
+
+    One list fills the store, then a watch resumed from the list's resourceVersion applies each change
+    as it happens. Lookups are answered from memory; re-listing only happens if the watch falls too far
+    behind (HTTP 410 Gone).
+
+    """
+
+    def __init__(self, config=None, obj_type='Pod', labels=None, indexers=None, watch_window=DEFAULT_WATCH_WINDOW,
+                 retry_delay=DEFAULT_RETRY_DELAY):
+        """
+        :param config: The K8sConfig to use.
+        :param obj_type: One of Pod, ReplicationController, Secret or Service.
+        :param labels: A dict of labels; only matching objects are cached.
+        :param indexers: A dict of index name -> indexer function. Defaults to labels, node_name, image and selector.
+        :param watch_window: Seconds each watch request stays open before it is renewed.
+        :param retry_delay: Seconds to wait before retrying after the API server failed us.
+        """
+
+        if config is not None and not isinstance(config, K8sConfig):
+            raise SyntaxError('K8sInformer: config: [ {0} ] must be a K8sConfig.'.format(config))
+        if obj_type not in OBJECT_CLASSES:
+            valid = ", ".join(sorted(OBJECT_CLASSES))
+            raise SyntaxError('K8sInformer: obj_type: [ {0} ] must be in: [ {1} ]'.format(obj_type, valid))
+        if labels is not None and not isinstance(labels, dict):
+            raise SyntaxError('K8sInformer: labels: [ {0} ] must be a dict.'.format(labels))
+        if not isinstance(watch_window, (int, float)) or watch_window <= 0:
+            raise SyntaxError('K8sInformer: watch_window: [ {0} ] must be a positive number.'.format(watch_window))
+
+        self.config = config if config is not None else K8sConfig()
+        self.obj_type = obj_type
+        self.labels = labels
+        self.watch_window = watch_window
+        self.retry_delay = retry_delay
+        self.store = ObjectStore(indexers=DEFAULT_INDEXERS if indexers is None else indexers)
+        self.resource_version = None
+        self.last_error = None
+
+        self._client = K8sObject(config=self.config, name=obj_type.lower(), obj_type=obj_type)
+        self._handlers = list()
+        self._sync_handlers = list()
+        self._handlers_lock = threading.Lock()
+        self._synced = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    # ------------------------------------------------------------------------------------- lifecycle
+
+    def add_handler(self, handler=None):
+        """
+        :param handler: Called as handler(event_type, obj) for every watch event applied to the store.
+        """
+
+        if handler is None or not callable(handler):
+            raise SyntaxError('K8sInformer: handler: [ {0} ] must be callable.'.format(handler))
+        with self._handlers_lock:
+            self._handlers = self._handlers + [handler]
+        return self
+
+    def remove_handler(self, handler=None):
+        with self._handlers_lock:
+            self._handlers = [h for h in self._handlers if h is not handler]
+        return self
+
+    def add_sync_handler(self, handler=None):
+        """
+        :param handler: Called as handler() each time a list fills the store: the first one, and every re-list
+                        after the watch fell behind. Changes between the two lists come with no watch event.
+        """
+
+        if handler is None or not callable(handler):
+            raise SyntaxError('K8sInformer: handler: [ {0} ] must be callable.'.format(handler))
+        with self._handlers_lock:
+            self._sync_handlers = self._sync_handlers + [handler]
+        return self
+
+    def remove_sync_handler(self, handler=None):
+        with self._handlers_lock:
+            self._sync_handlers = [h for h in self._sync_handlers if h is not handler]
+        return self
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='K8sInformer-{0}'.format(self.obj_type))
+            self._thread.daemon = True
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+        return self
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def has_synced(self):
+        return self._synced.is_set()
+
+    def wait_for_sync(self, timeout=None):
+        self._synced.wait(timeout)
+        return self._synced.is_set()
+
+    def _params(self):
+        if self.labels is None:
+            return None
+        return dict(labelSelector=",".join(['%s=%s' % (k, v) for (k, v) in self.labels.items()]))
+
+    def _list(self):
+        obj_list = self._client.get_list(data=self._params())
+        self.store.replace(objs=obj_list.get('items', None) or list())
+        self.resource_version = (obj_list.get('metadata', None) or dict()).get('resourceVersion', None)
+        self._synced.set()
+        for handler in self._sync_handlers:
+            try:
+                handler()
+            except Exception as err:
+                self.last_error = err
+
+    def _apply(self, event):
+        event_type, obj = event['type'], event['object']
+        if event_type == 'DELETED':
+            self.store.delete(obj=obj)
+        else:
+            self.store.add(obj=obj)
+        self.resource_version = obj['metadata']['resourceVersion']
+        for handler in self._handlers:
+            try:
+                handler(event_type, obj)
+            except Exception as err:
+                self.last_error = err
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                if self.resource_version is None:
+                    self._list()
+                events = self._client.watch(data=self._params(), resource_version=self.resource_version,
+                                            timeout=self.watch_window, stop_event=self._stop_event)
+                for event in events:
+                    self._apply(event)
+                    if self._stop_event.is_set():
+                        break
+            except GoneException:
+                # we fell behind the server's history; start over from a fresh list.
+                self.resource_version = None
+            except Exception as err:
+                self.last_error = err
+                self._stop_event.wait(self.retry_delay)
+
+    # ------------------------------------------------------------------------------------- lookups
+
+    def _wrap(self, obj):
+        k8s_class, model_class = OBJECT_CLASSES[self.obj_type]
+        name = obj['metadata']['name']
+        # the model classes strip server-side fields in place; never hand them the cached dict.
+        # the copy is the only one made: lookups are reads, and are not snapshotted for update().
+        model = copy_model(obj)
+        if model_class is Secret:
+            model = Secret(name=name, model=model)
+        else:
+            model = model_class(model=model)
+        if k8s_class is K8sPod:
+            return K8sPod(config=self.config, name=name, model=model)
+        k8s_obj = k8s_class(config=self.config, name=name)
+        k8s_obj.model = model
+        return k8s_obj
+
+    def get(self, name=None):
+        obj = self.store.get(key=name)
+        return self._wrap(obj) if obj is not None else None
+
+    def list(self):
+        return [self._wrap(obj) for obj in self.store.list()]
+
+    def get_by_index(self, index=None, value=None):
+        return [self._wrap(obj) for obj in self.store.by_index(name=index, value=value)]
+
+    def get_by_labels(self, labels=None):
+        return [self._wrap(obj) for obj in self.store.by_selector(selector=labels)]
+
+    def _check_compact(self):
+        if self.obj_type != 'Pod':
+            raise SyntaxError('K8sInformer: compact models: informer caches [ {0} ], not Pod.'.format(self.obj_type))
+
+    def get_compact(self, name=None):
+        """
+        :return: A read-only CompactPod over the cached pod [name], or None. Nothing is copied: the pod's dict is
+                 the store's own, and is replaced rather than changed when a watch event updates it.
+        """
+
+        self._check_compact()
+        obj = self.store.get(key=name)
+        return CompactPod(model=obj) if obj is not None else None
+
+    def list_compact(self, labels=None):
+        """
+        :param labels: A dict of labels; only matching pods are returned.
+        :return: A read-only CompactPod over each cached pod, as get_compact() does.
+        """
+
+        self._check_compact()
+        objs = self.store.list() if labels is None else self.store.by_selector(selector=labels)
+        return [CompactPod(model=obj) for obj in objs]
+
+    def get_pods_for_rc(self, rc=None, ready=None, compact=False):
+        """
+        :param rc: A K8sReplicationController.
+        :param ready: If True or False, only return pods whose readiness matches.
+        :param compact: If True, return read-only CompactPods over the cached dicts, as list_compact() does.
+        :return: The cached pods selected by the ReplicationController. Readiness is checked on the cached
+                 dicts, so only the pods returned are copied and wrapped.
+        """
+
+        if self.obj_type != 'Pod':
+            raise SyntaxError('K8sInformer: get_pods_for_rc: informer caches [ {0} ], not Pod.'.format(self.obj_type))
+        if rc is None or not isinstance(rc, K8sReplicationController):
+            raise SyntaxError('K8sInformer: rc: [ {0} ] must be a K8sReplicationController.'.format(rc))
+
+        pods = self.list_compact(labels=rc.get_selector())
+        if ready is not None:
+            pods = [pod for pod in pods if K8sPod.is_pod_ready(pod.get()) == ready]
+        if compact:
+            return pods
+        return [self._wrap(pod.get()) for pod in pods]
+
+    # ------------------------------------------------------------------------------------- shared
+
+    @staticmethod
+    def shared(config=None, obj_type='Pod'):
+        """
+        Returns the running informer for [obj_type] shared by everything using [config], starting it on first use.
+        """
+
+        if config is None:
+            raise SyntaxError('K8sInformer: config: [ {0} ] cannot be None.'.format(config))
+
+        key = (id(config), obj_type)
+        with _shared_lock:
+            informer = _shared.get(key, None)
+            if informer is None or informer.config is not config or informer._stop_event.is_set():
+                informer = K8sInformer(config=config, obj_type=obj_type).start()
+                _shared[key] = informer
+        return informer
+
+    @staticmethod
+    def stop_shared(config=None):
+        """
+        Stops every shared informer started for [config].
+        """
+
+        with _shared_lock:
+            keys = [key for key, informer in _shared.items() if informer.config is config]
+            informers = [_shared.pop(key) for key in keys]
+        for informer in informers:
+            informer.stop()
+        return informers
@@ -11,11 +11,26 @@ from kubernetes.models.v1.BaseUrls import BaseUrls
 from kubernetes.models.v1.BaseModel import BaseModel
 from kubernetes.models.v1.DeleteOptions import DeleteOptions
 from kubernetes.K8sConfig import K8sConfig
-from kubernetes.K8sExceptions import NotFoundException, UnprocessableEntityException, BadRequestException
-import json
+from kubernetes.K8sExceptions import NotFoundException, UnprocessableEntityException, BadRequestException, \
+    GoneException, ConflictException
+import copy
+import math
+import time
+import requests
 
 VALID_K8s_OBJS = ['Pod', 'ReplicationController', 'Secret', 'Service']
 
+WATCH_MAX_RECONNECTS = 5
+WATCH_RECONNECT_DELAY = 0.1
+
+DEFAULT_PAGE_SIZE = 500
+
+PATCH_TYPES = {
+    'json': 'application/json-patch+json',
+    'merge': 'application/merge-patch+json',
+    'strategic': 'application/strategic-merge-patch+json'
+}
+
 
 class K8sObject(object):
 
@@ -56,7 +71,7 @@ class K8sObject(object):
         return self.model.get()
 
     def as_json(self):
-        return json.dumps(self.model.get())
+        return self.model.serialize(codec=self.config.json_codec)
 
     def set_name(self, name):
         self.name = name
@@ -66,9 +81,29 @@ class K8sObject(object):
                 my_method(name=name)
         return self
 
+    def clone(self, name=None):
+        """
+        Derives a new object from this one, without deep-copying it.
+
+        The clone shares this object's config and its immutable attributes; only its model is copied,
+        with BaseModel.clone(). A clone under another name is another object: it keeps no snapshot, since
+        this object's server state says nothing about it.
+
+        :param name: The clone's name; this object's name if None.
+        :return: A new object of the same class, not yet created on the server.
+        """
+
+        clone = copy.copy(self)
+        clone.model = self.model.clone()
+        if name is not None and name != self.name:
+            clone.set_name(name=name)
+            clone.model._snapshot = None
+        return clone
+
     # ------------------------------------------------------------------------------------- remote API calls
 
-    def request(self, method='GET', host=None, url=None, auth=None, cert=None, data=None, token=None, ca_cert=None):
+    def request(self, method='GET', host=None, url=None, auth=None, cert=None, data=None, token=None, ca_cert=None,
+                stream=False, timeout=None, content_type=None):
         host = self.config.api_host if host is None else host
         url = self.base_url if url is None else url
         auth = self.config.auth if auth is None else auth
@@ -76,17 +111,31 @@ class K8sObject(object):
         token = self.config.token if token is None else token
         ca_cert = self.config.ca_cert if ca_cert is None else ca_cert
 
-        r = HttpRequest(
-            method=method,
-            host=host,
-            url=url,
-            auth=auth,
-            cert=cert,
-            ca_cert=ca_cert,
-            data=data,
-            token=token
-        )
-        return r.send()
+        def attempt():
+            if self.config.rate_limiter is not None:
+                self.config.rate_limiter.acquire()
+            r = HttpRequest(
+                method=method,
+                host=host,
+                url=url,
+                auth=auth,
+                cert=cert,
+                ca_cert=ca_cert,
+                data=data,
+                token=token,
+                session=self.config.session,
+                codec=self.config.json_codec,
+                max_body_size=self.config.max_body_size,
+                content_type=content_type
+            )
+            if stream:
+                return r.stream(timeout=timeout)
+            return r.send()
+
+        # watches resume on their own; everything else goes through the config's retry policy, if any.
+        if stream or self.config.retry_policy is None:
+            return attempt()
+        return self.config.retry_policy.call(method=method, func=attempt)
 
     def list(self):
         state = self.request(method='GET')
@@ -94,6 +143,74 @@ class K8sObject(object):
             raise Exception('Could not fetch list of objects of type: {this_type}.'.format(this_type=self.obj_type))
         return state.get('data', dict()).get('items', list())
 
+    def watch(self, data=None, resource_version=None, timeout=None, stop_event=None):
+        """
+        Streams change events for objects of this type, as dicts: { 'type': ADDED|MODIFIED|DELETED, 'object': {...} }.
+
+        The last resourceVersion seen is tracked, and the watch resumes from it whenever the server closes the
+        stream or the connection drops, so no event is missed or replayed and no re-list is needed.
+
+        :param data: Additional query parameters, such as a labelSelector.
+        :param resource_version: Only stream changes newer than this resourceVersion.
+        :param timeout: Stop streaming after this many seconds. None watches forever.
+        :param stop_event: A threading.Event; once set, the watch is not resumed again.
+        :return: A generator of event dicts.
+        """
+
+        if data is not None and not isinstance(data, dict):
+            raise SyntaxError('K8sObject: data: [ {0} ] must be a dict.'.format(data.__class__.__name__))
+
+        params = dict() if data is None else dict(data)
+        params['watch'] = 'true'
+        deadline = None if timeout is None else time.time() + timeout
+        failures = 0
+
+        while stop_event is None or not stop_event.is_set():
+            if resource_version is not None:
+                params['resourceVersion'] = resource_version
+
+            read_timeout = None
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return
+                params['timeoutSeconds'] = int(math.ceil(remaining))
+                read_timeout = remaining + 1
+
+            try:
+                state = self.request(method='GET', data=params, stream=True, timeout=read_timeout)
+                if not state.get('success'):
+                    status = state.get('status', '')
+                    reason = (state.get('data') or dict()).get('message', None)
+                    message = 'K8sObject: WATCH [ {0} ] failed: HTTP {1} : {2}'.format(self.obj_type, status, reason)
+                    if status == 410:
+                        raise GoneException(message)
+                    if status == 404:
+                        raise NotFoundException(message)
+                    raise BadRequestException(message)
+
+                for event in state.get('data'):
+                    if event.get('type') == 'ERROR':
+                        status = event.get('object', dict())
+                        message = 'K8sObject: WATCH [ {0} ] failed: HTTP {1} : {2}'\
+                            .format(self.obj_type, status.get('code', ''), status.get('message', None))
+                        if status.get('code') == 410:
+                            raise GoneException(message)
+                        raise BadRequestException(message)
+                    resource_version = event['object']['metadata']['resourceVersion']
+                    failures = 0
+                    yield event
+
+            except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                # the stream dropped; resume from the last resourceVersion seen.
+                failures += 1
+                if failures > WATCH_MAX_RECONNECTS:
+                    raise
+                if stop_event is not None:
+                    stop_event.wait(WATCH_RECONNECT_DELAY * failures)
+                else:
+                    time.sleep(WATCH_RECONNECT_DELAY * failures)
+
     def get_model(self):
         if self.name is None:
             raise SyntaxError('K8sObject: name: [ {0} ] must be set to fetch the object.'.format(self.name))
@@ -110,6 +227,53 @@ class K8sObject(object):
         model = state.get('data')
         return model
 
+    def get_list(self, data=None):
+        if data is not None and not isinstance(data, dict):
+            raise SyntaxError('K8sObject: data: [ {0} ] must be a dict.'.format(data.__class__.__name__))
+
+        url = '{base}'.format(base=self.base_url)
+        state = self.request(method='GET', url=url, data=data)
+
+        if not state.get('success'):
+            status = state.get('status', '')
+            reason = (state.get('data') or dict()).get('message', None)
+            message = 'K8sObject: LIST [ {0} ] failed: HTTP {1} : {2}'.format(self.obj_type, status, reason)
+            if status == 410:
+                raise GoneException(message)
+            raise BadRequestException(message)
+
+        return state.get('data')
+
+    def iter_list(self, page_size=DEFAULT_PAGE_SIZE, data=None):
+        """
+        Yields every object of this type, fetching at most [page_size] of them per request.
+
+        Pages are chained with the server's continue token, so only one page is held in memory at a time.
+        If the token expires before the last page is read, a GoneException is raised; restart the iteration.
+
+        :param page_size: The number of objects requested per page.
+        :param data: Additional query parameters, such as a labelSelector.
+        :return: A generator of object dicts.
+        """
+
+        if not isinstance(page_size, int) or page_size < 1:
+            raise SyntaxError('K8sObject: page_size: [ {0} ] must be a positive integer.'.format(page_size))
+        if data is not None and not isinstance(data, dict):
+            raise SyntaxError('K8sObject: data: [ {0} ] must be a dict.'.format(data.__class__.__name__))
+
+        params = dict() if data is None else dict(data)
+        params['limit'] = page_size
+
+        while True:
+            page = self.get_list(data=params)
+            token = (page.get('metadata', None) or dict()).get('continue', None)
+            items = page.get('items', None) or list()
+            for item in items:
+                yield item
+            if not token:
+                return
+            params['continue'] = token
+
     def get_with_params(self, data=None):
         if data is None:
             raise SyntaxError('K8sObject: data: [ {0} ] cannot be None.'.format(data))
@@ -126,7 +290,7 @@ class K8sObject(object):
             raise SyntaxError('K8sObject: name: [ {0} ] must be set to CREATE the object.'.format(self.name))
 
         url = '{base}'.format(base=self.base_url)
-        state = self.request(method='POST', url=url, data=self.model.get())
+        state = self.request(method='POST', url=url, data=self.as_json())
 
         if not state.get('success'):
             status = state.get('status', '')
@@ -134,16 +298,27 @@ class K8sObject(object):
             message = 'K8sObject: CREATE failed : HTTP {0} : {1}'.format(status, reason)
             if int(status) == 422:
                 raise UnprocessableEntityException(message)
+            if int(status) == 409:
+                raise ConflictException(message)
             raise BadRequestException(message)
 
+        self.model.snapshot()
         return self
 
-    def update(self):
+    def update(self, force=False):
+        """
+        PUTs the whole model, unless it hasn't changed since it was last fetched or saved.
+
+        :param force: Send the PUT even if nothing changed.
+        """
+
         if self.name is None:
             raise SyntaxError('K8sObject: name: [ {0} ] must be set to UPDATE the object.'.format(self.name))
+        if not force and not self.model.is_dirty():
+            return self
 
         url = '{base}/{name}'.format(base=self.base_url, name=self.name)
-        state = self.request(method='PUT', url=url, data=self.model.get())
+        state = self.request(method='PUT', url=url, data=self.as_json())
 
         if not state.get('success'):
             status = state.get('status', '')
@@ -151,8 +326,76 @@ class K8sObject(object):
             message = 'K8sObject: UPDATE failed: HTTP {0} : {1}'.format(status, reason)
             raise BadRequestException(message)
 
+        self.model.snapshot()
+        return self
+
+    def update_changes(self, patch_type='merge'):
+        """
+        PATCHes only what changed in the model since it was last fetched or saved; does nothing if that's nothing.
+
+        :param patch_type: 'merge' or 'json'.
+        """
+
+        changes = self.model.diff(patch_type=patch_type)
+        if not changes:
+            return self
+        return self.patch(data=changes, patch_type=patch_type)
+
+    def patch(self, data=None, patch_type='strategic'):
+        """
+        Sends only the fields to change, instead of PUTting the whole model. The local model is then replaced
+        with the object the server returns.
+
+        :param data: For 'merge' and 'strategic', a partial object, where a key set to None is removed.
+                     For 'json', a list of RFC 6902 operations.
+        :param patch_type: 'strategic' (the default), 'merge' or 'json'.
+        """
+
+        if self.name is None:
+            raise SyntaxError('K8sObject: name: [ {0} ] must be set to PATCH the object.'.format(self.name))
+        if patch_type not in PATCH_TYPES:
+            valid = ", ".join(sorted(PATCH_TYPES))
+            raise SyntaxError('K8sObject: patch_type: [ {0} ] must be in: [ {1} ]'.format(patch_type, valid))
+        if patch_type == 'json' and not isinstance(data, list):
+            raise SyntaxError('K8sObject: data: [ {0} ] must be a list.'.format(data.__class__.__name__))
+        if patch_type != 'json' and not isinstance(data, dict):
+            raise SyntaxError('K8sObject: data: [ {0} ] must be a dict.'.format(data.__class__.__name__))
+
+        url = '{base}/{name}'.format(base=self.base_url, name=self.name)
+        state = self.request(method='PATCH', url=url, data=data, content_type=PATCH_TYPES[patch_type])
+
+        if not state.get('success'):
+            status = state.get('status', '')
+            reason = (state.get('data') or dict()).get('message', None)
+            message = 'K8sObject: PATCH failed: HTTP {0} : {1}'.format(status, reason)
+            if status == 404:
+                raise NotFoundException(message)
+            if status == 409:
+                raise ConflictException(message)
+            if status == 422:
+                raise UnprocessableEntityException(message)
+            raise BadRequestException(message)
+
+        if self.model.__class__ is not BaseModel:
+            self.model = self.model.__class__(name=self.name, model=state.get('data')).snapshot()
         return self
 
+    def patch_labels(self, labels=None):
+        """
+        :param labels: The labels to set; a label set to None is removed. Other labels are left alone.
+        """
+        if not isinstance(labels, dict):
+            raise SyntaxError('K8sObject: labels: [ {0} ] must be a dict.'.format(labels.__class__.__name__))
+        return self.patch(data=dict(metadata=dict(labels=labels)), patch_type='merge')
+
+    def patch_annotations(self, annotations=None):
+        """
+        :param annotations: The annotations to set; an annotation set to None is removed. Others are left alone.
+        """
+        if not isinstance(annotations, dict):
+            raise SyntaxError('K8sObject: annotations: [ {0} ] must be a dict.'.format(annotations.__class__.__name__))
+        return self.patch(data=dict(metadata=dict(annotations=annotations)), patch_type='merge')
+
     def delete(self):
         if self.name is None:
             raise SyntaxError('K8sObject: name: [ {0} ] must be set to DELETE the object.'.format(self.name))
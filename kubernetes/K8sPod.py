@@ -6,6 +6,7 @@
 # file 'LICENSE.md', which is part of this source code package.
 #
 
+from kubernetes.K8sConfig import K8sConfig
 from kubernetes.K8sPodBasedObject import K8sPodBasedObject
 from kubernetes.models.v1.Pod import Pod
 from kubernetes.models.v1.PodStatus import PodStatus
@@ -14,8 +15,18 @@ from kubernetes.K8sExceptions import NotFoundException
 
 class K8sPod(K8sPodBasedObject):
 
-    def __init__(self, config=None, name=None):
+    def __init__(self, config=None, name=None, model=None):
+        """
+        :param model: A Pod model, e.g. from a list response, to use instead of building a new one.
+        """
+
         K8sPodBasedObject.__init__(self, config=config, obj_type='Pod', name=name)
+        if model is not None:
+            if not isinstance(model, Pod):
+                raise SyntaxError('K8sPod: model: [ {0} ] must be a Pod.'.format(model))
+            self.model = model
+            return
+
         self.model = Pod(name=name, namespace=self.config.namespace)
 
         if self.config.pull_secret is not None:
@@ -44,7 +55,7 @@ class K8sPod(K8sPodBasedObject):
     # ------------------------------------------------------------------------------------- get
 
     def get(self):
-        self.model = Pod(model=self.get_model())
+        self.model = Pod(model=self.get_model()).snapshot()
         return self
 
     def get_annotation(self, k=None):
@@ -85,6 +96,21 @@ class K8sPod(K8sPodBasedObject):
                 ready = True
         return ready
 
+    @staticmethod
+    def is_pod_ready(pod=None):
+        """
+        Same check as is_ready(), on a raw pod dict from a list response or a watch event, without building a model.
+        """
+
+        status = pod.get('status', None) or dict()
+        conditions = status.get('conditions', None) or list()
+        if status.get('phase', None) != 'Running':
+            return False
+        for cond in conditions:
+            if cond.get('type', '') != 'Ready' or cond.get('status', 'False') != 'True':
+                return False
+        return True
+
     # ------------------------------------------------------------------------------------- set
 
     def set_annotations(self, dico=None):
@@ -102,42 +128,62 @@ class K8sPod(K8sPodBasedObject):
     # ------------------------------------------------------------------------------------- filtering
 
     @staticmethod
-    def get_by_name(config=None, name=None):
+    def _from_list(config=None, pods=None, refetch=False):
+        pod_list = list()
+        for pod in pods:
+            model = Pod(model=pod)
+            if refetch:
+                try:
+                    pod_list.append(K8sPod(config=config, name=model.get_pod_name()).get())
+                except NotFoundException:
+                    pass
+            else:
+                # the list response already holds the full object; no need for a GET per pod.
+                pod_list.append(K8sPod(config=config, name=model.get_pod_name(), model=model))
+        return pod_list
+
+    @staticmethod
+    def get_by_name(config=None, name=None, refetch=False):
         if name is None:
             raise SyntaxError('K8sPod: name: [ {0} ] cannot be None.'.format(name))
         if not isinstance(name, str):
             raise SyntaxError('K8sPod: name: [ {0} ] must be a string.'.format(name))
+        if config is None:
+            config = K8sConfig()
 
-        pod_list = list()
         data = {'labelSelector': 'name={0}'.format(name)}
         pods = K8sPod(config=config, name=name).get_with_params(data=data)
-
-        for pod in pods:
-            try:
-                pod_name = Pod(model=pod).get_pod_name()
-                pod_list.append(K8sPod(config=config, name=pod_name).get())
-            except NotFoundException:
-                pass
-
-        return pod_list
+        return K8sPod._from_list(config=config, pods=pods, refetch=refetch)
 
     @staticmethod
-    def get_by_labels(config=None, labels=None):
+    def get_by_labels(config=None, labels=None, refetch=False):
         if labels is None:
             raise SyntaxError('K8sPod: labels: [ {0} ] cannot be None.'.format(labels))
         if not isinstance(labels, dict):
             raise SyntaxError('K8sPod: labels: [ {0} ] must be a dict.'.format(labels))
+        if config is None:
+            config = K8sConfig()
 
-        pod_list = list()
         my_labels = ",".join(['%s=%s' % (key, value) for (key, value) in labels.items()])
         data = dict(labelSelector="{labels}".format(labels=my_labels))
         pods = K8sPod(config=config, name=labels.get('name')).get_with_params(data=data)
+        return K8sPod._from_list(config=config, pods=pods, refetch=refetch)
 
-        for pod in pods:
-            try:
-                pod_name = Pod(model=pod).get_pod_name()
-                pod_list.append(K8sPod(config=config, name=pod_name).get())
-            except NotFoundException:
-                pass
+    # ------------------------------------------------------------------------------------- watching
 
-        return pod_list
+    @staticmethod
+    def watch_by_labels(config=None, labels=None, resource_version=None, timeout=None):
+        if labels is None:
+            raise SyntaxError('K8sPod: labels: [ {0} ] cannot be None.'.format(labels))
+        if not isinstance(labels, dict):
+            raise SyntaxError('K8sPod: labels: [ {0} ] must be a dict.'.format(labels))
+        if config is None:
+            config = K8sConfig()
+
+        my_labels = ",".join(['%s=%s' % (key, value) for (key, value) in labels.items()])
+        data = dict(labelSelector="{labels}".format(labels=my_labels))
+        watcher = K8sPod(config=config, name=labels.get('name', 'pod'))
+
+        for event in watcher.watch(data=data, resource_version=resource_version, timeout=timeout):
+            model = Pod(model=event['object'])
+            yield event['type'], K8sPod(config=config, name=model.get_pod_name(), model=model)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import time
+from kubernetes.K8sConfig import K8sConfig
+from kubernetes.K8sPod import K8sPod
+from kubernetes.K8sExceptions import NotFoundException, BadRequestException, GoneException, TimeoutException
+
+DEFAULT_MIN_INTERVAL = 0.2
+DEFAULT_MAX_INTERVAL = 5.0
+STOP_CHECK_INTERVAL = 1
+
+
+class K8sReplicaWaiter(object):
+    """
+    Waits until exactly [replicas] pods match [labels], and all of them are ready.
+
+    Pod changes are followed through one list and one watch, so the number of API calls doesn't grow with the
+    number of pods. If the API server refuses to watch, falls back to polling with exponential backoff,
+    one list request per poll.
+
+    """
+
+    def __init__(self, config=None, labels=None, replicas=None, timeout=None, callback=None, stop_event=None,
+                 use_watch=True, min_interval=DEFAULT_MIN_INTERVAL, max_interval=DEFAULT_MAX_INTERVAL):
+        """
+        :param config: The K8sConfig to use.
+        :param labels: A dict of labels selecting the pods.
+        :param replicas: The number of ready pods to wait for.
+        :param timeout: Raise a TimeoutException after this many seconds. None waits forever.
+        :param callback: Called as callback(ready, current, desired) whenever the pod counts change.
+        :param stop_event: A threading.Event; when set, wait() returns False as soon as possible.
+        :param use_watch: Set to False to poll instead of watching.
+        :param min_interval: The initial polling interval, in seconds.
+        :param max_interval: The maximum polling interval, in seconds.
+        """
+
+        if config is not None and not isinstance(config, K8sConfig):
+            raise SyntaxError('K8sReplicaWaiter: config: [ {0} ] must be a K8sConfig.'.format(config))
+        if labels is None or not isinstance(labels, dict):
+            raise SyntaxError('K8sReplicaWaiter: labels: [ {0} ] must be a dict.'.format(labels))
+        if replicas is None or not isinstance(replicas, int) or replicas < 0:
+            raise SyntaxError('K8sReplicaWaiter: replicas: [ {0} ] must be a positive integer.'.format(replicas))
+        if timeout is not None and (not isinstance(timeout, (int, float)) or timeout < 0):
+            raise SyntaxError('K8sReplicaWaiter: timeout: [ {0} ] must be a positive number.'.format(timeout))
+        if callback is not None and not callable(callback):
+            raise SyntaxError('K8sReplicaWaiter: callback: [ {0} ] must be callable.'.format(callback))
+        if not 0 < min_interval <= max_interval:
+            raise SyntaxError('K8sReplicaWaiter: intervals: [ {0}, {1} ] are invalid.'
+                              .format(min_interval, max_interval))
+
+        self.config = config if config is not None else K8sConfig()
+        self.labels = labels
+        self.replicas = replicas
+        self.timeout = timeout
+        self.callback = callback
+        self.stop_event = stop_event
+        self.use_watch = use_watch
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+        self.pods = dict()
+        self._last_progress = None
+
+    # ------------------------------------------------------------------------------------- state
+
+    def get_ready(self):
+        return len([ready for ready in self.pods.values() if ready])
+
+    def is_done(self):
+        if len(self.pods) != self.replicas:
+            return False
+        return self.replicas == 0 or self.get_ready() == len(self.pods)
+
+    def _is_stopped(self):
+        return self.stop_event is not None and self.stop_event.is_set()
+
+    def _update(self, event_type, obj):
+        # readiness is read from the raw dict: no model is built for each event.
+        name = obj['metadata']['name']
+        if event_type == 'DELETED':
+            self.pods.pop(name, None)
+        else:
+            self.pods[name] = K8sPod.is_pod_ready(obj)
+
+    def _report(self):
+        progress = (self.get_ready(), len(self.pods))
+        if progress == self._last_progress:
+            return False
+        self._last_progress = progress
+        if self.callback is not None:
+            self.callback(progress[0], progress[1], self.replicas)
+        return True
+
+    def _remaining(self, deadline):
+        if deadline is None:
+            return None
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            message = 'K8sReplicaWaiter: timed out after [ {0} ]s waiting for [ {1} ] replicas with labels [ {2} ]: ' \
+                      '[ {3} ] ready out of [ {4} ].'.format(self.timeout, self.replicas, self.labels,
+                                                             self.get_ready(), len(self.pods))
+            raise TimeoutException(message)
+        return remaining
+
+    # ------------------------------------------------------------------------------------- wait
+
+    def wait(self):
+        """
+        :return: True once the replicas are ready, False if stop_event was set first.
+        """
+
+        deadline = None if self.timeout is None else time.time() + self.timeout
+        if self.use_watch:
+            try:
+                return self._wait_watch(deadline)
+            except (NotFoundException, BadRequestException):
+                # the API server won't let us watch; poll instead.
+                pass
+        return self._wait_poll(deadline)
+
+    def _list(self, watcher, data):
+        pod_list = watcher.get_list(data=data)
+        self.pods = dict()
+        for pod in pod_list.get('items', list()):
+            self._update('ADDED', pod)
+        return pod_list.get('metadata', dict()).get('resourceVersion', None)
+
+    def _wait_watch(self, deadline):
+        my_labels = ",".join(['%s=%s' % (key, value) for (key, value) in self.labels.items()])
+        data = dict(labelSelector=my_labels)
+        watcher = K8sPod(config=self.config, name=self.labels.get('name', 'pod'))
+        resource_version = self._list(watcher, data)
+
+        while True:
+            self._report()
+            if self.is_done():
+                return True
+            if self._is_stopped():
+                return False
+
+            window = self._remaining(deadline)
+            if self.stop_event is not None:
+                window = STOP_CHECK_INTERVAL if window is None else min(window, STOP_CHECK_INTERVAL)
+
+            try:
+                for event in watcher.watch(data=data, resource_version=resource_version, timeout=window):
+                    resource_version = event['object']['metadata']['resourceVersion']
+                    self._update(event['type'], event['object'])
+                    self._report()
+                    if self.is_done() or self._is_stopped():
+                        break
+            except GoneException:
+                # our resourceVersion was compacted away; start over from a fresh list.
+                resource_version = self._list(watcher, data)
+
+    def _wait_poll(self, deadline):
+        interval = self.min_interval
+
+        while True:
+            if self._is_stopped():
+                return False
+
+            pods = K8sPod.get_by_labels(config=self.config, labels=self.labels)
+            self.pods = dict((pod.name, pod.is_ready()) for pod in pods)
+            progressed = self._report()
+            if self.is_done():
+                return True
+
+            interval = self.min_interval if progressed else min(interval * 2, self.max_interval)
+            remaining = self._remaining(deadline)
+            delay = interval if remaining is None else min(interval, remaining)
+
+            if self.stop_event is not None:
+                self.stop_event.wait(delay)
+            else:
+                time.sleep(delay)
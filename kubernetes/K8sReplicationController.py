@@ -7,14 +7,17 @@
 #
 
 import uuid
-import copy
-import time
 from kubernetes import K8sConfig
 from kubernetes.K8sPodBasedObject import K8sPodBasedObject
-from kubernetes.K8sPod import K8sPod
+from kubernetes.K8sReplicaWaiter import K8sReplicaWaiter
+from kubernetes.K8sRollout import K8sRollout, DEFAULT_MAX_SURGE, DEFAULT_MAX_UNAVAILABLE, CHECKPOINT_ANNOTATION
 from kubernetes.K8sContainer import K8sContainer
 from kubernetes.models.v1.ReplicationController import ReplicationController
-from kubernetes.K8sExceptions import NotFoundException
+from kubernetes.K8sExceptions import NotFoundException, BadRequestException, TimeoutException
+
+NEXT_RC_SUFFIX = '-next'
+PARTNER_ANNOTATION = 'update-partner'
+REPLICAS_ANNOTATION = 'desired-replicas'
 
 
 class K8sReplicationController(K8sPodBasedObject):
@@ -76,7 +79,7 @@ class K8sReplicationController(K8sPodBasedObject):
     # -------------------------------------------------------------------------------------  get
 
     def get(self):
-        self.model = ReplicationController(model=self.get_model())
+        self.model = ReplicationController(model=self.get_model()).snapshot()
         return self
 
     def get_annotation(self, k=None):
@@ -144,7 +147,14 @@ class K8sReplicationController(K8sPodBasedObject):
 
     # -------------------------------------------------------------------------------------  wait for replicas
 
-    def wait_for_replicas(self, replicas=None, labels=None):
+    def wait_for_replicas(self, replicas=None, labels=None, timeout=None, callback=None, stop_event=None,
+                          use_watch=True):
+        """
+        Waits until exactly [replicas] pods match [labels], and all of them are ready. See K8sReplicaWaiter.
+
+        Raises a TimeoutException if [timeout] seconds pass first, or if [stop_event] is set first.
+        """
+
         if replicas is None:
             raise SyntaxError('ReplicationController: replicas: [ {0} ] cannot be None.'.format(replicas))
         if not isinstance(replicas, int) or replicas < 0:
@@ -153,38 +163,27 @@ class K8sReplicationController(K8sPodBasedObject):
         if labels is None:
             labels = self.get_pod_labels()
 
-        name = labels.get('name', None)
-        pod_list = list()
-        pod_qty = len(pod_list)
-        ready_check = False
-
         print('Waiting for replicas to scale to: [ {0} ] with labels: [ {1} ]'.format(replicas, labels))
 
-        while not ((pod_qty == replicas) and ready_check):
-            if labels is None:
-                pod_list = K8sPod.get_by_name(config=self.config, name=name)
-            else:
-                pod_list = K8sPod.get_by_labels(config=self.config, labels=labels)
-
-            pod_qty = len(pod_list)
-            if replicas > 0:
-                pods_ready = 0
-                for pod in pod_list:
-                    assert isinstance(pod, K8sPod)
-                    if pod.is_ready():
-                        pods_ready += 1
-                if pods_ready == len(pod_list):
-                    ready_check = True
-            else:
-                ready_check = True
-
-            time.sleep(0.2)
+        waiter = K8sReplicaWaiter(
+            config=self.config,
+            labels=labels,
+            replicas=replicas,
+            timeout=timeout,
+            callback=callback,
+            stop_event=stop_event,
+            use_watch=use_watch
+        )
+        if not waiter.wait():
+            message = 'ReplicationController: stopped waiting for [ {0} ] replicas with labels [ {1} ]: ' \
+                      '[ {2} ] ready out of [ {3} ].'.format(replicas, labels, waiter.get_ready(), len(waiter.pods))
+            raise TimeoutException(message)
         return self
 
     # -------------------------------------------------------------------------------------  get by name
 
     @staticmethod
-    def get_by_name(config=None, name=None):
+    def get_by_name(config=None, name=None, refetch=False):
         if name is None:
             raise SyntaxError('ReplicationController: name: [ {0} ] cannot be None.'.format(name))
         if not isinstance(name, str):
@@ -192,24 +191,106 @@ class K8sReplicationController(K8sPodBasedObject):
 
         if config is not None and not isinstance(config, K8sConfig):
             raise SyntaxError('ReplicationController: config: [ {0} ] must be a K8sConfig'.format(config))
+        if config is None:
+            config = K8sConfig()
 
         rc_list = list()
         data = {'labelSelector': 'name={0}'.format(name)}
         rcs = K8sReplicationController(config=config, name=name).get_with_params(data=data)
 
         for rc in rcs:
-            try:
-                rc_name = ReplicationController(model=rc).get_name()
-                rc_list.append(K8sReplicationController(config=config, name=rc_name).get())
-            except NotFoundException:
-                pass
+            model = ReplicationController(model=rc)
+            if refetch:
+                try:
+                    rc_list.append(K8sReplicationController(config=config, name=model.get_name()).get())
+                except NotFoundException:
+                    pass
+            else:
+                # the list response already holds the full object; no need for a GET per item.
+                k8s_rc = K8sReplicationController(config=config, name=model.get_name())
+                k8s_rc.model = model
+                rc_list.append(k8s_rc)
 
         return rc_list
 
+    # -------------------------------------------------------------------------------------  patch
+
+    def scale_patch(self, replicas=None):
+        """
+        Sets the number of replicas on the server with a single PATCH; no GET, and no resending the pod template.
+        """
+        if not isinstance(replicas, int) or replicas < 0:
+            raise SyntaxError('ReplicationController: replicas: [ {0} ] must be a positive integer.'.format(replicas))
+        return self.patch(data=dict(spec=dict(replicas=replicas)), patch_type='merge')
+
+    # -------------------------------------------------------------------------------------  scale
+
+    def _scale_request(self, method='GET', data=None):
+        url = '{base}/{name}/scale'.format(base=self.base_url, name=self.name)
+        state = self.request(method=method, url=url, data=data)
+
+        if not state.get('success'):
+            status = state.get('status', '')
+            reason = (state.get('data') or dict()).get('message', None)
+            message = 'ReplicationController: {0} [ {1}/scale ] failed: HTTP {2} : {3}'\
+                .format(method, self.name, status, reason)
+            if status == 404:
+                raise NotFoundException(message)
+            raise BadRequestException(message)
+
+        return state.get('data')
+
+    def get_scale(self):
+        """
+        Reads the scale subresource: a small Scale object instead of the whole RC.
+
+        :return: The Scale dict; spec.replicas is the desired count, status.selector the pods' label selector.
+        """
+        return self._scale_request(method='GET')
+
+    def set_scale(self, replicas=None):
+        """
+        Writes the desired replica count through the scale subresource, in a single request.
+
+        :return: The Scale dict returned by the server.
+        """
+
+        if not isinstance(replicas, int) or replicas < 0:
+            raise SyntaxError('ReplicationController: replicas: [ {0} ] must be a positive integer.'.format(replicas))
+
+        data = dict(
+            kind='Scale',
+            apiVersion='autoscaling/v1',
+            metadata=dict(name=self.name, namespace=self.config.namespace),
+            spec=dict(replicas=replicas)
+        )
+        scale = self._scale_request(method='PUT', data=data)
+
+        was_clean = not self.model.is_dirty()
+        self.model.set_replicas(replicas=replicas)
+        if was_clean:
+            self.model.snapshot()
+        return scale
+
+    @staticmethod
+    def get_scale_selector(scale=None):
+        """
+        :return: The label selector of a Scale dict, as a dict of labels.
+        """
+        selector = (scale.get('status', None) or dict()).get('selector', None) or ''
+        return dict(term.split('=', 1) for term in selector.split(',') if '=' in term)
+
     # -------------------------------------------------------------------------------------  resize
 
     @staticmethod
-    def resize(config=None, name=None, replicas=None):
+    def resize(config=None, name=None, replicas=None, timeout=None):
+        """
+        Sets the replica count through the scale subresource, then waits for the pods.
+
+        Only the Scale object is written; the RC is fetched once the pods are ready, so the returned object can
+        be updated without reverting the new replica count. The pods are those of the Scale's selector, or of the
+        RC's when the server leaves it out. See AsyncK8sReplicationController.resize() to resize without blocking.
+        """
         if name is None:
             raise SyntaxError('ReplicationController: name: [ {0} ] cannot be None.'.format(name))
         if replicas is None:
@@ -224,50 +305,84 @@ class K8sReplicationController(K8sPodBasedObject):
         if config is not None and not isinstance(config, K8sConfig):
             raise SyntaxError('ReplicationController: config: [ {0} ] must be a K8sConfig'.format(config))
 
-        current_rc = K8sReplicationController(config=config, name=name).get()
-        current_rc.set_replicas(replicas)
-        current_rc.update()
-        current_rc.wait_for_replicas(replicas=replicas)
+        current_rc = K8sReplicationController(config=config, name=name)
+        scale = current_rc.set_scale(replicas=replicas)
+        labels = K8sReplicationController.get_scale_selector(scale) or current_rc.get().get_selector()
+        current_rc.wait_for_replicas(replicas=replicas, labels=labels, timeout=timeout)
 
-        return current_rc
+        return current_rc.get()
 
     # -------------------------------------------------------------------------------------  rolling update
 
     @staticmethod
-    def rolling_update(config=None, name=None, image=None, container_name=None, new_rc=None, wait_seconds=10):
-        next_rc_suffix = '-next'
-        partner_annotation = 'update-partner'
-        replicas_annotation = 'desired-replicas'
-        next_name = name + next_rc_suffix
-        phase = 'init'
-        next_exists = False
-        next_rc = None
-
+    def _get_or_none(config=None, name=None):
         try:
-            current_rc = K8sReplicationController(config=config, name=name).get()
-            current_exists = True
+            return K8sReplicationController(config=config, name=name).get()
         except NotFoundException:
+            return None
+
+    @staticmethod
+    def rolling_update(config=None, name=None, image=None, container_name=None, new_rc=None, wait_seconds=0,
+                       max_surge=DEFAULT_MAX_SURGE, max_unavailable=DEFAULT_MAX_UNAVAILABLE, timeout=None,
+                       callback=None):
+        """
+        Replaces the pods of RC [name] with pods running [image] (or those of [new_rc]), in batches.
+
+        The update goes through three phases: creating the '-next' RC, the rollout, and renaming '-next' back
+        to [name]. Progress is checkpointed on the '-next' RC, so calling rolling_update again after a crash
+        resumes where it stopped: at the same rollout step, or in the middle of the rename.
+
+        See K8sRollout for [max_surge], [max_unavailable], [timeout] (per step) and [callback] (per step metrics).
+        [wait_seconds] adds a pause after each step once its pods are ready; none is needed.
+        """
+
+        current_rc, next_rc, rollout = K8sReplicationController._start_rolling_update(
+            config=config, name=name, image=image, container_name=container_name, new_rc=new_rc,
+            wait_seconds=wait_seconds, max_surge=max_surge, max_unavailable=max_unavailable, timeout=timeout,
+            callback=callback
+        )
+        if rollout is not None:
+            try:
+                rollout.run()
+                rollout.phase = 'rename'
+                rollout.save_checkpoint()
+            except Exception as e:
+                message = "Got an exception of type {my_type} with message {my_msg}"\
+                    .format(my_type=type(e), my_msg=e.message)
+                raise Exception(message)
+        return K8sReplicationController._finish_rolling_update(name=name, current_rc=current_rc, next_rc=next_rc)
+
+    @staticmethod
+    def _start_rolling_update(config=None, name=None, image=None, container_name=None, new_rc=None, wait_seconds=0,
+                              max_surge=DEFAULT_MAX_SURGE, max_unavailable=DEFAULT_MAX_UNAVAILABLE, timeout=None,
+                              callback=None):
+        """
+        Creates the '-next' RC, or finds it and its checkpoint when resuming.
+
+        :return: (current_rc, next_rc, rollout): the K8sRollout to run, or None if only the rename is left.
+        """
+
+        next_name = name + NEXT_RC_SUFFIX
+
+        current_rc = K8sReplicationController._get_or_none(config=config, name=name)
+        next_rc = K8sReplicationController._get_or_none(config=config, name=next_name)
+        if current_rc is None and next_rc is None:
             raise NotFoundException('RollingUpdate: Current replication controller does not exist.')
 
-        try:
-            next_rc = K8sReplicationController(config=config, name=next_name).get()
-            next_exists = True
-        except NotFoundException:
-            pass
+        checkpoint = K8sRollout.load_checkpoint(next_rc) if next_rc is not None else None
 
-        if current_exists and not next_exists:
+        if next_rc is None:
             try:
                 if new_rc is not None:
-                    next_rc = new_rc
-                    next_rc.add_annotation(k=replicas_annotation, v=next_rc.get_replicas())
+                    next_rc = new_rc.clone(name=next_name)
+                    next_rc.add_annotation(k=REPLICAS_ANNOTATION, v=str(new_rc.get_replicas()))
                 else:
-                    next_rc = copy.deepcopy(current_rc)
-                    next_rc.add_annotation(k=replicas_annotation, v=current_rc.get_replicas())
+                    next_rc = current_rc.clone(name=next_name)
+                    next_rc.add_annotation(k=REPLICAS_ANNOTATION, v=str(current_rc.get_replicas()))
                     if container_name is not None:
                         next_rc.set_image(name=container_name, image=image)
                     else:
                         next_rc.set_image(name=name, image=image)
-                next_rc.set_name(name=next_name)
                 next_rc.add_pod_label(k='name', v=name)
                 my_version = str(uuid.uuid4())
                 next_rc.add_pod_label(k='rc_version', v=my_version)
@@ -280,65 +395,70 @@ class K8sReplicationController(K8sPodBasedObject):
                     .format(my_type=type(e), my_msg=e.message)
                 raise Exception(message)
             try:
-                current_rc.add_annotation(k=partner_annotation, v=next_name)
-                current_rc.update()
+                current_rc.patch_annotations(annotations={PARTNER_ANNOTATION: next_name})
             except Exception as e:
                 message = "Got an exception of type {my_type} with message {my_msg}"\
                     .format(my_type=type(e), my_msg=e.message)
                 raise Exception(message)
-            phase = 'rollout'
 
-        elif next_exists and not current_exists:
-            phase = 'rename'
+        elif current_rc is None or (checkpoint is not None and checkpoint.get('phase') == 'rename'):
+            # the rename had started: [name] is gone, or already re-created from '-next'.
+            return current_rc, next_rc, None
 
-        elif current_exists and next_exists:
-            if not next_rc.get_annotation(k=replicas_annotation):
-                try:
-                    next_rc.add_annotation(k=replicas_annotation, v=current_rc.get_replicas())
-                    next_rc.update()
-                except Exception as e:
-                    message = "Got an exception of type {my_type} with message {my_msg}"\
-                        .format(my_type=type(e), my_msg=e.message)
-                    raise Exception(message)
-            phase = 'rollout'
-
-        if phase == 'rollout':
-            desired_replicas = next_rc.get_annotation(k=replicas_annotation)
+        else:
+            # the crash may have come between creating '-next' and annotating either RC.
             try:
-                while next_rc.get_replicas() < int(desired_replicas):
-                    next_replicas = next_rc.get_replicas() + 1
-                    next_rc.set_replicas(replicas=next_replicas)
-                    next_rc.update()
-                    next_rc.wait_for_replicas(replicas=next_replicas, labels=next_rc.get_pod_labels())
-                    time.sleep(wait_seconds)
-                    if current_rc.get_replicas() > 0:
-                        current_replicas = current_rc.get_replicas() - 1
-                        current_rc.set_replicas(replicas=current_replicas)
-                        current_rc.update()
-                        current_rc.wait_for_replicas(replicas=current_replicas, labels=current_rc.get_pod_labels())
-                if current_rc.get_replicas() > 0:
-                    current_rc.set_replicas(replicas=0)
-                    current_rc.update()
-                    current_rc.wait_for_replicas(replicas=0, labels=current_rc.get_pod_labels())
-
+                if not next_rc.get_annotation(k=REPLICAS_ANNOTATION):
+                    next_rc.patch_annotations(annotations={REPLICAS_ANNOTATION: str(current_rc.get_replicas())})
+                if current_rc.get_annotation(k=PARTNER_ANNOTATION) != next_name:
+                    current_rc.patch_annotations(annotations={PARTNER_ANNOTATION: next_name})
             except Exception as e:
                 message = "Got an exception of type {my_type} with message {my_msg}"\
                     .format(my_type=type(e), my_msg=e.message)
                 raise Exception(message)
-            phase = 'rename'
 
-        if phase == 'rename':
-            try:
+        desired_replicas = next_rc.get_annotation(k=REPLICAS_ANNOTATION)
+        try:
+            rollout = K8sRollout(
+                current_rc=current_rc,
+                next_rc=next_rc,
+                replicas=int(desired_replicas),
+                max_surge=max_surge,
+                max_unavailable=max_unavailable,
+                step_timeout=timeout,
+                wait_seconds=wait_seconds,
+                callback=callback,
+                checkpoint=checkpoint
+            )
+        except Exception as e:
+            message = "Got an exception of type {my_type} with message {my_msg}"\
+                .format(my_type=type(e), my_msg=e.message)
+            raise Exception(message)
+        return current_rc, next_rc, rollout
+
+    @staticmethod
+    def _finish_rolling_update(name=None, current_rc=None, next_rc=None):
+        """
+        Renames '-next' back to [name]: deletes the old RC, re-creates [name] from '-next', then deletes '-next'.
+
+        An RC [name] with the selector of '-next' is the re-created one, left by an interrupted rename; any
+        other is the old RC.
+        """
+
+        try:
+            if current_rc is not None and current_rc.get_selector() != next_rc.get_selector():
                 current_rc.delete()
-                current_rc = copy.deepcopy(next_rc)
-                current_rc.set_name(name=name)
-                current_rc.del_annotation(k=partner_annotation)
-                current_rc.del_annotation(k=replicas_annotation)
+                current_rc = None
+            if current_rc is None:
+                current_rc = next_rc.clone(name=name)
+                current_rc.del_annotation(k=PARTNER_ANNOTATION)
+                current_rc.del_annotation(k=REPLICAS_ANNOTATION)
+                current_rc.del_annotation(k=CHECKPOINT_ANNOTATION)
                 current_rc.create()
-                next_rc.delete()
-            except Exception as e:
-                message = "Got an exception of type {my_type} with message {my_msg}"\
-                    .format(my_type=type(e), my_msg=e.message)
-                raise Exception(message)
+            next_rc.delete()
+        except Exception as e:
+            message = "Got an exception of type {my_type} with message {my_msg}"\
+                .format(my_type=type(e), my_msg=e.message)
+            raise Exception(message)
 
         return current_rc
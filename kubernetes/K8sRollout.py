@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import math
+import time
+from kubernetes.K8sObject import K8sObject
+from kubernetes.K8sPod import K8sPod
+from kubernetes.K8sReplicaWaiter import K8sReplicaWaiter
+
+DEFAULT_MAX_SURGE = 1
+DEFAULT_MAX_UNAVAILABLE = 0
+
+CHECKPOINT_ANNOTATION = 'rollout-checkpoint'
+
+
+class K8sRollout(object):
+    """
+    Moves [replicas] pods from one replication controller to another, in batches bounded by two budgets:
+
+      - max_surge: how many pods above [replicas] may exist at once;
+      - max_unavailable: how many pods below [replicas] may be unready at once.
+
+    Each step scales the new RC up as far as the surge budget allows, then scales the old RC down as far as the
+    ready pods allow, unready old pods first. When neither can move, it waits for the new pods to be ready:
+    readiness is watched for, so steps follow each other as soon as the pods are up, never after a fixed sleep.
+
+    After each step, a checkpoint (phase, step counter, replica counts and budgets) is written to an annotation
+    on the new RC, which lives as long as the rollout does. A rollout restarted from that checkpoint carries on
+    from the replica counts the RCs already have, so completed scale operations are never sent again, and
+    a finished one (phase 'complete') is not touched at all.
+
+    """
+
+    def __init__(self, current_rc=None, next_rc=None, replicas=None, max_surge=DEFAULT_MAX_SURGE,
+                 max_unavailable=DEFAULT_MAX_UNAVAILABLE, step_timeout=None, wait_seconds=0, callback=None,
+                 checkpoint=None, persist=True):
+        """
+        :param current_rc: The K8sReplicationController to scale down to 0.
+        :param next_rc: The K8sReplicationController to scale up to [replicas].
+        :param replicas: The number of pods to end with.
+        :param max_surge: A number of pods, or a percentage of [replicas] such as '25%', rounded up.
+        :param max_unavailable: A number of pods, or a percentage of [replicas] such as '25%', rounded down.
+        :param step_timeout: Raise a TimeoutException if pods aren't ready after this many seconds.
+        :param wait_seconds: An extra pause after each step, once its pods are ready.
+        :param callback: Called as callback(step) after each step, with the step's metrics dict.
+        :param checkpoint: A checkpoint from load_checkpoint(), to resume a rollout from.
+        :param persist: Set to False to not write checkpoints.
+        """
+
+        for rc in [current_rc, next_rc]:
+            if not isinstance(rc, K8sObject) or rc.obj_type != 'ReplicationController':
+                raise SyntaxError('K8sRollout: rc: [ {0} ] must be a K8sReplicationController.'.format(rc))
+        if not isinstance(replicas, int) or replicas < 0:
+            raise SyntaxError('K8sRollout: replicas: [ {0} ] must be a positive integer.'.format(replicas))
+        if callback is not None and not callable(callback):
+            raise SyntaxError('K8sRollout: callback: [ {0} ] must be callable.'.format(callback))
+        if checkpoint is not None and not isinstance(checkpoint, dict):
+            raise SyntaxError('K8sRollout: checkpoint: [ {0} ] must be a dict.'.format(checkpoint))
+
+        surge = self._resolve('max_surge', max_surge, replicas, math.ceil)
+        unavailable = self._resolve('max_unavailable', max_unavailable, replicas, math.floor)
+        if surge == 0 and unavailable == 0:
+            if max_surge == 0 and max_unavailable == 0:
+                raise SyntaxError('K8sRollout: max_surge and max_unavailable cannot both be 0.')
+            # percentages of a small [replicas] can both round down to 0; allow one pod of progress.
+            unavailable = 1
+
+        self.current_rc = current_rc
+        self.next_rc = next_rc
+        self.replicas = replicas
+        self.max_surge = surge
+        self.max_unavailable = unavailable
+        self.step_timeout = step_timeout
+        self.wait_seconds = wait_seconds
+        self.callback = callback
+        self.persist = persist
+
+        self.phase = 'rollout' if checkpoint is None else checkpoint.get('phase', 'rollout')
+        self.first_step = 1 if checkpoint is None else checkpoint.get('step', 0) + 1
+        self.steps = list()
+        self.started = None
+        self.elapsed = None
+
+    @staticmethod
+    def _resolve(label, value, replicas, rounding):
+        if isinstance(value, basestring) and value.endswith('%') and value[:-1].isdigit():
+            return int(rounding(int(value[:-1]) * replicas / 100.0))
+        if isinstance(value, int) and value >= 0:
+            return value
+        raise SyntaxError('K8sRollout: {0}: [ {1} ] must be a positive integer or a percentage.'.format(label, value))
+
+    # ------------------------------------------------------------------------------------- observation
+
+    @staticmethod
+    def _selector(rc):
+        return ','.join('{0}={1}'.format(k, v) for k, v in sorted(rc.get_selector().items()))
+
+    def _count_ready(self, rc):
+        pods = K8sPod(config=rc.config, name=rc.name).get_list(data=dict(labelSelector=self._selector(rc)))
+        return len([pod for pod in pods.get('items', None) or list() if K8sPod.is_pod_ready(pod)])
+
+    def _wait_ready(self, rc, replicas):
+        K8sReplicaWaiter(config=rc.config, labels=rc.get_selector(), replicas=replicas,
+                         timeout=self.step_timeout).wait()
+
+    # ------------------------------------------------------------------------------------- checkpoints
+
+    def get_checkpoint(self):
+        return dict(
+            phase=self.phase,
+            step=self.first_step + len(self.steps) - 1,
+            replicas=self.replicas,
+            max_surge=self.max_surge,
+            max_unavailable=self.max_unavailable,
+            old_replicas=self.current_rc.get_replicas(),
+            new_replicas=self.next_rc.get_replicas()
+        )
+
+    def save_checkpoint(self):
+        if self.persist:
+            checkpoint = self.next_rc.config.json_codec.dumps(self.get_checkpoint())
+            self.next_rc.patch_annotations(annotations={CHECKPOINT_ANNOTATION: checkpoint})
+        return self
+
+    @staticmethod
+    def load_checkpoint(rc=None):
+        """
+        :return: The checkpoint saved on [rc], or None if it has none.
+        """
+        value = rc.get_annotation(k=CHECKPOINT_ANNOTATION)
+        if not value:
+            return None
+        try:
+            checkpoint = rc.config.json_codec.loads(value)
+        except ValueError:
+            return None
+        return checkpoint if isinstance(checkpoint, dict) else None
+
+    # ------------------------------------------------------------------------------------- rollout
+
+    def is_done(self):
+        return self.next_rc.get_replicas() >= self.replicas and self.current_rc.get_replicas() <= 0
+
+    def _scale(self):
+        """
+        Sends this step's scale operations.
+
+        :return: (started, step): the step's metrics so far. step['waited'] is True when nothing could move,
+                 and the new pods must be ready before the step is recorded with _end_step().
+        """
+
+        old = self.current_rc.get_replicas()
+        new = self.next_rc.get_replicas()
+        started = time.time()
+
+        increment = min(self.replicas - new, self.replicas + self.max_surge - (old + new))
+        if increment > 0:
+            new += increment
+            self.next_rc.set_scale(replicas=new)
+
+        new_ready = min(self._count_ready(self.next_rc), new)
+        old_ready = min(self._count_ready(self.current_rc), old) if old > 0 else 0
+        min_available = self.replicas - self.max_unavailable
+        decrement = min(old, (old - old_ready) + max(0, old_ready + new_ready - min_available))
+        if decrement > 0:
+            old -= decrement
+            self.current_rc.set_scale(replicas=old)
+
+        waited = increment <= 0 and decrement <= 0
+        step = dict(
+            step=self.first_step + len(self.steps),
+            old_replicas=old,
+            new_replicas=new,
+            new_ready=new if waited else new_ready,
+            scaled_up=max(increment, 0),
+            scaled_down=max(decrement, 0),
+            waited=waited
+        )
+        return started, step
+
+    def _end_step(self, started, step):
+        step['elapsed'] = time.time() - started
+        self.steps.append(step)
+        self.save_checkpoint()
+        if self.callback is not None:
+            self.callback(step)
+        return step
+
+    def _step(self):
+        started, step = self._scale()
+        if step['waited']:
+            self._wait_ready(self.next_rc, step['new_replicas'])
+            if self.wait_seconds:
+                time.sleep(self.wait_seconds)
+        return self._end_step(started, step)
+
+    def run(self):
+        self.started = time.time()
+        if self.phase != 'complete':
+            while not self.is_done():
+                self._step()
+            self._wait_ready(self.next_rc, self.replicas)
+            self._wait_ready(self.current_rc, 0)
+            self.phase = 'complete'
+            self.save_checkpoint()
+        self.elapsed = time.time() - self.started
+        return self
+
+    # ------------------------------------------------------------------------------------- metrics
+
+    def get_stats(self):
+        elapsed = self.elapsed if self.elapsed is not None else (time.time() - self.started if self.started else 0)
+        durations = [step['elapsed'] for step in self.steps]
+        return dict(
+            replicas=self.replicas,
+            max_surge=self.max_surge,
+            max_unavailable=self.max_unavailable,
+            steps=len(self.steps),
+            waits=len([step for step in self.steps if step['waited']]),
+            elapsed=elapsed,
+            mean_step=sum(durations) / len(durations) if durations else None,
+            max_step=max(durations) if durations else None,
+            pods_ready_per_second=self.replicas / elapsed if elapsed > 0 else None
+        )
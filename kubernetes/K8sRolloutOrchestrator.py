@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import threading
+import time
+from kubernetes.K8sConfig import K8sConfig
+from kubernetes.K8sBulk import K8sBulk
+from kubernetes.K8sReplicationController import K8sReplicationController
+from kubernetes.K8sRollout import DEFAULT_MAX_SURGE, DEFAULT_MAX_UNAVAILABLE
+from kubernetes.utils.Future import Future
+from kubernetes.utils.WorkerPool import WorkerPool
+
+DEFAULT_CONCURRENCY = 5
+
+
+class K8sRolloutOrchestrator(object):
+    """
+    Runs the rolling updates of many replication controllers, [concurrency] at a time.
+
+    Each target is a (name, image) or (name, image, container_name) tuple. A failed rollout is recorded against
+    its RC and doesn't stop the others, except those depending on it: [dependencies] maps an RC name to the
+    names that must be rolled out successfully first (e.g. {'frontend': ['backend']}); if one of them fails,
+    the dependent rollout is skipped.
+
+    get_stats() can be called from any thread while run() is going, for a live summary.
+
+    """
+
+    def __init__(self, config=None, targets=None, concurrency=DEFAULT_CONCURRENCY, dependencies=None,
+                 max_surge=DEFAULT_MAX_SURGE, max_unavailable=DEFAULT_MAX_UNAVAILABLE, timeout=None, callback=None):
+        """
+        :param config: The K8sConfig to use.
+        :param targets: A list of (name, image) or (name, image, container_name) tuples.
+        :param concurrency: The number of rollouts running at the same time.
+        :param dependencies: A dict of RC name to the list of RC names to roll out before it.
+        :param max_surge: Passed to each rolling_update().
+        :param max_unavailable: Passed to each rolling_update().
+        :param timeout: Passed to each rolling_update(), as the time allowed per step.
+        :param callback: Called as callback(result) as each rollout finishes, fails or is skipped.
+        """
+
+        if config is not None and not isinstance(config, K8sConfig):
+            raise SyntaxError('K8sRolloutOrchestrator: config: [ {0} ] must be a K8sConfig.'.format(config))
+        if targets is None or not isinstance(targets, list):
+            raise SyntaxError('K8sRolloutOrchestrator: targets: [ {0} ] must be a list.'.format(targets))
+        for target in targets:
+            if not isinstance(target, tuple) or len(target) not in [2, 3] or not isinstance(target[0], str):
+                raise SyntaxError('K8sRolloutOrchestrator: target: [ {0} ] must be a (name, image) tuple.'
+                                  .format(target))
+        names = [target[0] for target in targets]
+        if len(set(names)) != len(names):
+            raise SyntaxError('K8sRolloutOrchestrator: targets: [ {0} ] must have distinct names.'.format(names))
+        if not isinstance(concurrency, int) or concurrency < 1:
+            raise SyntaxError('K8sRolloutOrchestrator: concurrency: [ {0} ] must be a positive integer.'
+                              .format(concurrency))
+        if callback is not None and not callable(callback):
+            raise SyntaxError('K8sRolloutOrchestrator: callback: [ {0} ] must be callable.'.format(callback))
+
+        dependencies = dict() if dependencies is None else dependencies
+        if not isinstance(dependencies, dict):
+            raise SyntaxError('K8sRolloutOrchestrator: dependencies: [ {0} ] must be a dict.'.format(dependencies))
+        for name, required in dependencies.items():
+            for other in [name] + list(required):
+                if other not in names:
+                    raise SyntaxError('K8sRolloutOrchestrator: dependency: [ {0} ] is not a target.'.format(other))
+        self._check_cycles(names, dependencies)
+
+        self.config = config if config is not None else K8sConfig()
+        self.targets = targets
+        self.concurrency = concurrency
+        self.dependencies = dependencies
+        self.max_surge = max_surge
+        self.max_unavailable = max_unavailable
+        self.timeout = timeout
+        self.callback = callback
+
+        self.results = list()
+        self._results = dict()
+        self._running = set()
+        self._lock = threading.Lock()
+        self.started = None
+        self.elapsed = None
+
+    @staticmethod
+    def _check_cycles(names, dependencies):
+        visited = dict()
+
+        def visit(name, path):
+            if visited.get(name) == 'done':
+                return
+            if visited.get(name) == 'visiting':
+                cycle = ' -> '.join(path + [name])
+                raise SyntaxError('K8sRolloutOrchestrator: dependencies: [ {0} ] is a cycle.'.format(cycle))
+            visited[name] = 'visiting'
+            for other in dependencies.get(name, list()):
+                visit(other, path + [name])
+            visited[name] = 'done'
+
+        for name in names:
+            visit(name, list())
+
+    # ------------------------------------------------------------------------------------- run
+
+    def _run_one(self, target):
+        name, image = target[0], target[1]
+        container_name = target[2] if len(target) > 2 else None
+        result = dict(name=name, image=image, success=False, skipped=False, error=None, steps=0,
+                      started=time.time(), latency=None)
+        with self._lock:
+            self._running.add(name)
+        try:
+            K8sReplicationController.rolling_update(
+                config=self.config,
+                name=name,
+                image=image,
+                container_name=container_name,
+                max_surge=self.max_surge,
+                max_unavailable=self.max_unavailable,
+                timeout=self.timeout,
+                callback=lambda step: result.update(steps=result['steps'] + 1)
+            )
+            result['success'] = True
+        except Exception as err:
+            result['error'] = err
+        result['latency'] = time.time() - result['started']
+        return result
+
+    def _finish(self, result, pool, targets, dependents, remaining, finished):
+        with self._lock:
+            self._running.discard(result['name'])
+            self._results[result['name']] = result
+            done = len(self._results) == len(targets)
+        if self.callback is not None:
+            try:
+                self.callback(result)
+            except Exception:
+                pass
+
+        for dependent in dependents.get(result['name'], list()):
+            with self._lock:
+                # a dependent is skipped once, on its first failed dependency; -1 marks it as skipped.
+                skip = not result['success'] and remaining[dependent] >= 0
+                start = result['success'] and remaining[dependent] == 1
+                if skip:
+                    remaining[dependent] = -1
+                elif result['success'] and remaining[dependent] > 0:
+                    remaining[dependent] -= 1
+            if skip:
+                message = 'K8sRolloutOrchestrator: skipped, [ {0} ] was not rolled out.'.format(result['name'])
+                skipped = dict(name=dependent, image=targets[dependent][1], success=False, skipped=True,
+                               error=Exception(message), steps=0, started=None, latency=None)
+                self._finish(skipped, pool, targets, dependents, remaining, finished)
+            elif start:
+                self._submit(targets[dependent], pool, targets, dependents, remaining, finished)
+
+        if done:
+            finished.set_result(True)
+
+    def _submit(self, target, pool, targets, dependents, remaining, finished):
+        future = pool.submit(self._run_one, target)
+        future.add_done_callback(lambda f: self._finish(f.result(), pool, targets, dependents, remaining, finished))
+
+    def run(self):
+        targets = dict((target[0], target) for target in self.targets)
+        dependents = dict()
+        for name, required in self.dependencies.items():
+            for other in set(required):
+                dependents.setdefault(other, list()).append(name)
+        remaining = dict((name, len(set(self.dependencies.get(name, list())))) for name in targets)
+        finished = Future()
+
+        self._results = dict()
+        self.started = time.time()
+        pool = WorkerPool(workers=min(self.concurrency, max(len(self.targets), 1)))
+        try:
+            if not self.targets:
+                finished.set_result(True)
+            for target in self.targets:
+                if remaining[target[0]] == 0:
+                    self._submit(target, pool, targets, dependents, remaining, finished)
+            finished.result()
+        finally:
+            pool.close()
+        self.elapsed = time.time() - self.started
+        self.results = [self._results[target[0]] for target in self.targets]
+        return self
+
+    # ------------------------------------------------------------------------------------- results
+
+    def get_failures(self):
+        return [result for result in self.results if not result['success']]
+
+    def get_stats(self):
+        with self._lock:
+            results = self._results.values()
+            running = len(self._running)
+        latencies = sorted(result['latency'] for result in results if result['latency'] is not None)
+        succeeded = len([result for result in results if result['success']])
+        skipped = len([result for result in results if result['skipped']])
+        elapsed = (self.elapsed if self.elapsed is not None else time.time() - self.started) if self.started else 0
+        return dict(
+            total=len(self.targets),
+            running=running,
+            pending=len(self.targets) - len(results) - running,
+            succeeded=succeeded,
+            failed=len(results) - succeeded - skipped,
+            skipped=skipped,
+            elapsed=elapsed,
+            throughput=len(results) / elapsed if elapsed > 0 else None,
+            p50=K8sBulk._percentile(latencies, 50),
+            p90=K8sBulk._percentile(latencies, 90),
+            max=latencies[-1] if latencies else None
+        )
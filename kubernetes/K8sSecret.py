@@ -29,7 +29,7 @@ class K8sSecret(K8sObject):
     # ------------------------------------------------------------------------------------- get
 
     def get(self):
-        self.model = Secret(model=self.get_model())
+        self.model = Secret(model=self.get_model()).snapshot()
         return self
 
     # ------------------------------------------------------------------------------------- set
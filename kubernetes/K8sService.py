@@ -6,6 +6,7 @@
 # file 'LICENSE.md', which is part of this source code package.
 #
 
+from kubernetes.K8sConfig import K8sConfig
 from kubernetes.K8sObject import K8sObject
 from kubernetes.models.v1.Service import Service
 from kubernetes.K8sExceptions import NotFoundException
@@ -58,7 +59,7 @@ class K8sService(K8sObject):
     # ------------------------------------------------------------------------------------- get
 
     def get(self):
-        self.model = Service(model=self.get_model())
+        self.model = Service(model=self.get_model()).snapshot()
         return self
 
     def get_annotation(self, k=None):
@@ -146,17 +147,25 @@ class K8sService(K8sObject):
     # ------------------------------------------------------------------------------------- filter
 
     @staticmethod
-    def get_by_name(config=None, name=None):
+    def get_by_name(config=None, name=None, refetch=False):
         try:
+            if config is None:
+                config = K8sConfig()
             service_list = list()
             data = dict(labelSelector="name={svc_name}".format(svc_name=name))
             services = K8sService(config=config, name=name).get_with_params(data=data)
             for svc in services:
-                try:
-                    service_name = Service(model=svc).get_name()
-                    service_list.append(K8sService(config=config, name=service_name).get())
-                except NotFoundException:
-                    pass
+                model = Service(model=svc)
+                if refetch:
+                    try:
+                        service_list.append(K8sService(config=config, name=model.get_name()).get())
+                    except NotFoundException:
+                        pass
+                else:
+                    # the list response already holds the full object; no need for a GET per item.
+                    k8s_svc = K8sService(config=config, name=model.get_name())
+                    k8s_svc.model = model
+                    service_list.append(k8s_svc)
         except Exception as e:
             message = "Got an exception of type {my_type} with message {my_msg}"\
                 .format(my_type=type(e), my_msg=e.message)
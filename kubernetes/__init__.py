@@ -1,10 +1,22 @@
 from K8sConfig import K8sConfig
 from K8sContainer import K8sContainer
+from K8sInformer import K8sInformer
 from K8sObject import K8sObject
 from K8sPod import K8sPod
 from K8sPodBasedObject import K8sPodBasedObject
+from K8sReplicaWaiter import K8sReplicaWaiter
 from K8sReplicationController import K8sReplicationController
+from K8sRollout import K8sRollout
 from K8sSecret import K8sSecret
 from K8sService import K8sService
+from AsyncK8sObject import AsyncK8sObject
+from AsyncK8sPod import AsyncK8sPod
+from AsyncK8sReplicationController import AsyncK8sReplicationController
+from AsyncK8sSecret import AsyncK8sSecret
+from AsyncK8sService import AsyncK8sService
+from K8sBulk import K8sBulk
+from K8sRolloutOrchestrator import K8sRolloutOrchestrator
 
-__all__ = ['K8sConfig', 'K8sContainer', 'K8sPod', 'K8sReplicationController', 'K8sSecret', 'K8sService']
+__all__ = ['AsyncK8sObject', 'AsyncK8sPod', 'AsyncK8sReplicationController', 'AsyncK8sSecret', 'AsyncK8sService',
+           'K8sBulk', 'K8sConfig', 'K8sContainer', 'K8sInformer', 'K8sPod', 'K8sReplicaWaiter',
+           'K8sReplicationController', 'K8sRollout', 'K8sRolloutOrchestrator', 'K8sSecret', 'K8sService']
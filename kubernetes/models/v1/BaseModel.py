@@ -1,11 +1,152 @@
+import functools
+import weakref
+from kubernetes.utils.ModelCopy import copy_model
+from kubernetes.utils.ModelDiff import merge_diff, json_diff
+
+MUTATOR_PREFIXES = ('set_', 'add_', 'del_')
+
+
+def _mutator(func):
+    @functools.wraps(func)
+    def mutate(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            # a model that was never encoded nor adopted, e.g. an ObjectMeta dropping server fields while it
+            # is built, has no cache to drop.
+            if self._serialized is not None or self._parents:
+                self._touch()
+    return mutate
+
+
+class ModelType(type):
+    """
+    Drops the serialization cache of a model, and of the models holding it, whenever one of its mutators
+    (set_*, add_*, del_*) runs.
+    """
+
+    def __new__(mcs, name, bases, attrs):
+        for attr, value in attrs.items():
+            if attr.startswith(MUTATOR_PREFIXES) and callable(value):
+                attrs[attr] = _mutator(value)
+        return type.__new__(mcs, name, bases, attrs)
+
+
 class BaseModel(object):
+    __metaclass__ = ModelType
+
+    _snapshot = None
+    _serialized = None
+    _cache_hits = 0
+    _cache_misses = 0
+    # weak references to the models holding this one, e.g. a Container's PodSpec; they never keep it alive.
+    _parents = ()
 
     def __init__(self):
         self.model = dict()
 
+    def _adopt(self, child):
+        """
+        Records that this model holds [child], so that the child's mutators drop this model's cache too.
+        Every child model is adopted by the model it is assigned to.
+        """
+        parent = weakref.ref(self)
+        if parent not in child._parents:
+            child._parents += (parent,)
+        return child
+
+    def _touch(self):
+        if self._serialized is not None:
+            self._serialized = None
+        for parent in self._parents:
+            parent = parent()
+            if parent is not None:
+                parent._touch()
+
+    def __getstate__(self):
+        # the cache and the parents belong to this instance: a copy or a pickle starts without them.
+        state = self.__dict__.copy()
+        state.pop('_serialized', None)
+        state.pop('_parents', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for value in state.values():
+            children = value.values() if isinstance(value, dict) else value if isinstance(value, list) else [value]
+            for child in children:
+                if isinstance(child, BaseModel):
+                    self._adopt(child)
+
     def _update_model(self):
         return self
 
     def get(self):
         self._update_model()
         return self.model
+
+    def _wrap(self, model):
+        return self.__class__(model=model)
+
+    def clone(self):
+        """
+        :return: A new model of the same class over a copy of this one's dict. Strings and numbers are shared
+                 rather than copied, and so is the snapshot, which is only ever replaced, never mutated.
+        """
+        clone = self._wrap(copy_model(self.get()))
+        clone._snapshot = self._snapshot
+        return clone
+
+    # ------------------------------------------------------------------------------------- serialization
+
+    def serialize(self, codec=None):
+        """
+        Encodes the model with [codec], caching the result until a mutator of the model or of one of its
+        children runs.
+
+        A dict returned by a getter and changed in place leaves the cached bytes as they were.
+
+        :return: The encoded model.
+        """
+
+        cached = self._serialized
+        if cached is not None and cached[0] is codec:
+            self._cache_hits += 1
+            return cached[1]
+        self._cache_misses += 1
+        data = codec.dumps(self.get())
+        self._serialized = (codec, data)
+        return data
+
+    def get_cache_stats(self):
+        return dict(hits=self._cache_hits, misses=self._cache_misses)
+
+    # ------------------------------------------------------------------------------------- change tracking
+
+    def snapshot(self):
+        """
+        Records the current state as the server's, for is_dirty() and diff() to compare against.
+
+        It is a full copy, so only the objects that may be updated take one: K8sObject's get(), create(), update()
+        and patch(). Models from list, watch and informer helpers have none, and update() PUTs them whole.
+        """
+        self._snapshot = copy_model(self.get())
+        return self
+
+    def is_dirty(self):
+        """
+        :return: True if the model changed since the last snapshot, or was never snapshotted.
+        """
+        return self._snapshot is None or self.get() != self._snapshot
+
+    def diff(self, patch_type='merge'):
+        """
+        :param patch_type: 'merge' for an RFC 7386 merge patch, 'json' for an RFC 6902 list of operations.
+        :return: The changes since the last snapshot (since an empty model, if there is none).
+        """
+        before = self._snapshot if self._snapshot is not None else dict()
+        if patch_type == 'merge':
+            return merge_diff(before, self.get())
+        if patch_type == 'json':
+            return json_diff(before, self.get())
+        raise SyntaxError('BaseModel: patch_type: [ {0} ] must be in: [ json, merge ]'.format(patch_type))
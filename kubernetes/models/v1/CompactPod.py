@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+"""
+Read-only pod models for list-heavy workloads, with the getters of Pod, PodSpec, ObjectMeta, Container, Probe,
+PodStatus and ContainerStatus.
+
+Each instance is a single __slots__ reference to the raw dict; there is no per-instance __dict__, no snapshot,
+and children are wrapped on demand, when a getter needs them, rather than kept. The dict is never mutated:
+unlike ObjectMeta, server-generated fields such as uid and resourceVersion are kept, and it can be shared
+with an informer's store instead of being copied.
+"""
+
+
+class CompactModel(object):
+    __slots__ = ('model',)
+
+    def __init__(self, model=None):
+        if not isinstance(model, dict):
+            raise SyntaxError('{0}: model: [ {1} ] must be a dict.'.format(self.__class__.__name__, model))
+        self.model = model
+
+    def get(self):
+        return self.model
+
+
+class CompactObjectMeta(CompactModel):
+    __slots__ = ()
+
+    def get_annotation(self, k=None):
+        if k is None:
+            raise SyntaxError('ObjectMeta: k: [ {0} ] cannot be None.'.format(k))
+        if not isinstance(k, str):
+            raise SyntaxError('ObjectMeta: k: [ {0} ] must be a string.'.format(k.__class__.__name__))
+        return (self.model.get('annotations', None) or dict()).get(k, None)
+
+    def get_annotations(self):
+        return self.model.get('annotations', None)
+
+    def get_creation_timestamp(self):
+        return self.model.get('creationTimestamp', None)
+
+    def get_deletion_timestamp(self):
+        return self.model.get('deletionTimestamp', None)
+
+    def get_deletion_grace_period_seconds(self):
+        return self.model.get('deletionGracePeriodSeconds', None)
+
+    def get_generate_name(self):
+        return self.model.get('generateName', None)
+
+    def get_generation(self):
+        return self.model.get('generation', None)
+
+    def get_label(self, k=None):
+        if k is None:
+            raise SyntaxError('ObjectMeta: k: [ {0} ] cannot be None.'.format(k))
+        if not isinstance(k, str):
+            raise SyntaxError('ObjectMeta: k: [ {0} ] must be a string.'.format(k.__class__.__name__))
+        return (self.model.get('labels', None) or dict()).get(k, None)
+
+    def get_labels(self):
+        return self.model.get('labels', None)
+
+    def get_name(self):
+        return self.model['name']
+
+    def get_namespace(self):
+        return self.model['namespace']
+
+    def get_resource_version(self):
+        return self.model.get('resourceVersion', None)
+
+    def get_status(self):
+        return self.model.get('status', None)
+
+    def get_self_link(self):
+        return self.model.get('selfLink', None)
+
+    def get_uid(self):
+        return self.model.get('uid', None)
+
+
+class CompactProbe(CompactModel):
+    __slots__ = ()
+
+    VALID_HANDLERS = ['exec', 'httpGet', 'tcpSocket']
+
+    def get_handler(self):
+        for handler in self.VALID_HANDLERS:
+            if handler in self.model:
+                return self.model[handler]
+        return None
+
+    def get_failure_threshold(self):
+        return self.model['failureThreshold']
+
+    def get_initial_delay(self):
+        return self.model['initialDelaySeconds']
+
+    def get_period(self):
+        return self.model['periodSeconds']
+
+    def get_success_threshold(self):
+        return self.model['successThreshold']
+
+    def get_timeout(self):
+        return self.model['timeoutSeconds']
+
+
+class CompactContainer(CompactModel):
+    __slots__ = ()
+
+    def get_liveness_probe(self):
+        probe = self.model.get('livenessProbe', None)
+        return CompactProbe(model=probe) if probe is not None else None
+
+    def get_name(self):
+        return self.model['name']
+
+    def get_image(self):
+        return self.model['image']
+
+    def get_readiness_probe(self):
+        probe = self.model.get('readinessProbe', None)
+        return CompactProbe(model=probe) if probe is not None else None
+
+
+class CompactPodSpec(CompactModel):
+    __slots__ = ()
+
+    def get_containers(self):
+        return [CompactContainer(model=c) for c in self.model.get('containers', None) or list()]
+
+    def get_node_name(self):
+        return self.model.get('nodeName', None)
+
+    def get_node_selector(self):
+        return self.model.get('nodeSelector', None)
+
+    def get_restart_policy(self):
+        return self.model.get('restartPolicy', None)
+
+    def get_service_account(self):
+        return self.model.get('serviceAccountName', None)
+
+    def get_termination_grace_period(self):
+        return self.model.get('terminationGracePeriodSeconds', None)
+
+
+class CompactContainerStatus(CompactModel):
+    __slots__ = ()
+
+    def get_name(self):
+        return self.model.get('name', '')
+
+    def get_state(self):
+        return self.model.get('state', dict())
+
+    def get_last_state(self):
+        return self.model.get('lastState', dict())
+
+    def get_restart_count(self):
+        return self.model.get('restartCount', -1)
+
+    def get_image(self):
+        return self.model.get('image', None)
+
+    def get_image_id(self):
+        return self.model.get('imageID', None)
+
+    def get_container_id(self):
+        return self.model.get('containerID', None)
+
+    def is_ready(self):
+        return self.model.get('ready', False)
+
+
+class CompactPodStatus(CompactModel):
+    __slots__ = ()
+
+    def get_pod_phase(self):
+        return self.model.get('phase', None)
+
+    def get_pod_conditions(self):
+        return self.model.get('conditions', list())
+
+    def get_message(self):
+        return self.model.get('message', '')
+
+    def get_reason(self):
+        return self.model.get('reason', '')
+
+    def get_host_ip(self):
+        return self.model.get('hostIP', None)
+
+    def get_pod_ip(self):
+        return self.model.get('podIP', None)
+
+    def get_start_time(self):
+        return self.model.get('startTime', None)
+
+    def get_container_statuses(self):
+        return [CompactContainerStatus(model=s) for s in self.model.get('containerStatuses', list())]
+
+
+class CompactPod(CompactModel):
+    __slots__ = ()
+
+    # ------------------------------------------------------------------------------------- children
+
+    @property
+    def pod_metadata(self):
+        return CompactObjectMeta(model=self.model['metadata'])
+
+    @property
+    def pod_spec(self):
+        return CompactPodSpec(model=self.model['spec'])
+
+    @property
+    def pod_status(self):
+        status = self.model.get('status', None)
+        return CompactPodStatus(model=status) if status is not None else None
+
+    # ------------------------------------------------------------------------------------- get
+
+    def get_pod_annotation(self, k):
+        return self.pod_metadata.get_annotation(k=k)
+
+    def get_pod_annotations(self):
+        return self.pod_metadata.get_annotations()
+
+    def get_pod_containers(self):
+        return list(self.model['spec'].get('containers', None) or list())
+
+    def get_pod_label(self, k):
+        return self.pod_metadata.get_label(k=k)
+
+    def get_pod_labels(self):
+        return self.pod_metadata.get_labels()
+
+    def get_pod_name(self):
+        return self.pod_metadata.get_name()
+
+    def get_pod_namespace(self):
+        return self.pod_metadata.get_namespace()
+
+    def get_pod_node_name(self):
+        return self.pod_spec.get_node_name()
+
+    def get_pod_node_selector(self):
+        return self.pod_spec.get_node_selector()
+
+    def get_pod_restart_policy(self):
+        return self.pod_spec.get_restart_policy()
+
+    def get_pod_status(self):
+        return self.pod_status
+
+    def get_service_account(self):
+        return self.pod_spec.get_service_account()
+
+    def get_termination_grace_period(self):
+        return self.pod_spec.get_termination_grace_period()
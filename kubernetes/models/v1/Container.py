@@ -17,17 +17,11 @@ class Container(BaseModel):
         self.liveness_probe = None
         if model is not None:
             assert isinstance(model, dict)
-            self.model = model
-            if 'status' in self.model.keys():
-                self.model.pop('status', None)
+            self.model = Container.normalize(model=model)
             if 'livenessProbe' in self.model.keys():
-                self.liveness_probe = Probe(model=self.model['livenessProbe'])
+                self.liveness_probe = self._adopt(Probe(model=self.model['livenessProbe']))
             if 'readinessProbe' in self.model.keys():
-                self.readiness_probe = Probe(model=self.model['readinessProbe'])
-            if 'privileged' not in self.model.keys():
-                self.model['privileged'] = False
-            if 'hostNetwork' not in self.model.keys():
-                self.model['hostNetwork'] = False
+                self.readiness_probe = self._adopt(Probe(model=self.model['readinessProbe']))
         else:
             if name is None or image is None:
                 raise SyntaxError("name: [ {0} ] and image: [ {1} ] cannot be None.".format(name, image))
@@ -46,6 +40,18 @@ class Container(BaseModel):
                 }
             }
 
+    @staticmethod
+    def normalize(model=None):
+        """
+        Adds the defaults a Container adds to the [model] it is given, without building one.
+        """
+        model.pop('status', None)
+        if 'privileged' not in model:
+            model['privileged'] = False
+        if 'hostNetwork' not in model:
+            model['hostNetwork'] = False
+        return model
+
     def _update_model(self):
         if self.liveness_probe is not None:
             self.model['livenessProbe'] = self.liveness_probe.get()
@@ -142,7 +148,8 @@ class Container(BaseModel):
         return self
 
     def set_liveness_probe(self, **kwargs):
-        self.liveness_probe = Probe(**kwargs)
+        self.liveness_probe = self._adopt(Probe(**kwargs))
+        self.model['livenessProbe'] = self.liveness_probe.get()
         return self
 
     def set_name(self, name=None):
@@ -168,7 +175,8 @@ class Container(BaseModel):
         return self
 
     def set_readiness_probe(self, **kwargs):
-        self.readiness_probe = Probe(**kwargs)
+        self.readiness_probe = self._adopt(Probe(**kwargs))
+        self.model['readinessProbe'] = self.readiness_probe.get()
         return self
 
     def set_requested_resources(self, cpu='100m', mem='32M'):
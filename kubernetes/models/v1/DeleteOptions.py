@@ -12,6 +12,9 @@ class DeleteOptions(BaseModel):
                 raise SyntaxError('kind must be a string')
             self.model = dict(kind=kind, apiVersion='v1', gracePeriodSeconds=grace_period_seconds)
 
+    def _wrap(self, model):
+        return DeleteOptions(kind=model.get('kind', None), model=model)
+
     def set_grace_period_seconds(self, period=None):
         if period is None or not isinstance(period, int):
             raise SyntaxError('period must be a positive integer')
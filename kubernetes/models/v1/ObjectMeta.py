@@ -10,6 +10,10 @@ from kubernetes.models.v1.BaseModel import BaseModel
 
 
 class ObjectMeta(BaseModel):
+
+    SERVER_GENERATED_ATTRS = ['generation', 'resourceVersion', 'creationTimestamp', 'deletionTimestamp',
+                              'deletionGracePeriodSeconds', 'status', 'selfLink', 'uid']
+
     def __init__(self, name=None, namespace='default', model=None, del_server_attr=True):
         BaseModel.__init__(self)
         if model is not None:
@@ -19,6 +23,9 @@ class ObjectMeta(BaseModel):
         else:
             self.model = dict(name=name, namespace=namespace, labels=dict(name=name))
 
+    def _wrap(self, model):
+        return ObjectMeta(model=model, del_server_attr=False)
+
     # ------------------------------------------------------------------------------------- add
 
     def add_annotation(self, k=None, v=None):
@@ -121,14 +128,9 @@ class ObjectMeta(BaseModel):
         return self
 
     def del_server_generated_meta_attr(self):
-        self.del_generation()\
-            .del_resource_version()\
-            .del_creation_timestamp()\
-            .del_deletion_timestamp()\
-            .del_deletion_grace_period_seconds()\
-            .del_status()\
-            .del_self_link()\
-            .del_uid()
+        # popped here rather than through each del_*(): this runs for every ObjectMeta built from a server dict.
+        for key in self.SERVER_GENERATED_ATTRS:
+            self.model.pop(key, None)
         return self
 
     def del_uid(self):
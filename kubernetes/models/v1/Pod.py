@@ -6,6 +6,7 @@
 # file 'LICENSE.md', which is part of this source code package.
 #
 
+from kubernetes.models.v1.BaseModel import BaseModel
 from kubernetes.models.v1.ObjectMeta import ObjectMeta
 from kubernetes.models.v1.PodBasedModel import PodBasedModel
 from kubernetes.models.v1.PodSpec import PodSpec
@@ -14,26 +15,59 @@ from kubernetes.models.v1.PodStatus import PodStatus
 
 class Pod(PodBasedModel):
 
+    # attribute -> (model key, class) of the children wrapped on first access.
+    LAZY_CHILDREN = {
+        'pod_spec': ('spec', PodSpec),
+        'pod_status': ('status', PodStatus)
+    }
+
     def __init__(self, name=None, image=None, namespace='default', model=None):
-        PodBasedModel.__init__(self)
+        self._children = dict()
 
         if model is not None:
+            # no PodBasedModel.__init__(): its empty children would only be replaced.
+            BaseModel.__init__(self)
             self.model = model
-
-            if 'status' in self.model.keys():
-                self.pod_status = PodStatus(model=self.model['status'])
-
-            self.pod_spec = PodSpec(model=self.model['spec'])
-            self.pod_metadata = ObjectMeta(model=self.model['metadata'])
+            # the spec and status are wrapped on first access. The defaults a PodSpec adds to its dict
+            # are added now, so that get() returns the same dict whether it was wrapped or not.
+            PodSpec.normalize(model=self.model['spec'])
+            self.pod_metadata = self._adopt(ObjectMeta(model=self.model['metadata']))
 
         else:
+            PodBasedModel.__init__(self)
             if name is None or not isinstance(name, str):
                 raise SyntaxError('name should be a string.')
 
             self.model = dict(kind='Pod', apiVersion='v1')
 
             if name is not None:
-                self.pod_metadata = ObjectMeta(name=name, namespace=namespace)
+                self.pod_metadata = self._adopt(ObjectMeta(name=name, namespace=namespace))
                 self.pod_spec = PodSpec(name=name, image=image)
                 self.pod_spec.set_restart_policy('Always')
                 self._update_model()
+
+    # ------------------------------------------------------------------------------------- lazy children
+
+    def _get_child(self, attr):
+        if attr not in self._children:
+            key, cls = self.LAZY_CHILDREN[attr]
+            self._children[attr] = self._adopt(cls(model=self.model[key])) if key in self.model else None
+        return self._children[attr]
+
+    def _set_child(self, attr, child):
+        self._children[attr] = self._adopt(child) if child is not None else None
+        self._touch()
+
+    pod_spec = property(lambda self: self._get_child('pod_spec'),
+                        lambda self, child: self._set_child('pod_spec', child))
+    pod_status = property(lambda self: self._get_child('pod_status'),
+                          lambda self, child: self._set_child('pod_status', child))
+
+    def _update_model(self):
+        # a child that was never wrapped is still the model's own dict: there is nothing to copy back.
+        self.model['metadata'] = self.pod_metadata.get()
+        for attr, (key, cls) in self.LAZY_CHILDREN.items():
+            child = self._children.get(attr, None)
+            if child is not None:
+                self.model[key] = child.get()
+        return self
@@ -15,8 +15,8 @@ from kubernetes.models.v1.Container import Container
 class PodBasedModel(BaseModel):
     def __init__(self):
         BaseModel.__init__(self)
-        self.pod_spec = PodSpec()
-        self.pod_metadata = ObjectMeta()
+        self.pod_spec = self._adopt(PodSpec())
+        self.pod_metadata = self._adopt(ObjectMeta())
         self.pod_status = None
 
     def _update_model(self):
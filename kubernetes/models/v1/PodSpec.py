@@ -24,7 +24,7 @@ class PodSpec(BaseModel):
             self.model = model
 
             for c in self.model['containers']:
-                self.containers.append(Container(model=c))
+                self.containers.append(self._adopt(Container(model=c)))
 
             if 'volumes' not in self.model.keys():
                 self.model['volumes'] = []
@@ -40,7 +40,7 @@ class PodSpec(BaseModel):
                 raise SyntaxError('PodSpec: Name should be a string.')
 
             if image is not None and not isinstance(image, str):
-                self.containers.append(Container(name=name, image=image))
+                self.containers.append(self._adopt(Container(name=name, image=image)))
 
             if pull_secret is not None:
                 assert isinstance(pull_secret, str)
@@ -48,18 +48,30 @@ class PodSpec(BaseModel):
 
             self._update_model()
 
+    @staticmethod
+    def normalize(model=None):
+        """
+        Adds the defaults a PodSpec, and its Containers, add to the [model] it is given, without building them.
+        """
+        for c in model['containers']:
+            Container.normalize(model=c)
+        if 'volumes' not in model:
+            model['volumes'] = []
+        return model
+
     def _update_model(self):
-        self.model['containers'] = []
-        for c in self.containers:
-            assert isinstance(c, Container)
-            self.model['containers'].append(c.get())
+        # containers keep their own dicts up to date, and the list holds those same dicts:
+        # only a change in membership makes it stale.
+        if len(self.model['containers']) != len(self.containers):
+            self.model['containers'] = [c.get() for c in self.containers]
+        return self
 
     def add_container(self, container=None):
         if container is None or not isinstance(container, Container):
             raise SyntaxError('PodSpec: container should be a container object.')
         else:
-            self.containers.append(container)
-            self._update_model()
+            self.containers.append(self._adopt(container))
+            self.model['containers'].append(container.get())
         return self
 
     def add_host_volume(self, name=None, path=None):
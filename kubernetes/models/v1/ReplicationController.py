@@ -20,10 +20,10 @@ class ReplicationController(PodBasedModel):
             if 'status' in self.model:
                 self.model.pop('status', None)
             if 'metadata' in self.model:
-                self.rc_metadata = ObjectMeta(model=self.model['metadata'])
+                self.rc_metadata = self._adopt(ObjectMeta(model=self.model['metadata']))
             if 'template' in self.model['spec']:
-                self.pod_spec = PodSpec(model=self.model['spec']['template']['spec'])
-                self.pod_metadata = ObjectMeta(model=self.model['spec']['template']['metadata'])
+                self.pod_spec = self._adopt(PodSpec(model=self.model['spec']['template']['spec']))
+                self.pod_metadata = self._adopt(ObjectMeta(model=self.model['spec']['template']['metadata']))
         else:
             if name is None:
                 raise SyntaxError('ReplicationController: name: [ {0} ] cannot be None.'.format(name))
@@ -31,7 +31,7 @@ class ReplicationController(PodBasedModel):
                 raise SyntaxError('ReplicationController: name: [ {0} ] must be a string.'.format(name))
 
             self.model = dict(kind='ReplicationController', apiVersion='v1')
-            self.rc_metadata = ObjectMeta(name=name, namespace=namespace)
+            self.rc_metadata = self._adopt(ObjectMeta(name=name, namespace=namespace))
 
             self.model['spec'] = {
                 "replicas": replicas,
@@ -40,11 +40,11 @@ class ReplicationController(PodBasedModel):
 
             self.model['spec']['template'] = dict()
             if image is not None:
-                self.pod_spec = PodSpec(name=name, image=image)
+                self.pod_spec = self._adopt(PodSpec(name=name, image=image))
             else:
-                self.pod_spec = PodSpec(name=name)
+                self.pod_spec = self._adopt(PodSpec(name=name))
             self.pod_spec.set_restart_policy('Always')
-            self.pod_metadata = ObjectMeta(name=name, namespace=namespace)
+            self.pod_metadata = self._adopt(ObjectMeta(name=name, namespace=namespace))
             self._update_model()
 
     def _update_model(self):
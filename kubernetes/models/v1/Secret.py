@@ -27,17 +27,20 @@ class Secret(BaseModel):
             if 'status' in self.model:
                 self.model.pop('status', None)
             self.model = model
-            self.secret_metadata = ObjectMeta(model=self.model['metadata'])
+            self.secret_metadata = self._adopt(ObjectMeta(model=self.model['metadata']))
 
         else:
             self.model = dict(kind='Secret', apiVersion='v1')
-            self.secret_metadata = ObjectMeta(name=name, namespace=namespace)
+            self.secret_metadata = self._adopt(ObjectMeta(name=name, namespace=namespace))
             self._update_model()
 
     def _update_model(self):
         self.model['metadata'] = self.secret_metadata.get()
         return self
 
+    def _wrap(self, model):
+        return Secret(name=self.secret_metadata.get_name(), model=model)
+
     # ------------------------------------------------------------------------------------- add
 
     def add_annotation(self, k=None, v=None):
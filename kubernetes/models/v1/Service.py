@@ -21,11 +21,11 @@ class Service(BaseModel):
             self.model = model
             if 'status' in self.model:
                 self.model.pop('status', None)
-            self.svc_metadata = ObjectMeta(model=self.model['metadata'], del_server_attr=False)
+            self.svc_metadata = self._adopt(ObjectMeta(model=self.model['metadata'], del_server_attr=False))
 
         else:
             self.model = dict(kind='Service', apiVersion='v1')
-            self.svc_metadata = ObjectMeta(name=name, namespace=namespace)
+            self.svc_metadata = self._adopt(ObjectMeta(name=name, namespace=namespace))
             self.model['spec'] = dict(ports=[], selector=dict(), sessionAffinity=session_affinity, type='ClusterIP')
             if port_name is not None and port > 0 and target_port is not None:
                 self.add_port(port=port, target_port=target_port, name=port_name)
@@ -1,4 +1,6 @@
 from BaseModel import BaseModel
+from CompactPod import CompactContainer, CompactContainerStatus, CompactObjectMeta, CompactPod, CompactPodSpec, \
+    CompactPodStatus, CompactProbe
 from Container import Container
 from ContainerStatus import ContainerStatus
 from DeleteOptions import DeleteOptions
@@ -12,4 +14,6 @@ from ReplicationController import ReplicationController
 from Secret import Secret
 from Service import Service
 
-__all__ = ['Container', 'DeleteOptions', 'Pod', 'PodSpec', 'ReplicationController', 'Secret', 'Service']
+__all__ = ['CompactContainer', 'CompactContainerStatus', 'CompactObjectMeta', 'CompactPod', 'CompactPodSpec',
+           'CompactPodStatus', 'CompactProbe', 'Container', 'DeleteOptions', 'Pod', 'PodSpec', 'ReplicationController',
+           'Secret', 'Service']
@@ -1,4 +1,9 @@
 import collections
+import json
+
+MAX_CACHED_KEYS = 10000
+
+_keys = dict()
 
 
 def convert(data):
@@ -10,3 +15,66 @@ def convert(data):
         return type(data)(map(convert, data))
     else:
         return data
+
+
+def _convert_list(items):
+    # lists are not seen by object_pairs_hook; fix up their strings in place, without copying.
+    for i, v in enumerate(items):
+        if type(v) is unicode:
+            items[i] = v.encode('utf-8')
+        elif type(v) is list:
+            _convert_list(v)
+    return items
+
+
+def _convert_key(k):
+    # the same few keys repeat in every object; encode each once and share the result.
+    try:
+        return _keys[k]
+    except KeyError:
+        key = k.encode('utf-8')
+        if len(_keys) < MAX_CACHED_KEYS:
+            _keys[k] = key
+        return key
+
+
+def _convert_pairs(pairs):
+    obj = dict()
+    for k, v in pairs:
+        t = type(v)
+        if t is unicode:
+            v = v.encode('utf-8')
+        elif t is list:
+            _convert_list(v)
+        obj[_convert_key(k)] = v
+    return obj
+
+
+def make_decoder(module=json):
+    """
+    :param module: json, or a module with the same JSONDecoder, such as simplejson.
+    :return: A decoder for decode(), whose objects come out as convert() would make them.
+    """
+
+    return module.JSONDecoder(object_pairs_hook=_convert_pairs)
+
+
+_decoder = make_decoder()
+
+
+def decode(text, decoder=None):
+    """
+    Parses a JSON document straight into dicts, lists and (UTF-8 encoded) str, the same shapes convert()
+    produces, without walking and copying the whole document a second time.
+
+    :param text: The JSON document, as str or unicode.
+    :param decoder: A decoder from make_decoder(); the json one by default.
+    :return: The decoded document.
+    """
+
+    data = (decoder or _decoder).decode(text)
+    if type(data) is unicode:
+        return data.encode('utf-8')
+    elif type(data) is list:
+        return _convert_list(data)
+    return data
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import sys
+import threading
+from kubernetes.K8sExceptions import TimeoutException
+
+
+class Future(object):
+    """
+    The eventual result of an operation running elsewhere: a WorkerPool thread, or an informer event.
+
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._done = False
+        self._result = None
+        self._exc_info = None
+        self._callbacks = list()
+
+    def done(self):
+        return self._done
+
+    def _resolve(self, result=None, exc_info=None):
+        with self._condition:
+            if self._done:
+                return False
+            self._result = result
+            self._exc_info = exc_info
+            self._done = True
+            callbacks, self._callbacks = self._callbacks, list()
+            self._condition.notify_all()
+        for callback in callbacks:
+            callback(self)
+        return True
+
+    def set_result(self, result=None):
+        """
+        :return: False if the future was already resolved, in which case nothing changes.
+        """
+        return self._resolve(result=result)
+
+    def set_exception(self, exception=None, exc_info=None):
+        if exc_info is None:
+            exc_info = (type(exception), exception, None)
+        return self._resolve(exc_info=exc_info)
+
+    def add_done_callback(self, callback=None):
+        """
+        :param callback: Called as callback(future) once resolved; immediately if it already is.
+        """
+
+        if callback is None or not callable(callback):
+            raise SyntaxError('Future: callback: [ {0} ] must be callable.'.format(callback))
+        with self._condition:
+            if not self._done:
+                self._callbacks.append(callback)
+                return self
+        callback(self)
+        return self
+
+    def wait(self, timeout=None):
+        """
+        :return: True if the future is resolved, False if [timeout] seconds passed first.
+        """
+
+        with self._condition:
+            if not self._done:
+                self._condition.wait(timeout)
+            return self._done
+
+    def exception(self, timeout=None):
+        if not self.wait(timeout):
+            raise TimeoutException('Future: not done after [ {0} ] seconds.'.format(timeout))
+        return self._exc_info[1] if self._exc_info is not None else None
+
+    def result(self, timeout=None):
+        if not self.wait(timeout):
+            raise TimeoutException('Future: not done after [ {0} ] seconds.'.format(timeout))
+        if self._exc_info is not None:
+            raise self._exc_info[0], self._exc_info[1], self._exc_info[2]
+        return self._result
+
+    def _copy_to(self, other):
+        if self._exc_info is not None:
+            other.set_exception(exc_info=self._exc_info)
+        else:
+            other.set_result(self._result)
+
+    def chain(self, func=None):
+        """
+        :param func: Called as func(result) once this future succeeds. It may return another Future.
+        :return: A Future resolving to what func returns (or resolves to), or to the first exception raised.
+        """
+
+        if func is None or not callable(func):
+            raise SyntaxError('Future: func: [ {0} ] must be callable.'.format(func))
+        chained = Future()
+
+        def on_done(future):
+            if future._exc_info is not None:
+                chained.set_exception(exc_info=future._exc_info)
+                return
+            try:
+                result = func(future._result)
+            except Exception:
+                chained.set_exception(exc_info=sys.exc_info())
+                return
+            if isinstance(result, Future):
+                result.add_done_callback(lambda f: f._copy_to(chained))
+            else:
+                chained.set_result(result)
+
+        self.add_done_callback(on_done)
+        return chained
+
+    @staticmethod
+    def run(future, func, *args, **kwargs):
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception:
+            future.set_exception(exc_info=sys.exc_info())
+        return future
+
+    @staticmethod
+    def gather(futures=None):
+        """
+        :return: A Future resolving to the list of results once every future in [futures] is resolved,
+                 or to the first exception raised.
+        """
+
+        futures = list(futures or list())
+        gathered = Future()
+        pending = [len(futures)]
+        lock = threading.Lock()
+
+        if not futures:
+            gathered.set_result(list())
+            return gathered
+
+        def on_done(future):
+            if future._exc_info is not None:
+                gathered.set_exception(exc_info=future._exc_info)
+                return
+            with lock:
+                pending[0] -= 1
+                finished = pending[0] == 0
+            if finished:
+                gathered.set_result([f._result for f in futures])
+
+        for future in futures:
+            future.add_done_callback(on_done)
+        return gathered
@@ -1,14 +1,18 @@
 import httplib
 import urllib
-import json
 import base64
 import requests
-from kubernetes.utils.ConvertData import convert
+from kubernetes.utils.JsonCodec import get_codec
+from kubernetes.K8sExceptions import ResponseTooLargeException
+
+STREAM_CHUNK_SIZE = 8192
+BODY_CHUNK_SIZE = 65536
 
 
 class HttpRequest:
 
-    def __init__(self, method='GET', host='localhost:80', url='/', data=None, auth=None, cert=None, ca_cert=None, token=None):
+    def __init__(self, method='GET', host='localhost:80', url='/', data=None, auth=None, cert=None, ca_cert=None,
+                 token=None, session=None, codec=None, max_body_size=None, content_type=None):
         self.http_method = method
         self.http_host = host
         self.url = url
@@ -17,14 +21,18 @@ class HttpRequest:
         self.cert = cert
         self.ca_cert = ca_cert
         self.token = token
+        self.session = session
+        self.codec = codec if codec is not None else get_codec()
+        self.max_body_size = max_body_size
+        self.content_type = content_type
 
     def send(self):
-        state = dict(success=False, reason=None, status=None, data=None)
+        state = dict(success=False, reason=None, status=None, headers=None, data=None)
         http_headers = dict()
         http_headers['Accept'] = 'application/json'
 
-        if self.http_method in ['PUT', 'POST']:
-            http_headers['Content-type'] = 'application/json'
+        if self.http_method in ['PUT', 'POST', 'PATCH']:
+            http_headers['Content-type'] = 'application/json' if self.content_type is None else self.content_type
 
         if self.token is not None:
             http_headers['Authorization'] = 'Bearer {token}'.format(token=self.token)
@@ -35,36 +43,145 @@ class HttpRequest:
 
         self.url = self.http_host + self.url
 
+        # A pooled HttpSession reuses keep-alive connections; fall back to one-shot requests otherwise.
+        requester = requests if self.session is None else self.session
+
         if self.data is None:
-            response = requests.request(
+            response = requester.request(
                 method=self.http_method,
                 url=self.url,
                 auth=self.auth,
                 cert=self.cert,
+                stream=True,
                 verify=False
             )
 
         else:
-            json_encoded = json.dumps(self.data)
+            # a str body was encoded beforehand, e.g. from a model's serialization cache.
+            json_encoded = self.data if isinstance(self.data, str) else self.codec.dumps(self.data)
             # @todo: Add certificate verification !
-            response = requests.request(
+            response = requester.request(
                 method=self.http_method,
                 url=self.url,
                 auth=self.auth,
                 cert=self.cert,
                 headers=http_headers,
                 data=json_encoded,
+                stream=True,
                 verify=False
             )
 
         state['status'] = response.status_code
         state['reason'] = response.reason
-        resp_data = response.text.decode('utf-8')
+        state['headers'] = response.headers
+        resp_data = self._read_body(response)
 
         if len(resp_data) > 0:
-            state['data'] = convert(data=json.loads(resp_data))
+            state['data'] = self.codec.loads(resp_data)
 
         if state['status'] in [200, 201]:
             state['success'] = True
 
         return state
+
+    def stream(self, timeout=None):
+        """
+        Sends a GET whose response body is a stream of newline-delimited JSON documents, such as a watch.
+
+        :param timeout: The socket read timeout in seconds. None blocks until the server closes the stream.
+        :return: The same state dict as send(). On success, state['data'] is a generator which decodes
+                 and yields one document at a time as it arrives.
+        """
+
+        state = dict(success=False, reason=None, status=None, headers=None, data=None)
+        http_headers = dict()
+        http_headers['Accept'] = 'application/json'
+
+        if self.token is not None:
+            http_headers['Authorization'] = 'Bearer {token}'.format(token=self.token)
+
+        if self.data is not None:
+            url = "{orig_url}?{encoded_params}".format(orig_url=self.url, encoded_params=urllib.urlencode(self.data))
+            self.url = url
+
+        self.url = self.http_host + self.url
+
+        requester = requests if self.session is None else self.session
+        response = requester.request(
+            method=self.http_method,
+            url=self.url,
+            auth=self.auth,
+            cert=self.cert,
+            headers=http_headers,
+            stream=True,
+            timeout=timeout,
+            verify=False
+        )
+
+        state['status'] = response.status_code
+        state['reason'] = response.reason
+        state['headers'] = response.headers
+
+        if state['status'] == 200:
+            state['success'] = True
+            state['data'] = self._iter_documents(response)
+        else:
+            resp_data = self._read_body(response)
+            response.close()
+            if len(resp_data) > 0:
+                state['data'] = self.codec.loads(resp_data)
+
+        return state
+
+    def _too_large(self, response, size):
+        response.close()
+        message = 'HttpRequest: {0} {1}: response body exceeds max_body_size: [ {2} ] bytes, got at least [ {3} ].'\
+            .format(self.http_method, self.url, self.max_body_size, size)
+        return ResponseTooLargeException(message)
+
+    def _read_body(self, response):
+        """
+        Reads the raw response bytes, in chunks, into a single buffer for the codec to parse in one go.
+
+        No text copy of the body is made, and reading stops as soon as [max_body_size] is exceeded.
+        """
+
+        length = response.headers.get('Content-Length', None)
+        if self.max_body_size is not None and length is not None and int(length) > self.max_body_size:
+            raise self._too_large(response, int(length))
+
+        chunks = list()
+        size = 0
+        for chunk in response.iter_content(chunk_size=BODY_CHUNK_SIZE):
+            size += len(chunk)
+            if self.max_body_size is not None and size > self.max_body_size:
+                raise self._too_large(response, size)
+            chunks.append(chunk)
+
+        if len(chunks) == 1:
+            return chunks[0]
+        return ''.join(chunks)
+
+    def _iter_documents(self, response):
+        # a document can span many chunks; collect its pieces and join them once, when its newline arrives.
+        pending = list()
+        size = 0
+        try:
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                lines = chunk.split('\n')
+                for line in lines[:-1]:
+                    pending.append(line)
+                    document = ''.join(pending)
+                    pending = list()
+                    size = 0
+                    if document.strip():
+                        yield self.codec.loads(document)
+                pending.append(lines[-1])
+                size += len(lines[-1])
+                if self.max_body_size is not None and size > self.max_body_size:
+                    raise self._too_large(response, size)
+            document = ''.join(pending)
+            if document.strip():
+                yield self.codec.loads(document)
+        finally:
+            response.close()
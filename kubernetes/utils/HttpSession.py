@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_POOL_IDLE_TIMEOUT = 60
+
+
+class HttpSession(object):
+    """
+    Keep-alive connection pool shared by every K8sObject built from the same K8sConfig.
+
+    The underlying requests.Session is created on first use and is torn down (closing its pooled
+    sockets) when it has been idle for longer than idle_timeout seconds.
+
+    """
+
+    def __init__(self, pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 idle_timeout=DEFAULT_POOL_IDLE_TIMEOUT):
+        """
+        :param pool_connections: The number of per-host connection pools to keep.
+        :param pool_maxsize: The maximum number of connections kept alive per host.
+        :param idle_timeout: Seconds after which an unused pool is closed. None disables eviction.
+        """
+
+        if not isinstance(pool_connections, int) or pool_connections < 1:
+            raise SyntaxError('HttpSession: pool_connections: [ {0} ] must be a positive integer.'
+                              .format(pool_connections))
+        if not isinstance(pool_maxsize, int) or pool_maxsize < 1:
+            raise SyntaxError('HttpSession: pool_maxsize: [ {0} ] must be a positive integer.'.format(pool_maxsize))
+        if idle_timeout is not None and (not isinstance(idle_timeout, (int, float)) or idle_timeout < 0):
+            raise SyntaxError('HttpSession: idle_timeout: [ {0} ] must be a positive number.'.format(idle_timeout))
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.idle_timeout = idle_timeout
+
+        self._lock = threading.Lock()
+        self._session = None
+        self._last_used = None
+        self._retired_connections = 0
+        self._retired_requests = 0
+        self._evictions = 0
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # Copies of a K8sConfig keep sharing the same pool.
+        return self
+
+    def _new_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _pools(self):
+        pools = list()
+        if self._session is not None:
+            for adapter in set(self._session.adapters.values()):
+                manager = getattr(adapter, 'poolmanager', None)
+                if manager is not None:
+                    for key in manager.pools.keys():
+                        pool = manager.pools.get(key)
+                        if pool is not None:
+                            pools.append(pool)
+        return pools
+
+    def _retire(self):
+        for pool in self._pools():
+            self._retired_connections += pool.num_connections
+            self._retired_requests += pool.num_requests
+        self._session.close()
+        self._session = None
+
+    def _acquire(self):
+        with self._lock:
+            now = time.time()
+            if self._session is not None and self.idle_timeout is not None:
+                if now - self._last_used > self.idle_timeout:
+                    self._retire()
+                    self._evictions += 1
+            if self._session is None:
+                self._session = self._new_session()
+            self._last_used = now
+            return self._session
+
+    def request(self, **kwargs):
+        return self._acquire().request(**kwargs)
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._retire()
+        return self
+
+    def get_stats(self):
+        with self._lock:
+            opened = self._retired_connections
+            sent = self._retired_requests
+            for pool in self._pools():
+                opened += pool.num_connections
+                sent += pool.num_requests
+        return dict(
+            connections_opened=opened,
+            connections_reused=max(0, sent - opened),
+            requests=sent,
+            evictions=self._evictions
+        )
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import json
+import os
+import threading
+from kubernetes.utils.ConvertData import decode, make_decoder
+
+JSON_CODEC_ENV = 'K8S_JSON_CODEC'
+DEFAULT_JSON_CODEC = 'auto'
+
+# fastest first; 'auto' picks the first one that imports.
+PREFERRED_CODECS = ['simplejson', 'stdlib']
+
+SEPARATORS = (',', ':')
+
+_codecs = dict()
+_codecs_lock = threading.Lock()
+
+
+def _stdlib():
+    encoder = json.JSONEncoder(separators=SEPARATORS)
+    return encoder.encode, decode
+
+
+def _simplejson():
+    import simplejson
+    # given bytes, simplejson's C scanner returns str for ASCII strings; the same hook as the stdlib backend's
+    # only has the non-ASCII ones left to encode. its encoder is no faster than the stdlib one.
+    decoder = make_decoder(simplejson)
+    encoder = json.JSONEncoder(separators=SEPARATORS)
+    return encoder.encode, lambda text: decode(text, decoder=decoder)
+
+
+BACKENDS = {
+    'simplejson': _simplejson,
+    'stdlib': _stdlib
+}
+
+
+class JsonCodec(object):
+    """
+    Encodes request bodies to JSON bytes and decodes response bodies, using one of several backends.
+
+    Every backend decodes to the same shapes as convert(): dicts, lists and str, UTF-8 encoded when not ASCII.
+
+    """
+
+    def __init__(self, name=None):
+        """
+        :param name: One of 'auto', 'simplejson' or 'stdlib'.
+        """
+
+        if name not in BACKENDS and name != DEFAULT_JSON_CODEC:
+            valid = ", ".join([DEFAULT_JSON_CODEC] + PREFERRED_CODECS)
+            raise SyntaxError('JsonCodec: name: [ {0} ] must be in: [ {1} ]'.format(name, valid))
+
+        candidates = PREFERRED_CODECS if name == DEFAULT_JSON_CODEC else [name]
+        for candidate in candidates:
+            try:
+                self._dumps, self._loads = BACKENDS[candidate]()
+                self.name = candidate
+                break
+            except ImportError:
+                continue
+        else:
+            raise SyntaxError('JsonCodec: name: [ {0} ] is not installed.'.format(name))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def dumps(self, data=None):
+        return self._dumps(data)
+
+    def loads(self, data=None):
+        if isinstance(data, unicode):
+            data = data.encode('utf-8')
+        return self._loads(data)
+
+
+def get_codec(name=None):
+    """
+    Returns the shared JsonCodec for [name]. None means the K8S_JSON_CODEC environment variable, or 'auto'.
+    """
+
+    if name is None:
+        name = os.environ.get(JSON_CODEC_ENV, DEFAULT_JSON_CODEC)
+
+    with _codecs_lock:
+        codec = _codecs.get(name, None)
+        if codec is None:
+            codec = JsonCodec(name=name)
+            _codecs[name] = codec
+        return codec
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import os
+import threading
+import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+_cache = dict()
+_cache_lock = threading.Lock()
+_cache_stats = dict(hits=0, misses=0)
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict handed out by the kubeconfig cache; every K8sConfig shares the same instance.
+
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('FrozenDict: cached kubeconfig data is read-only.')
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+class FrozenList(list):
+    """
+    Read-only list handed out by the kubeconfig cache; every K8sConfig shares the same instance.
+
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('FrozenList: cached kubeconfig data is read-only.')
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __setslice__ = _immutable
+    __delslice__ = _immutable
+    __iadd__ = _immutable
+    __imul__ = _immutable
+    append = _immutable
+    extend = _immutable
+    insert = _immutable
+    pop = _immutable
+    remove = _immutable
+    reverse = _immutable
+    sort = _immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+
+def freeze(data):
+    if isinstance(data, dict):
+        return FrozenDict((k, freeze(v)) for k, v in data.iteritems())
+    elif isinstance(data, list):
+        return FrozenList(freeze(v) for v in data)
+    else:
+        return data
+
+
+def load_kubeconfig(path=None):
+    """
+    Returns the parsed contents of the kubeconfig file at path, as read-only dicts and lists.
+
+    Parsed files are cached process-wide, keyed by path and validated against the file's mtime and
+    size, so the YAML is only parsed again when the file changes on disk.
+
+    :param path: Path to the kubeconfig file.
+    :return: A FrozenDict, or None if the file is empty.
+    """
+
+    if path is None:
+        raise SyntaxError('KubeConfigLoader: path: [ {0} ] cannot be None.'.format(path))
+
+    path = os.path.realpath(path)
+    st = os.stat(path)
+    signature = (st.st_mtime, st.st_size)
+
+    with _cache_lock:
+        entry = _cache.get(path, None)
+        if entry is not None and entry[0] == signature:
+            _cache_stats['hits'] += 1
+            return entry[1]
+
+    with open(path, 'r') as stream:
+        parsed = freeze(yaml.load(stream, Loader=YamlLoader))
+
+    with _cache_lock:
+        _cache_stats['misses'] += 1
+        _cache[path] = (signature, parsed)
+
+    return parsed
+
+
+def clear_kubeconfig_cache():
+    with _cache_lock:
+        _cache.clear()
+        _cache_stats['hits'] = 0
+        _cache_stats['misses'] = 0
+
+
+def get_kubeconfig_cache_stats():
+    with _cache_lock:
+        return dict(entries=len(_cache), **_cache_stats)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+_CONTAINERS = (dict, list)
+
+
+def copy_model(obj=None):
+    """
+    Copies a JSON document: dicts and lists are copied, everything else (strings, numbers, booleans, None)
+    is immutable and shared with [obj].
+
+    Unlike copy.deepcopy(), there is no memo to keep and no __deepcopy__ hook to look up for each value,
+    which makes it several times faster on API objects.
+
+    :return: A copy of [obj] that can be mutated without changing [obj].
+    """
+
+    cls = type(obj)
+    if cls is dict:
+        return {k: copy_model(v) if type(v) in _CONTAINERS else v for k, v in obj.iteritems()}
+    if cls is list:
+        return [copy_model(v) if type(v) in _CONTAINERS else v for v in obj]
+    if isinstance(obj, dict):
+        return {k: copy_model(v) for k, v in obj.iteritems()}
+    if isinstance(obj, list):
+        return [copy_model(v) for v in obj]
+    return obj
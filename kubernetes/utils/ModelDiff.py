@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+
+def merge_diff(old=None, new=None):
+    """
+    Computes the RFC 7386 JSON merge patch turning [old] into [new].
+
+    Keys missing from [new] are set to None, which removes them. Lists are compared whole and,
+    when they differ, replaced whole, as merge patches require.
+
+    :return: A dict; empty when [old] and [new] are equal.
+    """
+
+    patch = dict()
+    for key, value in new.iteritems():
+        if key not in old:
+            patch[key] = value
+        elif old[key] != value:
+            if isinstance(value, dict) and isinstance(old[key], dict):
+                patch[key] = merge_diff(old[key], value)
+            else:
+                patch[key] = value
+    for key in old:
+        if key not in new:
+            patch[key] = None
+    return patch
+
+
+def _escape(key):
+    return unicode(key).replace(u'~', u'~0').replace(u'/', u'~1')
+
+
+def json_diff(old=None, new=None, path=''):
+    """
+    Computes the RFC 6902 JSON patch turning [old] into [new].
+
+    Dicts are compared key by key. Lists of the same length are compared item by item; other lists are replaced.
+
+    :return: A list of add, remove and replace operations; empty when [old] and [new] are equal.
+    """
+
+    operations = list()
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                operations.append(dict(op='remove', path='{0}/{1}'.format(path, _escape(key))))
+        for key, value in new.iteritems():
+            child = '{0}/{1}'.format(path, _escape(key))
+            if key not in old:
+                operations.append(dict(op='add', path=child, value=value))
+            elif old[key] != value:
+                operations.extend(json_diff(old[key], value, child))
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for index, (before, after) in enumerate(zip(old, new)):
+            if before != after:
+                operations.extend(json_diff(before, after, '{0}/{1}'.format(path, index)))
+    elif old != new:
+        operations.append(dict(op='replace', path=path, value=new))
+    return operations
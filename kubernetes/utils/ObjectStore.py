@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import threading
+
+
+def index_by_labels(obj):
+    labels = obj.get('metadata', dict()).get('labels', None) or dict()
+    return ['{0}={1}'.format(k, v) for k, v in labels.items()]
+
+
+def index_by_node_name(obj):
+    node_name = (obj.get('spec', None) or dict()).get('nodeName', None)
+    return [node_name] if node_name is not None else list()
+
+
+def index_by_image(obj):
+    spec = obj.get('spec', None) or dict()
+    if 'template' in spec:
+        spec = spec['template'].get('spec', None) or dict()
+    return list(set([c['image'] for c in spec.get('containers', None) or list() if 'image' in c]))
+
+
+def index_by_selector(obj):
+    selector = (obj.get('spec', None) or dict()).get('selector', None) or dict()
+    return ['{0}={1}'.format(k, v) for k, v in selector.items()]
+
+
+DEFAULT_INDEXERS = {
+    'labels': index_by_labels,
+    'node_name': index_by_node_name,
+    'image': index_by_image,
+    'selector': index_by_selector
+}
+
+
+class ObjectStore(object):
+    """
+    Thread-safe in-memory store of raw API objects keyed by name, with secondary indexes.
+
+    An indexer is a function taking an object and returning the list of values it should be indexed
+    under. Lookups by index cost O(result), not O(store). Returned objects are shared with the store
+    and must be treated as read-only.
+
+    """
+
+    def __init__(self, indexers=None):
+        """
+        :param indexers: A dict of index name -> indexer function.
+        """
+
+        if indexers is not None and not isinstance(indexers, dict):
+            raise SyntaxError('ObjectStore: indexers: [ {0} ] must be a dict.'.format(indexers))
+
+        self._lock = threading.RLock()
+        self._items = dict()
+        self._indexers = dict()
+        self._indices = dict()
+
+        if indexers is not None:
+            for name, func in indexers.items():
+                self.add_indexer(name=name, func=func)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    @staticmethod
+    def key_for(obj):
+        return obj['metadata']['name']
+
+    # ------------------------------------------------------------------------------------- indexes
+
+    def add_indexer(self, name=None, func=None):
+        if name is None or not isinstance(name, str):
+            raise SyntaxError('ObjectStore: name: [ {0} ] must be a string.'.format(name))
+        if func is None or not callable(func):
+            raise SyntaxError('ObjectStore: func: [ {0} ] must be callable.'.format(func))
+
+        with self._lock:
+            self._indexers[name] = func
+            self._indices[name] = dict()
+            for key, obj in self._items.items():
+                self._index(name, key, obj)
+        return self
+
+    def _index(self, name, key, obj):
+        index = self._indices[name]
+        for value in self._indexers[name](obj):
+            index.setdefault(value, set()).add(key)
+
+    def _unindex(self, name, key, obj):
+        index = self._indices[name]
+        for value in self._indexers[name](obj):
+            keys = index.get(value, None)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[value]
+
+    # ------------------------------------------------------------------------------------- mutations
+
+    def add(self, obj=None):
+        key = self.key_for(obj)
+        with self._lock:
+            old = self._items.get(key, None)
+            for name in self._indexers:
+                if old is not None:
+                    self._unindex(name, key, old)
+                self._index(name, key, obj)
+            self._items[key] = obj
+        return self
+
+    update = add
+
+    def delete(self, obj=None):
+        key = self.key_for(obj)
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                for name in self._indexers:
+                    self._unindex(name, key, old)
+        return self
+
+    def replace(self, objs=None):
+        with self._lock:
+            self._items = dict()
+            self._indices = dict((name, dict()) for name in self._indexers)
+            for obj in objs or list():
+                self.add(obj)
+        return self
+
+    # ------------------------------------------------------------------------------------- lookups
+
+    def get(self, key=None):
+        with self._lock:
+            return self._items.get(key, None)
+
+    def keys(self):
+        with self._lock:
+            return self._items.keys()
+
+    def list(self):
+        with self._lock:
+            return self._items.values()
+
+    def index_values(self, name=None):
+        if name not in self._indexers:
+            raise SyntaxError('ObjectStore: index: [ {0} ] does not exist.'.format(name))
+        with self._lock:
+            return self._indices[name].keys()
+
+    def by_index(self, name=None, value=None):
+        if name not in self._indexers:
+            raise SyntaxError('ObjectStore: index: [ {0} ] does not exist.'.format(name))
+        with self._lock:
+            return [self._items[key] for key in self._indices[name].get(value, set())]
+
+    def by_selector(self, selector=None, index='labels'):
+        """
+        Returns the objects whose labels match every key=value pair of selector.
+
+        Intersects the index sets, starting with the smallest, so the cost is bounded by the
+        rarest label rather than by the size of the store.
+
+        :param selector: A dict of labels, such as a ReplicationController's spec.selector.
+        :param index: The name of an index built with index_by_labels.
+        """
+
+        if selector is None or not isinstance(selector, dict):
+            raise SyntaxError('ObjectStore: selector: [ {0} ] must be a dict.'.format(selector))
+        if index not in self._indexers:
+            raise SyntaxError('ObjectStore: index: [ {0} ] does not exist.'.format(index))
+
+        with self._lock:
+            if not selector:
+                return self._items.values()
+            sets = [self._indices[index].get('{0}={1}'.format(k, v), set()) for k, v in selector.items()]
+            sets.sort(key=len)
+            keys = sets[0].intersection(*sets[1:])
+            return [self._items[key] for key in keys]
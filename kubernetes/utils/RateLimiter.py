@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import threading
+import time
+
+
+class RateLimiter(object):
+    """
+    Token bucket shared by every K8sObject (and every thread) using the same K8sConfig.
+
+    The bucket holds up to [burst] tokens and refills at [qps] tokens per second; each request takes one.
+    Callers reserve their token under the lock and sleep outside of it, so waiting callers are served in
+    arrival order. The time spent waiting is recorded, to tell client-side throttling apart from server latency.
+
+    """
+
+    def __init__(self, qps=None, burst=None):
+        """
+        :param qps: The sustained number of requests per second.
+        :param burst: The number of requests allowed at once after an idle period. Defaults to qps, at least 1.
+        """
+
+        if not isinstance(qps, (int, float)) or qps <= 0:
+            raise SyntaxError('RateLimiter: qps: [ {0} ] must be a positive number.'.format(qps))
+        if burst is None:
+            burst = max(int(qps), 1)
+        if not isinstance(burst, int) or burst < 1:
+            raise SyntaxError('RateLimiter: burst: [ {0} ] must be a positive integer.'.format(burst))
+
+        self.qps = float(qps)
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._last = time.time()
+        self._stats = dict(acquired=0, throttled=0, total_wait=0.0, max_wait=0.0)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def reserve(self):
+        """
+        Takes a token without waiting for it.
+
+        :return: The number of seconds the caller must wait before its request may go out.
+        """
+
+        with self._lock:
+            now = time.time()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.qps)
+            self._last = now
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.qps
+
+            self._stats['acquired'] += 1
+            if wait > 0:
+                self._stats['throttled'] += 1
+                self._stats['total_wait'] += wait
+                self._stats['max_wait'] = max(self._stats['max_wait'], wait)
+        return wait
+
+    def acquire(self):
+        """
+        Blocks until a token is available.
+
+        :return: The number of seconds spent waiting.
+        """
+
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def get_stats(self):
+        with self._lock:
+            return dict(qps=self.qps, burst=self.burst, **self._stats)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import random
+import sys
+import threading
+import time
+from email.utils import parsedate_tz, mktime_tz
+import requests
+
+DEFAULT_RETRY_STATUSES = [429, 500, 502, 503, 504]
+DEFAULT_IDEMPOTENT_METHODS = ['GET', 'HEAD', 'PUT', 'DELETE']
+# a POST rejected with 429 was never processed, so sending it again can't create a duplicate.
+DEFAULT_POST_RETRY_STATUSES = [429]
+
+RETRYABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError
+)
+
+
+class RetryPolicy(object):
+    """
+    Retries API calls that failed for transient reasons, with capped exponential backoff and full jitter.
+
+    Idempotent methods are retried on connection errors and on [retry_statuses]; POST only on
+    [post_retry_statuses], since a POST whose response was lost may have been applied. A Retry-After header
+    overrides the computed delay, even past [max_backoff]. No retry is attempted past [deadline] seconds from
+    the first attempt.
+
+    """
+
+    def __init__(self, max_retries=3, backoff=0.2, max_backoff=10.0, deadline=None,
+                 retry_statuses=None, idempotent_methods=None, post_retry_statuses=None):
+        """
+        :param max_retries: The number of retries after the first attempt.
+        :param backoff: The base delay in seconds; retry n waits up to backoff * 2^n.
+        :param max_backoff: The longest computed delay between two attempts, in seconds. A server's Retry-After
+                            is waited in full; only [deadline] bounds it.
+        :param deadline: Give up retrying a call after this many seconds. None means no deadline.
+        :param retry_statuses: HTTP statuses worth retrying idempotent calls on.
+        :param idempotent_methods: HTTP methods safe to send twice.
+        :param post_retry_statuses: HTTP statuses worth retrying a POST on.
+        """
+
+        if not isinstance(max_retries, int) or max_retries < 0:
+            raise SyntaxError('RetryPolicy: max_retries: [ {0} ] must be a positive integer.'.format(max_retries))
+        if not isinstance(backoff, (int, float)) or backoff < 0:
+            raise SyntaxError('RetryPolicy: backoff: [ {0} ] must be a positive number.'.format(backoff))
+        if not isinstance(max_backoff, (int, float)) or max_backoff < backoff:
+            raise SyntaxError('RetryPolicy: max_backoff: [ {0} ] must be at least backoff.'.format(max_backoff))
+        if deadline is not None and (not isinstance(deadline, (int, float)) or deadline <= 0):
+            raise SyntaxError('RetryPolicy: deadline: [ {0} ] must be a positive number.'.format(deadline))
+
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.retry_statuses = DEFAULT_RETRY_STATUSES if retry_statuses is None else retry_statuses
+        self.idempotent_methods = DEFAULT_IDEMPOTENT_METHODS if idempotent_methods is None else idempotent_methods
+        self.post_retry_statuses = DEFAULT_POST_RETRY_STATUSES if post_retry_statuses is None else post_retry_statuses
+
+        self._lock = threading.Lock()
+        self._stats = dict(calls=0, retries=0, retried_calls=0, gave_up=0, errors=0, statuses=dict())
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    # ------------------------------------------------------------------------------------- decisions
+
+    def is_retryable(self, method=None, status=None, error=None):
+        if method in self.idempotent_methods:
+            return error is not None or status in self.retry_statuses
+        return error is None and status in self.post_retry_statuses
+
+    def get_delay(self, retry=0, retry_after=None):
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** retry)))
+
+    @staticmethod
+    def parse_retry_after(value=None):
+        """
+        :param value: A Retry-After header: a number of seconds, or an HTTP date.
+        :return: The number of seconds to wait, or None if [value] can't be parsed.
+        """
+
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        parsed = parsedate_tz(value)
+        if parsed is None:
+            return None
+        return max(mktime_tz(parsed) - time.time(), 0.0)
+
+    # ------------------------------------------------------------------------------------- calls
+
+    def call(self, method='GET', func=None):
+        """
+        Calls func() until it returns a state that isn't worth retrying, retries run out, or the deadline passes.
+
+        :param method: The HTTP method func() sends.
+        :param func: Sends one request and returns its state dict, as HttpRequest.send() does.
+        :return: The last state, with state['retries'] set to the number of retries made.
+        """
+
+        started = time.time()
+        retries = 0
+
+        while True:
+            state, exc_info = None, None
+            try:
+                state = func()
+            except RETRYABLE_ERRORS:
+                exc_info = sys.exc_info()
+
+            status = state.get('status', None) if state is not None else None
+            headers = (state.get('headers', None) if state is not None else None) or dict()
+            retryable = self.is_retryable(method=method, status=status, error=exc_info)
+
+            delay = None
+            if retryable and retries < self.max_retries:
+                delay = self.get_delay(retry=retries, retry_after=self.parse_retry_after(headers.get('Retry-After')))
+                if self.deadline is not None and time.time() - started + delay > self.deadline:
+                    delay = None
+
+            if delay is None:
+                self._record(retries=retries, status=status, error=exc_info, gave_up=retryable)
+                if exc_info is not None:
+                    raise exc_info[0], exc_info[1], exc_info[2]
+                state['retries'] = retries
+                return state
+
+            retries += 1
+            time.sleep(delay)
+
+    def _record(self, retries=0, status=None, error=None, gave_up=False):
+        with self._lock:
+            self._stats['calls'] += 1
+            self._stats['retries'] += retries
+            if retries > 0:
+                self._stats['retried_calls'] += 1
+            if gave_up:
+                self._stats['gave_up'] += 1
+            if error is not None:
+                self._stats['errors'] += 1
+            if status is not None:
+                self._stats['statuses'][status] = self._stats['statuses'].get(status, 0) + 1
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['statuses'] = dict(self._stats['statuses'])
+            return stats
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import heapq
+import itertools
+import threading
+import time
+import Queue
+from kubernetes.utils.Future import Future
+
+DEFAULT_WORKERS = 10
+
+
+class WorkerPool(object):
+    """
+    A fixed set of worker threads, plus one timer thread, shared by every async object built from the same K8sConfig.
+
+    Any number of operations can be submitted; they queue up and run [workers] at a time, so the number of
+    threads (and of connections to the API server) stays bounded. Threads are only started on first use.
+
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS):
+        """
+        :param workers: The number of operations running at the same time.
+        """
+
+        if not isinstance(workers, int) or workers < 1:
+            raise SyntaxError('WorkerPool: workers: [ {0} ] must be a positive integer.'.format(workers))
+
+        self.workers = workers
+        self._queue = Queue.Queue()
+        self._threads = list()
+        self._lock = threading.Lock()
+        self._timers = list()
+        self._timer_sequence = itertools.count()
+        self._timer_condition = threading.Condition()
+        self._timer_thread = None
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def _start(self):
+        with self._lock:
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._work, name='WorkerPool-{0}'.format(len(self._threads)))
+                thread.daemon = True
+                thread.start()
+                self._threads.append(thread)
+
+    def _work(self):
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+            future, func, args, kwargs = task
+            Future.run(future, func, *args, **kwargs)
+
+    def close(self, timeout=None):
+        """
+        Stops the threads once the operations already queued have run, and drops pending timers.
+        The pool starts again if used afterwards.
+        """
+
+        with self._lock:
+            threads, self._threads = self._threads, list()
+        for thread in threads:
+            self._queue.put(None)
+        with self._timer_condition:
+            timer, self._timer_thread = self._timer_thread, None
+            self._timers = list()
+            self._timer_condition.notify()
+        for thread in threads + ([timer] if timer is not None else list()):
+            thread.join(timeout)
+        return self
+
+    def submit(self, func=None, *args, **kwargs):
+        """
+        :return: A Future resolving to func(*args, **kwargs).
+        """
+
+        if func is None or not callable(func):
+            raise SyntaxError('WorkerPool: func: [ {0} ] must be callable.'.format(func))
+        if len(self._threads) < self.workers:
+            self._start()
+        future = Future()
+        self._queue.put((future, func, args, kwargs))
+        return future
+
+    def pending(self):
+        return self._queue.qsize()
+
+    # ------------------------------------------------------------------------------------- timers
+
+    def call_later(self, delay=None, func=None, *args, **kwargs):
+        """
+        Runs func(*args, **kwargs) on the timer thread after [delay] seconds. It must not block.
+        """
+
+        if func is None or not callable(func):
+            raise SyntaxError('WorkerPool: func: [ {0} ] must be callable.'.format(func))
+
+        with self._timer_condition:
+            if self._timer_thread is None:
+                self._timer_thread = threading.Thread(target=self._time, name='WorkerPool-timer')
+                self._timer_thread.daemon = True
+                self._timer_thread.start()
+            entry = (time.time() + delay, next(self._timer_sequence), func, args, kwargs)
+            heapq.heappush(self._timers, entry)
+            self._timer_condition.notify()
+        return self
+
+    def _time(self):
+        me = threading.current_thread()
+        while True:
+            with self._timer_condition:
+                while not self._timers or self._timers[0][0] > time.time():
+                    if self._timer_thread is not me:
+                        return
+                    delay = None if not self._timers else self._timers[0][0] - time.time()
+                    self._timer_condition.wait(delay)
+                when, sequence, func, args, kwargs = heapq.heappop(self._timers)
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                pass
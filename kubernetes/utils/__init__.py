@@ -1,4 +1,15 @@
+from Future import Future
 from HttpRequest import HttpRequest
-from ConvertData import convert
+from HttpSession import HttpSession
+from JsonCodec import JsonCodec, get_codec
+from KubeConfigLoader import load_kubeconfig
+from ModelCopy import copy_model
+from ModelDiff import merge_diff, json_diff
+from ObjectStore import ObjectStore
+from RateLimiter import RateLimiter
+from RetryPolicy import RetryPolicy
+from WorkerPool import WorkerPool
+from ConvertData import convert, decode
 
-__all__ = ['convert', 'HttpRequest']
+__all__ = ['convert', 'decode', 'Future', 'HttpRequest', 'HttpSession', 'JsonCodec', 'get_codec', 'load_kubeconfig',
+           'copy_model', 'merge_diff', 'json_diff', 'ObjectStore', 'RateLimiter', 'RetryPolicy', 'WorkerPool']
@@ -0,0 +1,447 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import copy
+import json
+import re
+import socket
+import threading
+import time
+import urlparse
+import BaseHTTPServer
+import SocketServer
+
+URL_RE = re.compile(r'^/api/v1/namespaces/(?P<namespace>[^/]+)/(?P<resource>[^/?]+)'
+                    r'(/(?P<name>[^/?]+)(/(?P<subresource>scale))?)?$')
+
+KINDS = {
+    'pods': 'Pod',
+    'replicationcontrollers': 'ReplicationController',
+    'services': 'Service',
+    'secrets': 'Secret'
+}
+
+
+class FakeApiHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    wbufsize = -1
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        self.server.api.record_connection(self.connection)
+
+    def log_message(self, *args):
+        pass
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length', 0))
+        if length > 0:
+            return json.loads(self.rfile.read(length))
+        return None
+
+    def _reply(self, status, body):
+        payload = json.dumps(body)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _dispatch(self):
+        api = self.server.api
+        parsed = urlparse.urlparse(self.path)
+        params = dict(urlparse.parse_qsl(parsed.query))
+        api.record_request(self.command, parsed.path, params)
+        match = URL_RE.match(parsed.path)
+        if match is None:
+            return self._reply(404, dict(kind='Status', code=404, message='not found'))
+        if self.command == 'GET' and params.get('watch') == 'true':
+            if not api.watch_enabled:
+                return self._reply(405, dict(kind='Status', code=405, message='watch is disabled'))
+            return self._watch(resource=match.group('resource'), params=params)
+        body = self._read_body()
+        failure = api.next_failure()
+        if failure is not None:
+            return self._fail(*failure)
+        if match.group('subresource') == 'scale':
+            status, body = api.handle_scale(
+                method=self.command,
+                resource=match.group('resource'),
+                name=match.group('name'),
+                body=body
+            )
+            return self._reply(status, body)
+        status, body = api.handle(
+            method=self.command,
+            resource=match.group('resource'),
+            name=match.group('name'),
+            params=params,
+            body=body,
+            content_type=self.headers.get('Content-Type')
+        )
+        self._reply(status, body)
+
+    def _fail(self, status, headers):
+        if status is None:
+            # simulate a connection reset: hang up without a response.
+            self.close_connection = 1
+            self.connection.shutdown(socket.SHUT_RDWR)
+            return
+        payload = json.dumps(dict(kind='Status', code=status, message='injected failure'))
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _write_chunk(self, data):
+        self.wfile.write('{0:x}\r\n{1}\r\n'.format(len(data), data))
+        self.wfile.flush()
+
+    def _watch(self, resource, params):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        self.wfile.flush()
+        for event in self.server.api.watch_events(resource, params):
+            if event is None:
+                # simulate a dropped connection: no terminating chunk.
+                self.close_connection = 1
+                return
+            self._write_chunk(json.dumps(event) + '\n')
+        self._write_chunk('')
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+    do_PUT = _dispatch
+    do_DELETE = _dispatch
+    do_PATCH = _dispatch
+
+
+class ThreadedHTTPServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def process_request(self, request, client_address):
+        thread = threading.Thread(target=self.process_request_thread, args=(request, client_address))
+        thread.daemon = True
+        self.api.threads.append(thread)
+        thread.start()
+
+    def handle_error(self, request, client_address):
+        # clients routinely hang up on watches; that's not an error worth a traceback.
+        pass
+
+
+class FakeApiServer(object):
+    """
+    In-process stand-in for the Kubernetes API server, for tests that need real HTTP round-trips.
+
+    """
+
+    def __init__(self):
+        self.objects = dict((resource, dict()) for resource in KINDS)
+        self.requests = list()
+        self.connections = 0
+        self.sockets = list()
+        self.threads = list()
+        self.resource_version = 0
+        self.events = list()
+        self.compacted = 0
+        self.drops = 0
+        self.stopped = False
+        self.watch_enabled = True
+        self.failures = list()
+        self.run_controllers = False
+        # older servers leave status.selector out of Scale objects.
+        self.scale_selectors = True
+        self.pod_sequence = 0
+        self._lock = threading.Condition()
+        self.httpd = ThreadedHTTPServer(('127.0.0.1', 0), FakeApiHandler)
+        self.httpd.api = self
+        self.thread = None
+
+    @property
+    def api_host(self):
+        return '127.0.0.1:{0}'.format(self.httpd.server_address[1])
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, kwargs=dict(poll_interval=0.05))
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        with self._lock:
+            self.stopped = True
+            self._lock.notify_all()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        # hang up on idle keep-alive connections so their handler threads exit.
+        for sock in self.sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+        for thread in self.threads:
+            thread.join(1)
+        return self
+
+    # ------------------------------------------------------------------------------------- bookkeeping
+
+    def record_connection(self, sock):
+        with self._lock:
+            self.connections += 1
+            self.sockets.append(sock)
+
+    def record_request(self, method, path, params):
+        with self._lock:
+            self.requests.append((method, path, params))
+
+    def reset_counters(self):
+        with self._lock:
+            self.requests = list()
+            self.connections = 0
+
+    def fail_next(self, status=None, count=1, headers=None):
+        """
+        Answers the next [count] non-watch requests with [status] and [headers] instead of handling them.
+        A status of None hangs up without answering.
+        """
+        with self._lock:
+            self.failures.extend([(status, headers or dict())] * count)
+
+    def next_failure(self):
+        with self._lock:
+            if self.failures:
+                return self.failures.pop(0)
+        return None
+
+    def drop_watches(self):
+        with self._lock:
+            self.drops += 1
+            self._lock.notify_all()
+
+    def compact(self):
+        with self._lock:
+            self.compacted = self.resource_version
+            self.events = list()
+
+    # ------------------------------------------------------------------------------------- store
+
+    def _record(self, resource, event_type, obj):
+        with self._lock:
+            self.resource_version += 1
+            obj['metadata']['resourceVersion'] = str(self.resource_version)
+            self.events.append((self.resource_version, resource, event_type, copy.deepcopy(obj)))
+            self._lock.notify_all()
+        return obj
+
+    def add(self, resource, obj):
+        obj.setdefault('kind', KINDS[resource])
+        obj.setdefault('apiVersion', 'v1')
+        name = obj['metadata']['name']
+        with self._lock:
+            event_type = 'MODIFIED' if name in self.objects[resource] else 'ADDED'
+            self.objects[resource][name] = obj
+            self._record(resource, event_type, obj)
+            if resource == 'replicationcontrollers' and self.run_controllers:
+                self._reconcile(obj)
+        return obj
+
+    def _reconcile(self, rc):
+        # a replication manager in miniature: pods are created ready, and never adopted or cascaded.
+        selector = rc['spec'].get('selector', None) or dict()
+        replicas = rc['spec'].get('replicas', 0)
+        template = rc['spec'].get('template', dict())
+        pods = sorted(name for name, pod in self.objects['pods'].items()
+                      if all(pod['metadata'].get('labels', dict()).get(k) == v for k, v in selector.items()))
+        for i in range(len(pods), replicas):
+            self.pod_sequence += 1
+            pod = dict(
+                metadata=dict(name='{0}-{1}'.format(rc['metadata']['name'], self.pod_sequence),
+                              namespace=rc['metadata'].get('namespace', 'default'),
+                              labels=copy.deepcopy(template.get('metadata', dict()).get('labels', dict()))),
+                spec=copy.deepcopy(template.get('spec', dict())),
+                status=dict(phase='Running', conditions=[dict(type='Ready', status='True')])
+            )
+            self.add('pods', pod)
+        for name in pods[replicas:]:
+            self.delete('pods', name)
+
+    def delete(self, resource, name):
+        obj = self.objects[resource].pop(name)
+        return self._record(resource, 'DELETED', obj)
+
+    def watch_events(self, resource, params):
+        selector = params.get('labelSelector')
+        deadline = None
+        if 'timeoutSeconds' in params:
+            deadline = time.time() + int(params['timeoutSeconds'])
+
+        with self._lock:
+            drops = self.drops
+            if 'resourceVersion' in params:
+                since = int(params['resourceVersion'])
+                if since < self.compacted:
+                    gone = dict(kind='Status', code=410, message='too old resource version')
+                    pending = [dict(type='ERROR', object=gone)]
+                    since = None
+                else:
+                    pending = list()
+            else:
+                since = self.resource_version
+                pending = [dict(type='ADDED', object=copy.deepcopy(o)) for o in self.objects[resource].values()
+                           if self._matches(o, selector)]
+
+        for event in pending:
+            yield event
+
+        while since is not None:
+            with self._lock:
+                pending = [e for e in self.events if e[0] > since]
+                dropped = self.drops != drops
+                if not pending and not dropped:
+                    if self.stopped or (deadline is not None and time.time() >= deadline):
+                        return
+                    self._lock.wait(0.05)
+                    continue
+            if dropped:
+                yield None
+                return
+            for rv, res, event_type, obj in pending:
+                since = rv
+                if res == resource and self._matches(obj, selector):
+                    yield dict(type=event_type, object=obj)
+
+    @staticmethod
+    def _matches(obj, selector):
+        if not selector:
+            return True
+        labels = obj.get('metadata', dict()).get('labels', dict())
+        for term in selector.split(','):
+            k, v = term.split('=', 1)
+            if labels.get(k) != v:
+                return False
+        return True
+
+    @staticmethod
+    def merge_patch(target, patch):
+        # RFC 7386; strategic merge patches are applied the same way, which is enough for maps and scalars.
+        if not isinstance(patch, dict):
+            return copy.deepcopy(patch)
+        result = dict(target) if isinstance(target, dict) else dict()
+        for key, value in patch.items():
+            if value is None:
+                result.pop(key, None)
+            else:
+                result[key] = FakeApiServer.merge_patch(result.get(key), value)
+        return result
+
+    @staticmethod
+    def json_patch(target, operations):
+        # RFC 6902 add, replace and remove; list indices must exist, '-' isn't supported.
+        result = copy.deepcopy(target)
+        for operation in operations:
+            keys = [k.replace('~1', '/').replace('~0', '~') for k in operation['path'].lstrip('/').split('/')]
+            keys = [int(k) if k.isdigit() else k for k in keys]
+            parent = result
+            for key in keys[:-1]:
+                parent = parent[key]
+            if operation['op'] == 'remove':
+                del parent[keys[-1]]
+            elif operation['op'] in ['add', 'replace']:
+                parent[keys[-1]] = operation['value']
+            else:
+                raise ValueError(operation['op'])
+        return result
+
+    def handle_scale(self, method, resource, name, body):
+        if resource != 'replicationcontrollers':
+            return 404, dict(kind='Status', code=404, message='no scale subresource')
+        store = self.objects[resource]
+        if name not in store:
+            return 404, dict(kind='Status', code=404, message='{0} not found'.format(name))
+        if method == 'PUT':
+            rc = copy.deepcopy(store[name])
+            rc['spec']['replicas'] = body['spec']['replicas']
+            self.add(resource, rc)
+        elif method != 'GET':
+            return 405, dict(kind='Status', code=405, message='method not allowed')
+        rc = store[name]
+        selector = ','.join('{0}={1}'.format(k, v) for k, v in sorted(rc['spec'].get('selector', dict()).items()))
+        status = dict(replicas=rc.get('status', dict()).get('replicas', 0))
+        if self.scale_selectors:
+            status['selector'] = selector
+        return 200, dict(
+            kind='Scale',
+            apiVersion='autoscaling/v1',
+            metadata=dict(name=name, namespace=rc['metadata'].get('namespace'),
+                          resourceVersion=rc['metadata']['resourceVersion']),
+            spec=dict(replicas=rc['spec'].get('replicas', 0)),
+            status=status
+        )
+
+    def handle(self, method, resource, name, params, body, content_type=None):
+        if resource not in self.objects:
+            return 404, dict(kind='Status', code=404, message='unknown resource')
+        store = self.objects[resource]
+
+        if method == 'GET' and name is None:
+            items = [o for o in store.values() if self._matches(o, params.get('labelSelector'))]
+            items.sort(key=lambda o: o['metadata']['name'])
+            meta = dict(resourceVersion=str(self.resource_version))
+            if 'continue' in params:
+                # tokens look like '<resourceVersion>:<last name returned>'.
+                since, last = params['continue'].split(':', 1)
+                if int(since) < self.compacted:
+                    return 410, dict(kind='Status', code=410, message='continue token expired')
+                items = [o for o in items if o['metadata']['name'] > last]
+            if 'limit' in params and len(items) > int(params['limit']):
+                items = items[:int(params['limit'])]
+                meta['continue'] = '{0}:{1}'.format(self.resource_version, items[-1]['metadata']['name'])
+            return 200, dict(kind=KINDS[resource] + 'List', apiVersion='v1', metadata=meta, items=items)
+
+        if method == 'GET':
+            if name not in store:
+                return 404, dict(kind='Status', code=404, message='{0} not found'.format(name))
+            return 200, store[name]
+
+        if method == 'POST':
+            if body['metadata']['name'] in store:
+                return 409, dict(kind='Status', code=409, message='already exists')
+            return 201, self.add(resource, body)
+
+        if method == 'PUT':
+            if name not in store:
+                return 404, dict(kind='Status', code=404, message='{0} not found'.format(name))
+            return 200, self.add(resource, body)
+
+        if method == 'PATCH':
+            if name not in store:
+                return 404, dict(kind='Status', code=404, message='{0} not found'.format(name))
+            if content_type in ['application/merge-patch+json', 'application/strategic-merge-patch+json']:
+                patched = self.merge_patch(store[name], body)
+            elif content_type == 'application/json-patch+json':
+                try:
+                    patched = self.json_patch(store[name], body)
+                except (KeyError, ValueError):
+                    return 422, dict(kind='Status', code=422, message='invalid json patch')
+            else:
+                return 415, dict(kind='Status', code=415, message='unsupported patch type')
+            return 200, self.add(resource, patched)
+
+        if method == 'DELETE':
+            if name not in store:
+                return 404, dict(kind='Status', code=404, message='{0} not found'.format(name))
+            return 200, self.delete(resource, name)
+
+        return 405, dict(kind='Status', code=405, message='method not allowed')
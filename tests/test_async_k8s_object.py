@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import threading
+import time
+import unittest
+from kubernetes import K8sConfig, K8sInformer, K8sReplicationController, AsyncK8sObject, AsyncK8sPod, \
+    AsyncK8sReplicationController, AsyncK8sSecret, AsyncK8sService
+from kubernetes.models.v1 import Pod
+from kubernetes.utils import Future
+from kubernetes.K8sExceptions import NotFoundException, TimeoutException
+from tests.fake_apiserver import FakeApiServer
+
+
+def client_threads():
+    return len([t for t in threading.enumerate() if t.name.startswith(('WorkerPool', 'K8sInformer'))])
+
+
+def fake_pod(name=None, labels=None, ready=False):
+    pod = dict(
+        metadata=dict(name=name, namespace='default', labels=labels),
+        spec=dict(containers=[]),
+        status=dict(phase='Pending', conditions=[dict(type='Ready', status='False')])
+    )
+    if ready:
+        pod['status'] = dict(phase='Running', conditions=[dict(type='Ready', status='True')])
+    return pod
+
+
+class AsyncK8sObjectTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeApiServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.api_host, async_workers=4)
+
+    def tearDown(self):
+        informers = K8sInformer.stop_shared(config=self.config)
+        self.server.stop()
+        for informer in informers:
+            informer.join(timeout=5)
+        self.config.worker_pool.close(timeout=5)
+
+    # ------------------------------------------------------------------------------------- object
+
+    def test_init_invalid_obj(self):
+        try:
+            AsyncK8sObject(obj=object())
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_local_calls_chain(self):
+        pod = AsyncK8sPod(config=self.config, name='yopod')
+        self.assertIs(pod, pod.add_label(k='app', v='yo'))
+        self.assertEqual('yo', pod.get_label(k='app'))
+        self.assertEqual('yopod', pod.name)
+
+    def test_create_get_delete(self):
+        pod = AsyncK8sPod(config=self.config, name='yopod').add_label(k='app', v='yo')
+        future = pod.create()
+        self.assertIsInstance(future, Future)
+        self.assertIs(pod, future.result(timeout=5))
+        fetched = AsyncK8sPod(config=self.config, name='yopod')
+        self.assertIs(fetched, fetched.get().result(timeout=5))
+        self.assertIsInstance(fetched.model, Pod)
+        self.assertEqual('yo', fetched.get_label(k='app'))
+        fetched.delete().result(timeout=5)
+        self.assertIsInstance(AsyncK8sPod(config=self.config, name='yopod').get().exception(timeout=5),
+                              NotFoundException)
+
+    def test_update(self):
+        pod = AsyncK8sPod(config=self.config, name='yopod')
+        pod.create().result(timeout=5)
+        self.server.reset_counters()
+        self.assertIs(pod, pod.update().result(timeout=5))
+        self.assertEqual(0, len(self.server.requests))
+        self.assertIs(pod, pod.update(force=True).result(timeout=5))
+        self.assertEqual(['PUT'], [r[0] for r in self.server.requests])
+        future = pod.add_label(k='app', v='yo').update_changes()
+        self.assertIsInstance(future, Future)
+        self.assertIs(pod, future.result(timeout=5))
+        self.assertEqual(['PUT', 'PATCH'], [r[0] for r in self.server.requests])
+        self.assertEqual('yo', self.server.objects['pods']['yopod']['metadata']['labels']['app'])
+
+    def test_patch(self):
+        pod = AsyncK8sPod(config=self.config, name='yopod')
+        pod.create().result(timeout=5)
+        future = pod.patch_labels(labels=dict(app='yo'))
+        self.assertIsInstance(future, Future)
+        self.assertIs(pod, future.result(timeout=5))
+        self.assertIs(pod, pod.patch_annotations(annotations=dict(note='yo')).result(timeout=5))
+        self.assertIs(pod, pod.patch(data=dict(metadata=dict(labels=dict(tier='web')))).result(timeout=5))
+        stored = self.server.objects['pods']['yopod']['metadata']
+        self.assertEqual('yo', stored['labels']['app'])
+        self.assertEqual('web', stored['labels']['tier'])
+        self.assertEqual('yo', stored['annotations']['note'])
+        self.assertEqual('web', pod.get_label(k='tier'))
+
+    def test_many_concurrent_calls(self):
+        for i in range(200):
+            self.server.add('services', dict(metadata=dict(name='svc-{0}'.format(i), namespace='default'), spec=dict()))
+        futures = [AsyncK8sService(config=self.config, name='svc-{0}'.format(i)).get() for i in range(200)]
+        services = Future.gather(futures).result(timeout=30)
+        self.assertEqual(['svc-{0}'.format(i) for i in range(200)], [svc.name for svc in services])
+        self.assertEqual(4, client_threads())
+        self.assertLessEqual(self.server.connections, 4)
+
+    def test_get_by_labels(self):
+        for i in range(5):
+            self.server.add('pods', fake_pod(name='yopod-{0}'.format(i), labels=dict(name='yo')))
+        pods = AsyncK8sPod.get_by_labels(config=self.config, labels=dict(name='yo')).result(timeout=5)
+        self.assertEqual(5, len(pods))
+        self.assertIsInstance(pods[0], AsyncK8sPod)
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_secret_create(self):
+        secret = AsyncK8sSecret(config=self.config, name='yosecret')
+        secret.create().result(timeout=5)
+        self.assertIn('yosecret', self.server.objects['secrets'])
+
+    # ------------------------------------------------------------------------------------- rc
+
+    def test_rc_wait_for_replicas(self):
+        rcs = [AsyncK8sReplicationController(config=self.config, name='rc-{0}'.format(i)) for i in range(50)]
+        progress = list()
+        futures = [rc.wait_for_replicas(replicas=2, timeout=10, callback=lambda *args: progress.append(args))
+                   for rc in rcs]
+        for i, rc in enumerate(rcs):
+            for j in range(2):
+                self.server.add('pods', fake_pod(name='rc-{0}-{1}'.format(i, j), labels=rc.get_pod_labels(),
+                                                 ready=True))
+        self.assertEqual(rcs, Future.gather(futures).result(timeout=10))
+        self.assertIn((2, 2, 2), progress)
+        # the workers, one timer and one informer, whatever the number of waits.
+        self.assertLessEqual(client_threads(), 6)
+        watches = [r for r in self.server.requests if r[2].get('watch') == 'true']
+        self.assertEqual(1, len(watches))
+
+    def test_rc_wait_for_replicas_timeout(self):
+        rc = AsyncK8sReplicationController(config=self.config, name='yorc')
+        future = rc.wait_for_replicas(replicas=1, timeout=0.2)
+        self.assertIsInstance(future.exception(timeout=5), TimeoutException)
+
+    def test_rc_wait_for_replicas_before_sync_holds_no_worker(self):
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.api_host, async_workers=1)
+        self.server.fail_next(status=500, count=1000)
+        rc = AsyncK8sReplicationController(config=self.config, name='yorc')
+        futures = [rc.wait_for_replicas(replicas=0) for i in range(2)]
+        self.assertEqual('free', self.config.worker_pool.submit(lambda: 'free').result(timeout=5))
+        self.assertFalse(any(future.done() for future in futures))
+
+        # the informer's next list succeeds, and resolves the waits.
+        self.server.failures = list()
+        self.assertEqual([rc, rc], Future.gather(futures).result(timeout=10))
+
+    def test_rc_resize(self):
+        rc = AsyncK8sReplicationController(config=self.config, name='yorc', replicas=1)
+        rc.create().result(timeout=5)
+        future = rc.resize(replicas=2, timeout=10)
+        for j in range(2):
+            self.server.add('pods', fake_pod(name='yorc-{0}'.format(j), labels=rc.get_pod_labels(), ready=True))
+        self.assertIs(rc, future.result(timeout=10))
+        self.assertEqual(2, rc.obj.get_replicas())
+        self.assertEqual(2, self.server.objects['replicationcontrollers']['yorc']['spec']['replicas'])
+        self.assertIn('/api/v1/namespaces/default/replicationcontrollers/yorc/scale',
+                      [r[1] for r in self.server.requests])
+
+    def test_rc_resize_without_scale_selector(self):
+        self.server.run_controllers = True
+        self.server.scale_selectors = False
+        K8sReplicationController(config=self.config, name='yorc', image='redis', replicas=0).create()
+        rc = AsyncK8sReplicationController(config=self.config, name='yorc')
+        self.assertIs(rc, rc.resize(replicas=2, timeout=5).result(timeout=10))
+        self.assertEqual(2, len(self.server.objects['pods']))
+
+    def test_rc_scale(self):
+        rc = AsyncK8sReplicationController(config=self.config, name='yorc', replicas=1)
+        rc.create().result(timeout=5)
+        future = rc.set_scale(replicas=3)
+        self.assertIsInstance(future, Future)
+        self.assertEqual(3, future.result(timeout=5)['spec']['replicas'])
+        future = rc.get_scale()
+        self.assertIsInstance(future, Future)
+        self.assertEqual(3, future.result(timeout=5)['spec']['replicas'])
+
+    def test_rc_scale_patch(self):
+        rc = AsyncK8sReplicationController(config=self.config, name='yorc', replicas=1)
+        rc.create().result(timeout=5)
+        future = rc.scale_patch(replicas=2)
+        self.assertIsInstance(future, Future)
+        self.assertIs(rc, future.result(timeout=5))
+        self.assertEqual(2, rc.obj.get_replicas())
+        self.assertEqual(2, self.server.objects['replicationcontrollers']['yorc']['spec']['replicas'])
+
+    def test_rc_resize_many(self):
+        rcs = [AsyncK8sReplicationController(config=self.config, name='yorc-{0}'.format(i), replicas=1)
+               for i in range(20)]
+        Future.gather([rc.create() for rc in rcs]).result(timeout=5)
+        futures = [rc.resize(replicas=0, timeout=10) for rc in rcs]
+        self.assertEqual(rcs, Future.gather(futures).result(timeout=10))
+        self.assertTrue(all(future.done() for future in futures))
+        for i in range(20):
+            self.assertEqual(0, self.server.objects['replicationcontrollers']['yorc-{0}'.format(i)]['spec']['replicas'])
+
+    def test_rc_rolling_update(self):
+        self.server.run_controllers = True
+        K8sReplicationController(config=self.config, name='yorc', image='redis', replicas=4).create()
+        steps = list()
+        future = AsyncK8sReplicationController.rolling_update(config=self.config, name='yorc', image='nginx',
+                                                              max_surge=2, timeout=10, callback=steps.append)
+        rc = future.result(timeout=10)
+        self.assertEqual('yorc', rc.name)
+        stored = self.server.objects['replicationcontrollers']
+        self.assertEqual(['yorc'], list(stored))
+        self.assertEqual('nginx', stored['yorc']['spec']['template']['spec']['containers'][0]['image'])
+        pods = list(self.server.objects['pods'].values())
+        self.assertEqual(['nginx'] * 4, [pod['spec']['containers'][0]['image'] for pod in pods])
+        self.assertEqual(4, steps[-1]['new_replicas'])
+
+    def test_rc_rolling_update_holds_no_worker(self):
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.api_host, async_workers=1)
+        self.server.run_controllers = True
+        K8sReplicationController(config=self.config, name='yorc', image='redis', replicas=2).create()
+        self.server.run_controllers = False
+        future = AsyncK8sReplicationController.rolling_update(config=self.config, name='yorc', image='nginx',
+                                                              timeout=10)
+
+        # the new RC is scaled up but gets no pods: the update waits for them, without the pool's only worker.
+        stored = self.server.objects['replicationcontrollers']
+        deadline = time.time() + 5
+        while 'yorc-next' not in stored or stored['yorc-next']['spec']['replicas'] == 0:
+            self.assertLess(time.time(), deadline)
+            time.sleep(0.05)
+        self.assertEqual('free', self.config.worker_pool.submit(lambda: 'free').result(timeout=5))
+        self.assertFalse(future.done())
+
+        self.server.run_controllers = True
+        self.server.add('replicationcontrollers', stored['yorc-next'])
+        self.assertEqual('yorc', future.result(timeout=10).name)
+        self.assertEqual(['yorc'], list(stored))
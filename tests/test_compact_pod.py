@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import unittest
+from kubernetes.models.v1 import CompactPod, CompactPodStatus, CompactProbe, Pod, PodStatus
+from kubernetes.utils import copy_model
+
+
+class CompactPodTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = dict(
+            kind='Pod',
+            apiVersion='v1',
+            metadata=dict(name='yopod', namespace='default', uid='6e2f1c1e-0007-11e6-8b6e-0800272f9cda',
+                          resourceVersion='100007', labels=dict(name='frontend')),
+            spec=dict(
+                containers=[dict(name='nginx', image='nginx:1.11', livenessProbe=dict(
+                    tcpSocket=dict(port=80), initialDelaySeconds=1, timeoutSeconds=3, periodSeconds=15,
+                    successThreshold=1, failureThreshold=2))],
+                restartPolicy='Always',
+                nodeName='node-7',
+                serviceAccountName='default',
+                terminationGracePeriodSeconds=30
+            ),
+            status=dict(
+                phase='Running',
+                conditions=[dict(type='Ready', status='True')],
+                hostIP='10.0.0.7',
+                podIP='172.17.0.7',
+                startTime='2016-07-01T12:00:00Z',
+                containerStatuses=[dict(name='nginx', ready=True, restartCount=0, image='nginx:1.11')]
+            )
+        )
+        self.pod = CompactPod(model=self.model)
+        self.full = Pod(model=copy_model(self.model))
+
+    def test_init_invalid_model(self):
+        try:
+            CompactPod(model=None)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_compact(self):
+        self.assertFalse(hasattr(self.pod, '__dict__'))
+        try:
+            self.pod.yo = 'yo'
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, AttributeError)
+
+    def test_model_not_mutated(self):
+        before = copy_model(self.model)
+        self.pod.get_pod_containers()
+        self.pod.get_pod_status().get_container_statuses()
+        self.assertEqual(before, self.model)
+        self.assertIs(self.model, self.pod.get())
+        self.assertEqual('6e2f1c1e-0007-11e6-8b6e-0800272f9cda', self.pod.pod_metadata.get_uid())
+
+    def test_pod_getters(self):
+        for getter in ['get_pod_annotations', 'get_pod_labels', 'get_pod_name', 'get_pod_namespace',
+                       'get_pod_node_name', 'get_pod_node_selector', 'get_pod_restart_policy',
+                       'get_service_account', 'get_termination_grace_period']:
+            self.assertEqual(getattr(self.full, getter)(), getattr(self.pod, getter)())
+        self.assertEqual('frontend', self.pod.get_pod_label('name'))
+        self.assertIsNone(self.pod.get_pod_annotation('yokey'))
+        self.assertEqual([c['image'] for c in self.full.get_pod_containers()],
+                         [c['image'] for c in self.pod.get_pod_containers()])
+
+    def test_children(self):
+        container = self.pod.pod_spec.get_containers()[0]
+        self.assertEqual('nginx', container.get_name())
+        self.assertEqual('nginx:1.11', container.get_image())
+        self.assertIsNone(container.get_readiness_probe())
+        probe = container.get_liveness_probe()
+        self.assertIsInstance(probe, CompactProbe)
+        self.assertEqual(dict(port=80), probe.get_handler())
+        self.assertEqual(2, probe.get_failure_threshold())
+
+    def test_status(self):
+        status = self.pod.get_pod_status()
+        self.assertIsInstance(status, CompactPodStatus)
+        full = self.full.get_pod_status()
+        self.assertIsInstance(full, PodStatus)
+        for getter in ['get_pod_phase', 'get_pod_conditions', 'get_host_ip', 'get_pod_ip', 'get_start_time']:
+            self.assertEqual(getattr(full, getter)(), getattr(status, getter)())
+        statuses = status.get_container_statuses()
+        self.assertEqual(1, len(statuses))
+        self.assertTrue(statuses[0].is_ready())
+        self.assertEqual(0, statuses[0].get_restart_count())
+        self.assertIsNone(CompactPod(model=dict(metadata=dict(), spec=dict())).get_pod_status())
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import json
+import unittest
+from kubernetes.utils import convert, decode
+
+
+class ConvertDataTest(unittest.TestCase):
+
+    def test_decode_matches_convert(self):
+        doc = json.dumps(dict(
+            kind='PodList',
+            items=[dict(metadata=dict(name='yo', labels=dict(a='b')),
+                        spec=dict(args=['-g', ['x', 1]], n=1.5, ok=True))],
+            metadata=dict(), empty=None
+        ))
+        decoded = decode(doc)
+        self.assertEqual(convert(json.loads(doc)), decoded)
+        self.assertIsInstance(decoded['items'][0]['metadata']['name'], str)
+        self.assertIsInstance(decoded['items'][0]['spec']['args'][0], str)
+        self.assertIsInstance(decoded['items'][0]['spec']['args'][1][0], str)
+        self.assertIsInstance(decoded.keys()[0], str)
+
+    def test_decode_top_level(self):
+        self.assertEqual(['a', 1], decode('["a", 1]'))
+        self.assertIsInstance(decode('["a"]')[0], str)
+        self.assertIsInstance(decode('"a"'), str)
+        self.assertEqual(3, decode('3'))
+
+    def test_decode_non_ascii(self):
+        decoded = decode(u'{"name": "caf\\u00e9"}')
+        self.assertEqual(u'café'.encode('utf-8'), decoded['name'])
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import itertools
+import unittest
+from kubernetes import K8sConfig, K8sObject
+from kubernetes.K8sExceptions import ResponseTooLargeException
+from tests.fake_apiserver import FakeApiServer
+
+
+def fake_pod(name=None, padding=0):
+    return dict(
+        metadata=dict(name=name, namespace='default', labels=dict(name=name), annotations=dict(pad='x' * padding)),
+        spec=dict(containers=[])
+    )
+
+
+class HttpRequestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeApiServer().start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _object(self, max_body_size=None):
+        config = K8sConfig(kubeconfig=None, api_host=self.server.api_host, max_body_size=max_body_size)
+        return K8sObject(config=config, name='yopod', obj_type='Pod')
+
+    def test_config_invalid_max_body_size(self):
+        try:
+            K8sConfig(kubeconfig=None, max_body_size=0)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_body_read_as_bytes(self):
+        for i in range(50):
+            self.server.add('pods', fake_pod(name='yopod-{0}'.format(i), padding=2000))
+        obj = self._object()
+        for i in range(3):
+            pods = obj.get_list()
+            self.assertEqual(50, len(pods['items']))
+            self.assertIsInstance(pods['items'][0]['metadata']['name'], str)
+        self.assertEqual(1, self.server.connections)
+
+    def test_body_too_large(self):
+        for i in range(10):
+            self.server.add('pods', fake_pod(name='yopod-{0}'.format(i), padding=1000))
+        obj = self._object(max_body_size=5000)
+        try:
+            obj.get_list()
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, ResponseTooLargeException)
+        # a refused response doesn't poison the pool for the next, smaller one.
+        self.assertEqual(1, len(obj.get_list(data=dict(labelSelector='name=yopod-1'))['items']))
+
+    def test_stream_document_spanning_chunks(self):
+        obj = self._object()
+        start = str(self.server.resource_version)
+        self.server.add('pods', fake_pod(name='yopod-0', padding=50000))
+        self.server.add('pods', fake_pod(name='yopod-1'))
+        events = list(itertools.islice(obj.watch(resource_version=start, timeout=5), 2))
+        self.assertEqual(50000, len(events[0]['object']['metadata']['annotations']['pad']))
+        self.assertEqual('yopod-1', events[1]['object']['metadata']['name'])
+
+    def test_stream_document_too_large(self):
+        obj = self._object(max_body_size=20000)
+        start = str(self.server.resource_version)
+        self.server.add('pods', fake_pod(name='yopod-0', padding=50000))
+        try:
+            list(itertools.islice(obj.watch(resource_version=start, timeout=5), 1))
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, ResponseTooLargeException)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import copy
+import time
+import unittest
+from kubernetes import K8sConfig, K8sService
+from kubernetes.utils import HttpSession
+from tests.fake_apiserver import FakeApiServer
+
+
+class HttpSessionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeApiServer().start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _config(self, **kwargs):
+        return K8sConfig(kubeconfig=None, api_host=self.server.api_host, **kwargs)
+
+    # ------------------------------------------------------------------------------------- init
+
+    def test_init_invalid_pool_connections(self):
+        try:
+            HttpSession(pool_connections=0)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_init_invalid_pool_maxsize(self):
+        try:
+            HttpSession(pool_maxsize="yo")
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_init_invalid_idle_timeout(self):
+        try:
+            HttpSession(idle_timeout=-1)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_config_owns_session(self):
+        config = self._config(pool_maxsize=4)
+        self.assertIsInstance(config.session, HttpSession)
+        self.assertEqual(4, config.session.pool_maxsize)
+
+    def test_deepcopy_shares_session(self):
+        config = self._config()
+        self.assertIs(config.session, copy.deepcopy(config).session)
+
+    # ------------------------------------------------------------------------------------- reuse
+
+    def test_objects_reuse_connection(self):
+        config = self._config()
+        for i in range(5):
+            K8sService(config=config, name="yoservice-{0}".format(i)).create()
+        for i in range(5):
+            K8sService(config=config, name="yoservice-{0}".format(i)).get()
+        stats = config.session.get_stats()
+        self.assertEqual(10, stats['requests'])
+        self.assertEqual(1, stats['connections_opened'])
+        self.assertEqual(9, stats['connections_reused'])
+        self.assertEqual(1, self.server.connections)
+
+    def test_idle_eviction(self):
+        config = self._config(pool_idle_timeout=0.05)
+        K8sService(config=config, name="yoservice").create()
+        time.sleep(0.1)
+        K8sService(config=config, name="yoservice").get()
+        stats = config.session.get_stats()
+        self.assertEqual(1, stats['evictions'])
+        self.assertEqual(2, stats['connections_opened'])
+        self.assertEqual(0, stats['connections_reused'])
+        self.assertEqual(2, self.server.connections)
+
+    def test_close(self):
+        config = self._config()
+        K8sService(config=config, name="yoservice").create()
+        config.session.close()
+        K8sService(config=config, name="yoservice").get()
+        stats = config.session.get_stats()
+        self.assertEqual(2, stats['requests'])
+        self.assertEqual(2, stats['connections_opened'])
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import json
+import os
+import unittest
+from kubernetes import K8sConfig, K8sService
+from kubernetes.utils import JsonCodec, get_codec
+from kubernetes.utils.JsonCodec import JSON_CODEC_ENV
+from tests.fake_apiserver import FakeApiServer
+
+try:
+    import simplejson
+    HAS_SIMPLEJSON = True
+except ImportError:
+    HAS_SIMPLEJSON = False
+
+DOC = dict(kind='Service', metadata=dict(name='yo', labels=dict(a='b')),
+           spec=dict(ports=[dict(port=80)], ips=['1.2.3.4']))
+
+
+class JsonCodecTest(unittest.TestCase):
+
+    def setUp(self):
+        self.env = os.environ.pop(JSON_CODEC_ENV, None)
+
+    def tearDown(self):
+        os.environ.pop(JSON_CODEC_ENV, None)
+        if self.env is not None:
+            os.environ[JSON_CODEC_ENV] = self.env
+
+    def _check(self, codec):
+        encoded = codec.dumps(DOC)
+        self.assertIsInstance(encoded, str)
+        self.assertEqual(DOC, json.loads(encoded))
+        decoded = codec.loads(encoded)
+        self.assertEqual(DOC, decoded)
+        self.assertIsInstance(decoded['metadata']['name'], str)
+        self.assertIsInstance(decoded['spec']['ips'][0], str)
+        self.assertIsInstance(decoded.keys()[0], str)
+        self.assertIsInstance(codec.loads(unicode(encoded))['kind'], str)
+        accented = codec.loads('{"caf\\u00e9":"\\u00e9t\\u00e9","l":["\\u00e9",["\\u00e9"]]}')
+        self.assertEqual({'caf\xc3\xa9': '\xc3\xa9t\xc3\xa9', 'l': ['\xc3\xa9', ['\xc3\xa9']]}, accented)
+        self.assertIsInstance(accented['caf\xc3\xa9'], str)
+        self.assertIsInstance(accented['l'][1][0], str)
+        self.assertEqual('\xc3\xa9', codec.loads('"\\u00e9"'))
+
+    def test_invalid_name(self):
+        try:
+            JsonCodec(name='yo')
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_stdlib(self):
+        codec = get_codec('stdlib')
+        self.assertEqual('stdlib', codec.name)
+        self._check(codec)
+
+    @unittest.skipIf(not HAS_SIMPLEJSON, 'simplejson is not installed')
+    def test_simplejson(self):
+        codec = get_codec('simplejson')
+        self.assertEqual('simplejson', codec.name)
+        self._check(codec)
+
+    def test_auto(self):
+        codec = get_codec()
+        self.assertEqual('simplejson' if HAS_SIMPLEJSON else 'stdlib', codec.name)
+        self.assertIs(codec, get_codec('auto'))
+
+    def test_env(self):
+        os.environ[JSON_CODEC_ENV] = 'stdlib'
+        self.assertEqual('stdlib', get_codec().name)
+        os.environ[JSON_CODEC_ENV] = 'yo'
+        try:
+            get_codec()
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_config(self):
+        config = K8sConfig(kubeconfig=None, json_codec='stdlib')
+        self.assertEqual('stdlib', config.json_codec.name)
+        try:
+            K8sConfig(kubeconfig=None, json_codec='yo')
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_round_trip(self):
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host, json_codec='stdlib')
+            svc = K8sService(config=config, name='yosvc')
+            self.assertEqual(svc.model.get(), json.loads(svc.as_json()))
+            svc.create()
+            self.assertEqual('yosvc', server.objects['services']['yosvc']['metadata']['name'])
+            self.assertEqual('yosvc', K8sService(config=config, name='yosvc').get().name)
+        finally:
+            server.stop()
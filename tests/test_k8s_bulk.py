@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import unittest
+from kubernetes import K8sConfig, K8sBulk, K8sService, K8sSecret, AsyncK8sService
+from kubernetes.K8sExceptions import NotFoundException, ConflictException
+from tests.fake_apiserver import FakeApiServer
+
+
+class K8sBulkTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeApiServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.api_host)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _services(self, count=0):
+        return [K8sService(config=self.config, name='svc-{0}'.format(i)) for i in range(count)]
+
+    # ------------------------------------------------------------------------------------- init
+
+    def test_init_invalid_objects(self):
+        try:
+            K8sBulk(objects=[object()])
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_init_invalid_action(self):
+        try:
+            K8sBulk(objects=[], action='yo')
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_init_invalid_concurrency(self):
+        try:
+            K8sBulk(objects=[], concurrency=0)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    # ------------------------------------------------------------------------------------- run
+
+    def test_create_many(self):
+        objects = self._services(100) + [K8sSecret(config=self.config, name='secret-{0}'.format(i)) for i in range(50)]
+        bulk = K8sBulk.apply_many(objects=objects, action='create', concurrency=8)
+        stats = bulk.get_stats()
+        self.assertEqual(150, stats['total'])
+        self.assertEqual(150, stats['succeeded'])
+        self.assertEqual(100, len(self.server.objects['services']))
+        self.assertEqual(50, len(self.server.objects['secrets']))
+        self.assertEqual([obj.name for obj in objects], [result['object'].name for result in bulk.results])
+        self.assertTrue(stats['p50'] <= stats['p90'] <= stats['p99'] <= stats['max'])
+        self.assertGreater(stats['throughput'], 0)
+        self.assertLessEqual(self.server.connections, 8)
+
+    def test_failures_do_not_abort(self):
+        self.server.add('services', dict(metadata=dict(name='svc-3', namespace='default'), spec=dict()))
+        bulk = K8sBulk.apply_many(objects=self._services(10), action='create', concurrency=4)
+        failures = bulk.get_failures()
+        self.assertEqual(1, len(failures))
+        self.assertEqual('svc-3', failures[0]['object'].name)
+        self.assertIsInstance(failures[0]['error'], ConflictException)
+        self.assertEqual(9, bulk.get_stats()['succeeded'])
+        self.assertEqual(10, len(self.server.objects['services']))
+
+    def test_apply(self):
+        self.server.add('services', dict(metadata=dict(name='svc-1', namespace='default'), spec=dict()))
+        objects = self._services(2) + [AsyncK8sService(config=self.config, name='svc-2')]
+        bulk = K8sBulk.apply_many(objects=objects, action='apply')
+        self.assertEqual(['create', 'update', 'create'], [result['action'] for result in bulk.results])
+        self.assertEqual(3, bulk.get_stats()['succeeded'])
+
+    def test_apply_keeps_server_fields(self):
+        self.server.add('services', dict(metadata=dict(name='svc-0', namespace='default'),
+                                         spec=dict(clusterIP='10.0.0.7', ports=[dict(port=80)])))
+        service = K8sService(config=self.config, name='svc-0').add_port(port=443, target_port=8443, name='https')
+        bulk = K8sBulk.apply_many(objects=[service], action='apply')
+        self.assertEqual(['update'], [result['action'] for result in bulk.results])
+        self.assertEqual(['POST', 'PATCH'], [r[0] for r in self.server.requests])
+        spec = self.server.objects['services']['svc-0']['spec']
+        self.assertEqual('10.0.0.7', spec['clusterIP'])
+        self.assertEqual([443], [port['port'] for port in spec['ports']])
+
+    def test_delete(self):
+        K8sBulk.apply_many(objects=self._services(5), action='create')
+        bulk = K8sBulk.apply_many(objects=self._services(6), action='delete', concurrency=2)
+        self.assertEqual(0, len(self.server.objects['services']))
+        self.assertEqual(1, bulk.get_stats()['failed'])
+        self.assertIsInstance(bulk.get_failures()[0]['error'], NotFoundException)
+
+    def test_empty(self):
+        stats = K8sBulk.apply_many(objects=[]).get_stats()
+        self.assertEqual(0, stats['total'])
+        self.assertIsNone(stats['p99'])
@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import importlib
+import time
+import unittest
+from kubernetes import K8sConfig, K8sInformer, K8sPod, K8sReplicationController
+from kubernetes.models.v1 import CompactPod
+from tests.fake_apiserver import FakeApiServer
+
+
+def fake_pod(name=None, labels=None, ready=False, node='node-1'):
+    pod = dict(
+        metadata=dict(name=name, namespace='default', labels=labels),
+        spec=dict(containers=[dict(name='c', image='nginx')], nodeName=node),
+        status=dict(phase='Pending', conditions=[dict(type='Ready', status='False')])
+    )
+    if ready:
+        pod['status'] = dict(phase='Running', conditions=[dict(type='Ready', status='True')])
+    return pod
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class K8sInformerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeApiServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.api_host)
+        self.informer = None
+        self.others = list()
+
+    def tearDown(self):
+        informers = [i for i in [self.informer] + self.others if i is not None]
+        for informer in informers:
+            informer.stop()
+        self.server.stop()
+        for informer in informers:
+            informer.join(timeout=5)
+
+    # ------------------------------------------------------------------------------------- init
+
+    def test_init_invalid_obj_type(self):
+        try:
+            K8sInformer(config=self.config, obj_type='Deployment')
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_init_invalid_labels(self):
+        try:
+            K8sInformer(config=self.config, labels=object())
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    # ------------------------------------------------------------------------------------- sync
+
+    def test_sync_and_watch(self):
+        for i in range(10):
+            self.server.add('pods', fake_pod(name='web-{0}'.format(i), labels=dict(name='web'), ready=i < 5))
+        self.informer = K8sInformer(config=self.config, obj_type='Pod', watch_window=1).start()
+        self.assertTrue(self.informer.wait_for_sync(timeout=5))
+        self.assertEqual(10, len(self.informer.store))
+
+        self.server.add('pods', fake_pod(name='web-10', labels=dict(name='web'), node='node-2'))
+        self.server.delete('pods', 'web-0')
+        self.assertTrue(wait_until(lambda: self.informer.store.get('web-0') is None))
+        self.assertEqual(10, len(self.informer.store))
+        self.assertEqual(1, len(self.informer.get_by_index(index='node_name', value='node-2')))
+
+        pod = self.informer.get('web-1')
+        self.assertIsInstance(pod, K8sPod)
+        self.assertTrue(pod.is_ready())
+        self.assertIsNotNone(self.informer.store.get('web-1')['metadata'].get('resourceVersion'))
+
+    def test_lookups_do_not_hit_server(self):
+        rc = K8sReplicationController(config=self.config, name='web')
+        for i in range(20):
+            self.server.add('pods', fake_pod(name='web-{0}'.format(i), labels=rc.get_selector(), ready=i % 2 == 0))
+        self.server.add('pods', fake_pod(name='db-0', labels=dict(name='db'), ready=True))
+        self.informer = K8sInformer(config=self.config, obj_type='Pod', watch_window=1).start()
+        self.assertTrue(self.informer.wait_for_sync(timeout=5))
+        self.assertTrue(wait_until(lambda: len(self.server.requests) == 2))
+
+        before = len(self.server.requests)
+        self.assertEqual(20, len(self.informer.get_pods_for_rc(rc=rc)))
+        self.assertEqual(10, len(self.informer.get_pods_for_rc(rc=rc, ready=True)))
+        self.assertEqual(1, len(self.informer.get_by_labels(labels=dict(name='db'))))
+        self.assertEqual(before, len(self.server.requests))
+
+    def test_compact_lookups(self):
+        for i in range(5):
+            self.server.add('pods', fake_pod(name='web-{0}'.format(i), labels=dict(name='web')))
+        self.server.add('pods', fake_pod(name='db-0', labels=dict(name='db'), node='node-2'))
+        self.informer = K8sInformer(config=self.config, obj_type='Pod', watch_window=1).start()
+        self.assertTrue(self.informer.wait_for_sync(timeout=5))
+
+        pod = self.informer.get_compact(name='db-0')
+        self.assertIsInstance(pod, CompactPod)
+        self.assertIs(self.informer.store.get(key='db-0'), pod.get())
+        self.assertEqual('node-2', pod.get_pod_node_name())
+        self.assertIsNone(self.informer.get_compact(name='yopod'))
+        self.assertEqual(6, len(self.informer.list_compact()))
+        self.assertEqual(5, len(self.informer.list_compact(labels=dict(name='web'))))
+
+    def test_pods_for_rc_copy_only_what_they_return(self):
+        rc = K8sReplicationController(config=self.config, name='web')
+        for i in range(10):
+            self.server.add('pods', fake_pod(name='web-{0}'.format(i), labels=rc.get_selector(), ready=i < 3))
+        self.informer = K8sInformer(config=self.config, obj_type='Pod', watch_window=1).start()
+        self.assertTrue(self.informer.wait_for_sync(timeout=5))
+
+        module = importlib.import_module('kubernetes.K8sInformer')
+        copies = list()
+        copy_model = module.copy_model
+
+        def counting_copy(obj):
+            copies.append(obj['metadata']['name'])
+            return copy_model(obj)
+
+        module.copy_model = counting_copy
+        try:
+            pods = self.informer.get_pods_for_rc(rc=rc, ready=True)
+            compact = self.informer.get_pods_for_rc(rc=rc, ready=False, compact=True)
+        finally:
+            module.copy_model = copy_model
+
+        self.assertEqual(['web-0', 'web-1', 'web-2'], sorted(copies))
+        self.assertTrue(all(pod.is_ready() and pod.model._snapshot is None for pod in pods))
+        self.assertEqual(7, len(compact))
+        self.assertTrue(all(isinstance(pod, CompactPod) for pod in compact))
+        shared = dict((pod.get_pod_name(), pod.get()) for pod in compact)
+        self.assertIs(self.informer.store.get(key='web-5'), shared['web-5'])
+
+    def test_compact_lookups_invalid_obj_type(self):
+        self.informer = K8sInformer(config=self.config, obj_type='Service')
+        try:
+            self.informer.list_compact()
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_relist_on_gone(self):
+        self.server.add('pods', fake_pod(name='web-0', labels=dict(name='web')))
+        self.informer = K8sInformer(config=self.config, obj_type='Pod', watch_window=1)
+        self.informer._list()
+        self.server.add('pods', fake_pod(name='web-1', labels=dict(name='web')))
+        self.server.compact()
+        self.informer.start()
+        self.assertTrue(wait_until(lambda: self.informer.store.get('web-1') is not None))
+        lists = [r for r in self.server.requests if r[2].get('watch') != 'true']
+        self.assertEqual(2, len(lists))
+
+    def test_relist_calls_sync_handlers(self):
+        synced = list()
+        self.informer = K8sInformer(config=self.config, obj_type='Pod', watch_window=1)
+        self.informer.add_sync_handler(lambda: synced.append(self.informer.store.get('web-1') is not None))
+        self.informer._list()
+        self.server.add('pods', fake_pod(name='web-1', labels=dict(name='web')))
+        self.server.compact()
+        self.informer.start()
+        self.assertTrue(wait_until(lambda: len(synced) == 2))
+        self.assertEqual([False, True], synced)
+
+    def test_handler(self):
+        events = list()
+        self.informer = K8sInformer(config=self.config, obj_type='Service', watch_window=1)
+        self.informer.add_handler(lambda event_type, obj: events.append((event_type, obj['metadata']['name'])))
+        self.informer.start()
+        self.assertTrue(self.informer.wait_for_sync(timeout=5))
+        self.server.add('services', dict(metadata=dict(name='svc', namespace='default'), spec=dict()))
+        self.assertTrue(wait_until(lambda: len(events) == 1))
+        self.assertEqual(('ADDED', 'svc'), events[0])
+
+    # ------------------------------------------------------------------------------------- shared
+
+    def test_shared(self):
+        self.informer = K8sInformer.shared(config=self.config, obj_type='Pod')
+        self.assertIs(self.informer, K8sInformer.shared(config=self.config, obj_type='Pod'))
+        self.assertTrue(self.informer.is_running())
+        other = K8sConfig(kubeconfig=None, api_host=self.server.api_host)
+        informer = K8sInformer.shared(config=other, obj_type='Pod')
+        self.others.append(informer)
+        self.assertIsNot(self.informer, informer)
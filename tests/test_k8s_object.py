@@ -7,11 +7,16 @@
 #
 
 import unittest
+import itertools
 import json
 import socket
 import os
+import threading
+import time
 from kubernetes import K8sObject, K8sConfig
-from kubernetes.K8sExceptions import UnprocessableEntityException, NotFoundException, BadRequestException
+from kubernetes.K8sExceptions import UnprocessableEntityException, NotFoundException, BadRequestException, \
+    GoneException
+from tests.fake_apiserver import FakeApiServer
 
 kubeconfig_fallback = '{0}/.kube/config'.format(os.path.abspath(os.path.dirname(os.path.realpath(__file__))))
 
@@ -481,3 +486,224 @@ class K8sObjectTest(unittest.TestCase):
                 obj.delete()
             except Exception as err:
                 self.assertIsInstance(err, NotFoundException)
+
+    # ------------------------------------------------------------------------------------- watch
+
+    @staticmethod
+    def _fake_pod(name=None, labels=None):
+        return dict(metadata=dict(name=name, namespace='default', labels=labels or dict(name=name)),
+                    spec=dict(containers=[]))
+
+    def test_object_watch_invalid_data(self):
+        obj = self._create_object(name="yomama", obj_type="Pod")
+        try:
+            next(obj.watch(data=object()))
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_object_watch_events(self):
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            server.add('pods', self._fake_pod(name='yopod-0'))
+            start = str(server.resource_version)
+            server.add('pods', self._fake_pod(name='yopod-1'))
+            server.add('pods', self._fake_pod(name='yopod-0', labels=dict(name='yopod-0', tier='web')))
+            server.delete('pods', 'yopod-1')
+
+            obj = K8sObject(config=config, name='yopod', obj_type='Pod')
+            events = list(itertools.islice(obj.watch(resource_version=start, timeout=5), 3))
+            self.assertEqual(['ADDED', 'MODIFIED', 'DELETED'], [e['type'] for e in events])
+            self.assertEqual(['yopod-1', 'yopod-0', 'yopod-1'], [e['object']['metadata']['name'] for e in events])
+            self.assertIsInstance(events[0]['object']['metadata']['name'], str)
+        finally:
+            server.stop()
+
+    def test_object_watch_label_selector(self):
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            server.add('pods', self._fake_pod(name='yopod-0', labels=dict(app='yo')))
+            server.add('pods', self._fake_pod(name='yopod-1', labels=dict(app='mama')))
+            obj = K8sObject(config=config, name='yopod', obj_type='Pod')
+            events = list(obj.watch(data=dict(labelSelector='app=yo'), timeout=0.5))
+            self.assertEqual(1, len(events))
+            self.assertEqual('yopod-0', events[0]['object']['metadata']['name'])
+        finally:
+            server.stop()
+
+    def test_object_watch_resumes_after_disconnect(self):
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            obj = K8sObject(config=config, name='yopod', obj_type='Pod')
+            start = str(server.resource_version)
+
+            def produce():
+                for i in range(6):
+                    server.add('pods', self._fake_pod(name='yopod-{0}'.format(i)))
+                    if i in [1, 3]:
+                        time.sleep(0.1)
+                        server.drop_watches()
+                    time.sleep(0.05)
+
+            producer = threading.Thread(target=produce)
+            producer.start()
+            names = list()
+            for event in obj.watch(resource_version=start, timeout=5):
+                names.append(event['object']['metadata']['name'])
+                if len(names) == 6:
+                    break
+            producer.join()
+
+            self.assertEqual(['yopod-{0}'.format(i) for i in range(6)], names)
+            watches = [r for r in server.requests if r[2].get('watch') == 'true']
+            self.assertEqual(3, len(watches))
+            self.assertEqual(start, watches[0][2]['resourceVersion'])
+            self.assertEqual('2', watches[1][2]['resourceVersion'])
+            self.assertEqual('4', watches[2][2]['resourceVersion'])
+            lists = [r for r in server.requests if r[2].get('watch') != 'true']
+            self.assertEqual(0, len(lists))
+        finally:
+            server.stop()
+
+    def test_object_watch_gone(self):
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            server.add('pods', self._fake_pod(name='yopod-0'))
+            server.add('pods', self._fake_pod(name='yopod-1'))
+            server.compact()
+            obj = K8sObject(config=config, name='yopod', obj_type='Pod')
+            try:
+                list(obj.watch(resource_version='1', timeout=1))
+                self.fail("Should not fail.")
+            except Exception as err:
+                self.assertIsInstance(err, GoneException)
+        finally:
+            server.stop()
+
+    # ------------------------------------------------------------------------------------- iter_list
+
+    def test_object_iter_list_invalid_page_size(self):
+        obj = self._create_object(name="yomama", obj_type="Pod")
+        try:
+            next(obj.iter_list(page_size=0))
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_object_iter_list(self):
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            for i in range(25):
+                server.add('pods', self._fake_pod(name='yopod-{0:02d}'.format(i), labels=dict(app='yo')))
+            server.add('pods', self._fake_pod(name='other', labels=dict(app='mama')))
+            obj = K8sObject(config=config, name='yopod', obj_type='Pod')
+            server.reset_counters()
+
+            items = obj.iter_list(page_size=10, data=dict(labelSelector='app=yo'))
+            names = [item['metadata']['name'] for item in items]
+            self.assertEqual(['yopod-{0:02d}'.format(i) for i in range(25)], names)
+            self.assertEqual(3, len(server.requests))
+            self.assertEqual(['10', '10', '10'], [r[2]['limit'] for r in server.requests])
+            self.assertNotIn('continue', server.requests[0][2])
+            self.assertIn('continue', server.requests[1][2])
+            self.assertEqual('app=yo', server.requests[2][2]['labelSelector'])
+        finally:
+            server.stop()
+
+    def test_object_iter_list_is_lazy(self):
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            for i in range(25):
+                server.add('pods', self._fake_pod(name='yopod-{0:02d}'.format(i)))
+            obj = K8sObject(config=config, name='yopod', obj_type='Pod')
+            server.reset_counters()
+            first = list(itertools.islice(obj.iter_list(page_size=10), 5))
+            self.assertEqual(5, len(first))
+            self.assertEqual(1, len(server.requests))
+        finally:
+            server.stop()
+
+    def test_object_iter_list_expired_token(self):
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            for i in range(5):
+                server.add('pods', self._fake_pod(name='yopod-{0}'.format(i)))
+            obj = K8sObject(config=config, name='yopod', obj_type='Pod')
+            items = obj.iter_list(page_size=2)
+            next(items)
+            server.add('pods', self._fake_pod(name='yopod-5'))
+            server.compact()
+            try:
+                list(items)
+                self.fail("Should not fail.")
+            except Exception as err:
+                self.assertIsInstance(err, GoneException)
+        finally:
+            server.stop()
+
+    # ------------------------------------------------------------------------------------- patch
+
+    def test_object_patch_invalid_type(self):
+        config = K8sConfig(kubeconfig=None)
+        obj = K8sObject(config=config, name='yopod', obj_type='Pod')
+        try:
+            obj.patch(data=dict(), patch_type='yotype')
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_object_patch_invalid_data(self):
+        config = K8sConfig(kubeconfig=None)
+        obj = K8sObject(config=config, name='yopod', obj_type='Pod')
+        for data, patch_type in [(None, 'merge'), (list(), 'strategic'), (dict(), 'json')]:
+            try:
+                obj.patch(data=data, patch_type=patch_type)
+                self.fail("Should not fail.")
+            except Exception as err:
+                self.assertIsInstance(err, SyntaxError)
+
+    def test_object_patch_nonexistent(self):
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            obj = K8sObject(config=config, name='yopod', obj_type='Pod')
+            try:
+                obj.patch_labels(labels=dict(app='yo'))
+                self.fail("Should not fail.")
+            except Exception as err:
+                self.assertIsInstance(err, NotFoundException)
+        finally:
+            server.stop()
+
+    def test_object_patch_labels(self):
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            server.add('pods', self._fake_pod(name='yopod', labels=dict(app='yo', tier='web')))
+            obj = K8sObject(config=config, name='yopod', obj_type='Pod')
+            server.reset_counters()
+            obj.patch_labels(labels=dict(tier=None, version='2'))
+            self.assertEqual(['PATCH'], [r[0] for r in server.requests])
+            stored = server.objects['pods']['yopod']
+            self.assertEqual(dict(app='yo', version='2'), stored['metadata']['labels'])
+            self.assertIn('spec', stored)
+        finally:
+            server.stop()
+
+    def test_object_patch_json(self):
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            server.add('pods', self._fake_pod(name='yopod', labels=dict(app='yo')))
+            obj = K8sObject(config=config, name='yopod', obj_type='Pod')
+            obj.patch(data=[dict(op='replace', path='/metadata/labels/app', value='mama')], patch_type='json')
+            self.assertEqual(dict(app='mama'), server.objects['pods']['yopod']['metadata']['labels'])
+        finally:
+            server.stop()
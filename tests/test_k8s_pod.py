@@ -6,10 +6,13 @@
 # file 'LICENSE.md', which is part of this source code package.
 #
 
+import importlib
+import itertools
 import unittest
 import os
 from kubernetes import K8sPod, K8sConfig
-from kubernetes.models.v1 import Pod, ObjectMeta, PodSpec
+from kubernetes.models.v1 import Pod, ObjectMeta, PodSpec, Container
+from tests.fake_apiserver import FakeApiServer
 
 kubeconfig_fallback = '{0}/.kube/config'.format(os.path.abspath(os.path.dirname(os.path.realpath(__file__))))
 
@@ -34,6 +37,16 @@ class K8sPodTest(unittest.TestCase):
         obj = K8sPod(config=config, name=name)
         return obj
 
+    @staticmethod
+    def _populate(server=None, name=None, count=0):
+        config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+        for i in range(count):
+            pod = K8sPod(config=config, name="{0}-{1}".format(name, i))
+            pod.add_label(k='name', v=name)
+            pod.create()
+        server.reset_counters()
+        return config
+
     # ------------------------------------------------------------------------------------- init
 
     def test_init_no_args(self):
@@ -619,11 +632,31 @@ class K8sPodTest(unittest.TestCase):
         except Exception as err:
             self.assertIsInstance(err, SyntaxError)
 
-    # TODO: requires http call
     def test_get_by_name(self):
-        # name = "yopod"
-        # pods = K8sPod.get_by_name(name=name)
-        pass
+        name = "yopod"
+        server = FakeApiServer().start()
+        try:
+            config = self._populate(server=server, name=name, count=5)
+            pods = K8sPod.get_by_name(config=config, name=name)
+            self.assertEqual(5, len(pods))
+            self.assertEqual(1, len(server.requests))
+            for pod in pods:
+                self.assertIsInstance(pod, K8sPod)
+                self.assertIsInstance(pod.model, Pod)
+                self.assertEqual(name, pod.get_label('name'))
+        finally:
+            server.stop()
+
+    def test_get_by_name_refetch(self):
+        name = "yopod"
+        server = FakeApiServer().start()
+        try:
+            config = self._populate(server=server, name=name, count=5)
+            pods = K8sPod.get_by_name(config=config, name=name, refetch=True)
+            self.assertEqual(5, len(pods))
+            self.assertEqual(6, len(server.requests))
+        finally:
+            server.stop()
 
     # ------------------------------------------------------------------------------------- get by labels
 
@@ -642,8 +675,90 @@ class K8sPodTest(unittest.TestCase):
         except Exception as err:
             self.assertIsInstance(err, SyntaxError)
 
-    # TODO: requires http call
     def test_get_by_labels(self):
-        # name = "yopod"
-        # pods = K8sPod.get_by_name(name=name)
-        pass
+        name = "yopod"
+        server = FakeApiServer().start()
+        try:
+            config = self._populate(server=server, name=name, count=200)
+            pods = K8sPod.get_by_labels(config=config, labels={'name': name})
+            self.assertEqual(200, len(pods))
+            self.assertEqual(1, len(server.requests))
+            self.assertEqual(sorted(p.name for p in pods), sorted(server.objects['pods'].keys()))
+        finally:
+            server.stop()
+
+    def test_get_by_labels_lazy_hydration(self):
+        name = "yopod"
+        server = FakeApiServer().start()
+        built = list()
+        base_model = importlib.import_module('kubernetes.models.v1.BaseModel')
+        original = dict(spec=PodSpec.__init__, container=Container.__init__, copy=base_model.copy_model)
+        try:
+            config = self._populate(server=server, name=name, count=20)
+            for pod in server.objects['pods'].values():
+                pod['spec']['containers'] = [dict(name='c', image='nginx', livenessProbe=dict(tcpSocket=dict(port=80)))]
+            PodSpec.__init__ = lambda *args, **kwargs: built.append('PodSpec') or original['spec'](*args, **kwargs)
+            Container.__init__ = lambda *args, **kwargs: \
+                built.append('Container') or original['container'](*args, **kwargs)
+            base_model.copy_model = lambda obj=None: built.append('copy') or original['copy'](obj)
+            pods = K8sPod.get_by_labels(config=config, labels={'name': name})
+            self.assertEqual([False] * 20, [p.is_ready() for p in pods])
+            # only the empty K8sPod get_by_labels() lists with builds a PodSpec, none of the 20 listed pods.
+            self.assertEqual(['PodSpec', 'PodSpec'], built)
+            for pod in pods:
+                self.assertNotIn('pod_spec', pod.model._children)
+                self.assertIsNone(pod.model._snapshot)
+        finally:
+            PodSpec.__init__ = original['spec']
+            Container.__init__ = original['container']
+            base_model.copy_model = original['copy']
+            server.stop()
+
+    # ------------------------------------------------------------------------------------- lazy hydration
+
+    def test_lazy_hydration(self):
+        model = dict(
+            metadata=dict(name="yopod", namespace='default', uid='yo-uid'),
+            spec=dict(containers=[dict(name="yopod", image="redis")]),
+            status=dict(phase='Running', conditions=[dict(type='Ready', status='True')])
+        )
+        pod = Pod(model=model).snapshot()
+        self.assertEqual("yopod", pod.get_pod_name())
+        self.assertNotIn('pod_spec', pod._children)
+        self.assertNotIn('pod_status', pod._children)
+        self.assertEqual('Running', pod.get_pod_status().get_pod_phase())
+        self.assertNotIn('pod_spec', pod._children)
+        self.assertFalse(pod.get_pod_containers()[0]['privileged'])
+        self.assertIsInstance(pod.pod_spec, PodSpec)
+        self.assertFalse(pod.is_dirty())
+        self.assertEqual([], pod.get()['spec']['volumes'])
+
+    def test_lazy_hydration_changes(self):
+        pod = Pod(model=Pod(name="yopod").get()).snapshot()
+        pod.set_pod_node_name(name="node-1")
+        pod.add_pod_label(k='tier', v='web')
+        self.assertEqual(dict(metadata=dict(labels=dict(tier='web')), spec=dict(nodeName='node-1')), pod.diff())
+
+    # ------------------------------------------------------------------------------------- watch by labels
+
+    def test_watch_by_labels_none_args(self):
+        try:
+            next(K8sPod.watch_by_labels())
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_watch_by_labels(self):
+        name = "yopod"
+        server = FakeApiServer().start()
+        try:
+            config = self._populate(server=server, name=name, count=2)
+            K8sPod(config=config, name="other").create()
+            events = list(itertools.islice(K8sPod.watch_by_labels(config=config, labels={'name': name}, timeout=5), 2))
+            self.assertEqual(['ADDED', 'ADDED'], [e[0] for e in events])
+            for event_type, pod in events:
+                self.assertIsInstance(pod, K8sPod)
+                self.assertIsInstance(pod.model, Pod)
+                self.assertEqual(name, pod.get_label('name'))
+        finally:
+            server.stop()
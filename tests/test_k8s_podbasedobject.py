@@ -266,6 +266,30 @@ class K8sPodBasedObjectTest(unittest.TestCase):
         self.assertEqual(1, len(podspec.containers))
         self.assertEqual(1, len(podspec.model['containers']))
 
+    def test_rc_add_many_containers(self):
+        name = "yoname"
+        obj = self._create_rc(name=name)
+        containers = [K8sContainer(name="yopod-{0}".format(i), image="busybox") for i in range(200)]
+        for c in containers:
+            obj.add_container(c)
+            obj.as_dict()
+        podspec = obj.model.model['spec']['template']['spec']
+        self.assertEqual(200, len(podspec['containers']))
+        for c, model in zip(containers, podspec['containers']):
+            self.assertIs(c.model.model, model)
+
+    def test_rc_container_changed_after_add(self):
+        name = "yoname"
+        obj = self._create_rc(name=name)
+        c = K8sContainer(name="yopod", image="busybox")
+        obj.add_container(c)
+        obj.as_dict()
+        c.set_liveness_probe(handler='tcpSocket', port=80)
+        c.add_env(k='TIER', v='web')
+        container = obj.as_dict()['spec']['template']['spec']['containers'][0]
+        self.assertEqual(dict(port=80), container['livenessProbe']['tcpSocket'])
+        self.assertEqual([dict(name='TIER', value='web')], container['env'])
+
     # --------------------------------------------------------------------------------- add host volume
 
     def test_pod_add_host_volume_none_args(self):
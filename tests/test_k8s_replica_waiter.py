@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import threading
+import time
+import unittest
+from kubernetes import K8sConfig, K8sReplicaWaiter
+from kubernetes.models.v1 import Pod
+from kubernetes.K8sExceptions import TimeoutException
+from tests.fake_apiserver import FakeApiServer
+
+
+def fake_pod(name=None, labels=None, ready=False):
+    pod = dict(
+        metadata=dict(name=name, namespace='default', labels=labels),
+        spec=dict(containers=[]),
+        status=dict(phase='Pending', conditions=[dict(type='Ready', status='False')])
+    )
+    if ready:
+        pod['status'] = dict(phase='Running', conditions=[dict(type='Ready', status='True')])
+    return pod
+
+
+class K8sReplicaWaiterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeApiServer().start()
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.api_host)
+        self.labels = dict(name='yorc', rc_version='1')
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _add_pods(self, count=0, ready=False, start=0):
+        for i in range(start, start + count):
+            self.server.add('pods', fake_pod(name='yorc-{0}'.format(i), labels=self.labels, ready=ready))
+
+    def _produce(self, count=0, delay=0.01):
+        def produce():
+            time.sleep(delay)
+            self._add_pods(count=count, ready=False)
+            for i in range(count):
+                time.sleep(delay)
+                self._add_pods(count=1, ready=True, start=i)
+        producer = threading.Thread(target=produce)
+        producer.daemon = True
+        producer.start()
+        return producer
+
+    # ------------------------------------------------------------------------------------- init
+
+    def test_init_invalid_labels(self):
+        try:
+            K8sReplicaWaiter(config=self.config, labels=object(), replicas=1)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_init_invalid_replicas(self):
+        try:
+            K8sReplicaWaiter(config=self.config, labels=self.labels, replicas=-1)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_init_invalid_callback(self):
+        try:
+            K8sReplicaWaiter(config=self.config, labels=self.labels, replicas=1, callback="yo")
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    # ------------------------------------------------------------------------------------- watch
+
+    def test_wait_already_ready(self):
+        self._add_pods(count=50, ready=True)
+        waiter = K8sReplicaWaiter(config=self.config, labels=self.labels, replicas=50, timeout=5)
+        self.assertTrue(waiter.wait())
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_wait_zero_replicas(self):
+        waiter = K8sReplicaWaiter(config=self.config, labels=self.labels, replicas=0, timeout=5)
+        self.assertTrue(waiter.wait())
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_wait_watch_constant_requests(self):
+        progress = list()
+        producer = self._produce(count=30)
+        waiter = K8sReplicaWaiter(config=self.config, labels=self.labels, replicas=30, timeout=10,
+                                  callback=lambda *args: progress.append(args))
+        self.assertTrue(waiter.wait())
+        producer.join()
+        self.assertEqual(30, waiter.get_ready())
+        self.assertEqual((30, 30, 30), progress[-1])
+        self.assertEqual(2, len(self.server.requests))
+
+    def test_wait_watch_builds_no_pods(self):
+        built = list()
+        init = Pod.__init__
+
+        def counting_init(pod, *args, **kwargs):
+            built.append(kwargs.get('model', None) is not None)
+            init(pod, *args, **kwargs)
+
+        producer = self._produce(count=10)
+        Pod.__init__ = counting_init
+        try:
+            waiter = K8sReplicaWaiter(config=self.config, labels=self.labels, replicas=10, timeout=10)
+            self.assertTrue(waiter.wait())
+        finally:
+            Pod.__init__ = init
+        producer.join()
+        # the watcher's own template, and nothing per event.
+        self.assertEqual([False], built)
+
+    def test_wait_timeout(self):
+        self._add_pods(count=2, ready=False)
+        waiter = K8sReplicaWaiter(config=self.config, labels=self.labels, replicas=2, timeout=0.5)
+        started = time.time()
+        try:
+            waiter.wait()
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, TimeoutException)
+        self.assertLess(time.time() - started, 3)
+
+    def test_wait_stop_event(self):
+        stop = threading.Event()
+        threading.Timer(0.2, stop.set).start()
+        waiter = K8sReplicaWaiter(config=self.config, labels=self.labels, replicas=2, timeout=10, stop_event=stop)
+        started = time.time()
+        self.assertFalse(waiter.wait())
+        self.assertLess(time.time() - started, 3)
+
+    # ------------------------------------------------------------------------------------- poll
+
+    def test_wait_poll_fallback(self):
+        self.server.watch_enabled = False
+        producer = self._produce(count=5, delay=0.05)
+        waiter = K8sReplicaWaiter(config=self.config, labels=self.labels, replicas=5, timeout=10,
+                                  min_interval=0.05, max_interval=0.2)
+        self.assertTrue(waiter.wait())
+        producer.join()
+        watches = [r for r in self.server.requests if r[2].get('watch') == 'true']
+        self.assertEqual(1, len(watches))
+
+    def test_wait_poll_backoff(self):
+        self._add_pods(count=1, ready=False)
+        waiter = K8sReplicaWaiter(config=self.config, labels=self.labels, replicas=1, timeout=1, use_watch=False,
+                                  min_interval=0.05, max_interval=0.4)
+        try:
+            waiter.wait()
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, TimeoutException)
+        # 0.05 + 0.1 + 0.2 + 0.4 + 0.4 ... rather than one poll every 0.05s.
+        self.assertLessEqual(len(self.server.requests), 6)
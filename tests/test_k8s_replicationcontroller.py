@@ -6,10 +6,16 @@
 # file 'LICENSE.md', which is part of this source code package.
 #
 
+import copy
+import json
+import threading
+import time
 import unittest
 import os
-from kubernetes import K8sReplicationController, K8sConfig
+from kubernetes import K8sReplicationController, K8sConfig, K8sContainer
 from kubernetes.models.v1 import ReplicationController, ObjectMeta, PodSpec
+from tests.fake_apiserver import FakeApiServer
+from kubernetes.K8sExceptions import NotFoundException, TimeoutException
 
 kubeconfig_fallback = '{0}/.kube/config'.format(os.path.abspath(os.path.dirname(os.path.realpath(__file__))))
 
@@ -984,13 +990,44 @@ class K8sReplicationControllerTest(unittest.TestCase):
         except Exception as err:
             self.assertIsInstance(err, SyntaxError)
 
-    # TODO: requires http call
     def test_wait_for_replicas(self):
-        # name = "yorc"
-        # rc = K8sReplicationController(name=name)
-        # replicas = 99
-        # rc.wait_for_replicas(replicas=replicas)
-        pass
+        name = "yorc"
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            rc = K8sReplicationController(config=config, name=name, replicas=2)
+            labels = rc.get_pod_labels()
+            for i in range(2):
+                pod = dict(
+                    metadata=dict(name='{0}-{1}'.format(name, i), namespace='default', labels=labels),
+                    spec=dict(containers=[]),
+                    status=dict(phase='Running', conditions=[dict(type='Ready', status='True')])
+                )
+                server.add('pods', pod)
+            progress = list()
+            rc.wait_for_replicas(replicas=2, timeout=5, callback=lambda *args: progress.append(args))
+            self.assertEqual([(2, 2, 2)], progress)
+            self.assertEqual(1, len(server.requests))
+        finally:
+            server.stop()
+
+    def test_wait_for_replicas_stopped(self):
+        name = "yorc"
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            rc = K8sReplicationController(config=config, name=name, replicas=2)
+            stop = threading.Event()
+            threading.Timer(0.2, stop.set).start()
+            started = time.time()
+            try:
+                rc.wait_for_replicas(replicas=2, timeout=10, stop_event=stop)
+                self.fail("Should not fail.")
+            except Exception as err:
+                self.assertIsInstance(err, TimeoutException)
+            self.assertLess(time.time() - started, 5)
+        finally:
+            server.stop()
 
     # -------------------------------------------------------------------------------------  get by name
 
@@ -1018,11 +1055,23 @@ class K8sReplicationControllerTest(unittest.TestCase):
         except Exception as err:
             self.assertIsInstance(err, SyntaxError)
 
-    # TODO: requires http call
     def test_get_by_name(self):
-        # name = "yoname"
-        # K8sReplicationController.get_by_name(name=name)
-        pass
+        name = "yoname"
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            K8sReplicationController(config=config, name=name, replicas=3).create()
+            server.reset_counters()
+            rcs = K8sReplicationController.get_by_name(config=config, name=name)
+            self.assertEqual(1, len(rcs))
+            self.assertEqual(1, len(server.requests))
+            self.assertIsInstance(rcs[0].model, ReplicationController)
+            self.assertEqual(3, rcs[0].get_replicas())
+            rcs = K8sReplicationController.get_by_name(config=config, name=name, refetch=True)
+            self.assertEqual(1, len(rcs))
+            self.assertEqual(3, len(server.requests))
+        finally:
+            server.stop()
 
     # -------------------------------------------------------------------------------------  get by name
 
@@ -1061,12 +1110,296 @@ class K8sReplicationControllerTest(unittest.TestCase):
         except Exception as err:
             self.assertIsInstance(err, SyntaxError)
 
-    # TODO: requires http call
     def test_resize(self):
-        # name = "yoname"
-        # replicas = 10
-        # K8sReplicationController.resize(name=name, replicas=replicas)
-        pass
+        name = "yoname"
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            K8sReplicationController(config=config, name=name, replicas=3).create()
+            server.reset_counters()
+            rc = K8sReplicationController.resize(config=config, name=name, replicas=0)
+            self.assertEqual(0, rc.get_replicas())
+            self.assertEqual(('PUT', '/api/v1/namespaces/default/replicationcontrollers/yoname/scale'),
+                             server.requests[0][:2])
+            self.assertEqual(['PUT', 'GET', 'GET'], [r[0] for r in server.requests])
+            self.assertEqual(0, server.objects['replicationcontrollers'][name]['spec']['replicas'])
+        finally:
+            server.stop()
+
+    def test_resize_without_scale_selector(self):
+        name = "yoname"
+        server = FakeApiServer().start()
+        try:
+            server.run_controllers = True
+            server.scale_selectors = False
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            K8sReplicationController(config=config, name=name, image='redis', replicas=0).create()
+            rc = K8sReplicationController.resize(config=config, name=name, replicas=2, timeout=5)
+            self.assertEqual(2, rc.get_replicas())
+            self.assertEqual(2, len(server.objects['pods']))
+        finally:
+            server.stop()
+
+    def test_update_after_resize(self):
+        name = "yoname"
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            K8sReplicationController(config=config, name=name, image='nginx', replicas=3).create()
+            before = copy.deepcopy(server.objects['replicationcontrollers'][name]['spec'])
+            rc = K8sReplicationController.resize(config=config, name=name, replicas=0)
+            rc.add_label(k='tier', v='web')
+            rc.update()
+            spec = server.objects['replicationcontrollers'][name]['spec']
+            self.assertEqual(0, spec['replicas'])
+            self.assertEqual(before['selector'], spec['selector'])
+            self.assertEqual(before['template'], spec['template'])
+            self.assertEqual('web', server.objects['replicationcontrollers'][name]['metadata']['labels']['tier'])
+        finally:
+            server.stop()
+
+    def test_resize_nonexistent(self):
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            K8sReplicationController.resize(config=config, name="yoname", replicas=0)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, NotFoundException)
+        finally:
+            server.stop()
+
+    # -------------------------------------------------------------------------------------  scale subresource
+
+    def test_get_scale(self):
+        name = "yoname"
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            rc = K8sReplicationController(config=config, name=name, replicas=3).create()
+            scale = rc.get_scale()
+            self.assertEqual('Scale', scale['kind'])
+            self.assertEqual(3, scale['spec']['replicas'])
+            self.assertEqual(rc.get_selector(), K8sReplicationController.get_scale_selector(scale))
+        finally:
+            server.stop()
+
+    def test_set_scale(self):
+        name = "yoname"
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            K8sReplicationController(config=config, name=name, replicas=1).create()
+            rc = K8sReplicationController(config=config, name=name).get()
+            server.reset_counters()
+            scale = rc.set_scale(replicas=5)
+            self.assertEqual(5, scale['spec']['replicas'])
+            self.assertEqual(5, rc.get_replicas())
+            self.assertFalse(rc.model.is_dirty())
+            self.assertEqual(5, server.objects['replicationcontrollers'][name]['spec']['replicas'])
+            self.assertEqual(1, len(server.requests))
+        finally:
+            server.stop()
+
+    def test_set_scale_invalid_replicas(self):
+        rc = K8sReplicationController(config=K8sConfig(kubeconfig=None), name="yoname")
+        try:
+            rc.set_scale(replicas=-1)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    # -------------------------------------------------------------------------------------  dirty tracking
+
+    def test_update_skipped_when_clean(self):
+        name = "yoname"
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            K8sReplicationController(config=config, name=name, image='redis', replicas=1).create()
+            rc = K8sReplicationController(config=config, name=name).get()
+            server.reset_counters()
+            rc.update()
+            self.assertEqual(0, len(server.requests))
+            rc.set_replicas(replicas=2)
+            rc.update()
+            rc.update()
+            self.assertEqual(['PUT'], [r[0] for r in server.requests])
+            rc.update(force=True)
+            self.assertEqual(2, len(server.requests))
+        finally:
+            server.stop()
+
+    def test_update_listed_without_snapshot(self):
+        name = "yoname"
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            K8sReplicationController(config=config, name=name, image='redis', replicas=1).create()
+            rc = K8sReplicationController.get_by_name(config=config, name=name)[0]
+            self.assertIsNone(rc.model._snapshot)
+            server.reset_counters()
+            rc.set_replicas(replicas=2)
+            rc.update()
+            self.assertEqual(['PUT'], [r[0] for r in server.requests])
+            self.assertEqual(2, server.objects['replicationcontrollers'][name]['spec']['replicas'])
+            self.assertFalse(rc.model.is_dirty())
+        finally:
+            server.stop()
+
+    def test_update_changes(self):
+        name = "yoname"
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            K8sReplicationController(config=config, name=name, image='redis', replicas=1).create()
+            rc = K8sReplicationController(config=config, name=name).get()
+            server.reset_counters()
+            rc.update_changes()
+            self.assertEqual(0, len(server.requests))
+            rc.set_replicas(replicas=3)
+            rc.add_annotation(k='owner', v='yo')
+            rc.update_changes()
+            self.assertEqual(['PATCH'], [r[0] for r in server.requests])
+            stored = server.objects['replicationcontrollers'][name]
+            self.assertEqual(3, stored['spec']['replicas'])
+            self.assertEqual('yo', stored['metadata']['annotations']['owner'])
+            self.assertFalse(rc.model.is_dirty())
+        finally:
+            server.stop()
+
+    # -------------------------------------------------------------------------------------  scale patch
+
+    def test_scale_patch_invalid_replicas(self):
+        name = "yoname"
+        rc = K8sReplicationController(config=K8sConfig(kubeconfig=None), name=name)
+        try:
+            rc.scale_patch(replicas=-1)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_scale_patch(self):
+        name = "yoname"
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            rc = K8sReplicationController(config=config, name=name, image='redis', replicas=1).create()
+            server.reset_counters()
+            rc.scale_patch(replicas=4)
+            self.assertEqual(['PATCH'], [r[0] for r in server.requests])
+            self.assertIsInstance(rc.model, ReplicationController)
+            self.assertEqual(4, rc.get_replicas())
+            stored = server.objects['replicationcontrollers'][name]
+            self.assertEqual(4, stored['spec']['replicas'])
+            self.assertEqual('redis', stored['spec']['template']['spec']['containers'][0]['image'])
+        finally:
+            server.stop()
+
+    # -------------------------------------------------------------------------------------  clone
+
+    def test_clone(self):
+        name = "yoname"
+        rc = K8sReplicationController(config=K8sConfig(kubeconfig=None), name=name, image='redis', replicas=2)
+        clone = rc.clone(name="yoclone")
+        self.assertIsInstance(clone, K8sReplicationController)
+        self.assertIs(rc.config, clone.config)
+        self.assertEqual("yoclone", clone.name)
+        self.assertEqual("yoclone", clone.model.get_name())
+        self.assertEqual(name, rc.model.get_name())
+        clone.set_image(name=name, image='nginx')
+        clone.set_replicas(replicas=5)
+        self.assertEqual('redis', rc.get_pod_containers()[0]['image'])
+        self.assertEqual('nginx', clone.get_pod_containers()[0]['image'])
+        self.assertEqual(2, rc.get_replicas())
+
+    def test_clone_renamed_has_no_snapshot(self):
+        name = "yoname"
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            rc = K8sReplicationController(config=config, name=name, image='redis', replicas=2).create()
+            self.assertFalse(rc.clone().model.is_dirty())
+            clone = rc.clone(name="yoclone")
+            self.assertTrue(clone.model.is_dirty())
+            self.assertEqual(clone.as_dict(), clone.model.diff())
+        finally:
+            server.stop()
+
+    # -------------------------------------------------------------------------------------  serialization cache
+
+    def test_as_json_cached(self):
+        name = "yoname"
+        rc = K8sReplicationController(config=K8sConfig(kubeconfig=None), name=name, image='redis', replicas=2)
+        data = rc.as_json()
+        self.assertIs(data, rc.as_json())
+        self.assertEqual(dict(hits=1, misses=1), rc.model.get_cache_stats())
+        self.assertEqual(rc.as_dict(), json.loads(data))
+
+    def test_as_json_invalidated_by_mutators(self):
+        name = "yoname"
+        rc = K8sReplicationController(config=K8sConfig(kubeconfig=None), name=name, image='redis', replicas=2)
+        container = K8sContainer(name="yosidecar", image="busybox")
+        rc.add_container(container)
+        rc.as_json()
+        rc.set_replicas(replicas=3)
+        self.assertEqual(3, json.loads(rc.as_json())['spec']['replicas'])
+        rc.add_label(k='tier', v='web')
+        self.assertEqual('web', json.loads(rc.as_json())['metadata']['labels']['tier'])
+        container.add_env(k='TIER', v='web')
+        containers = json.loads(rc.as_json())['spec']['template']['spec']['containers']
+        self.assertEqual([dict(name='TIER', value='web')], containers[1]['env'])
+        rc.as_json()
+        self.assertEqual(dict(hits=1, misses=4), rc.model.get_cache_stats())
+
+    def test_as_json_invalidated_by_equal_values(self):
+        name = "yoname"
+        rc = K8sReplicationController(config=K8sConfig(kubeconfig=None), name=name, image='redis', replicas=1)
+        rc.as_json()
+        rc.set_replicas(replicas=True)
+        self.assertIs(True, json.loads(rc.as_json())['spec']['replicas'])
+
+    def test_as_json_invalidated_by_new_children(self):
+        name = "yoname"
+        rc = K8sReplicationController(config=K8sConfig(kubeconfig=None), name=name, image='redis', replicas=1)
+        container = K8sContainer(name="yosidecar", image="busybox")
+        rc.add_container(container)
+        rc.as_json()
+        container.set_liveness_probe(handler='exec', command=['true'])
+        containers = json.loads(rc.as_json())['spec']['template']['spec']['containers']
+        self.assertEqual(['true'], containers[1]['livenessProbe']['exec']['command'])
+        container.get_liveness_probe().set_handler(handler='exec', command=['false'])
+        containers = json.loads(rc.as_json())['spec']['template']['spec']['containers']
+        self.assertEqual(['false'], containers[1]['livenessProbe']['exec']['command'])
+        self.assertEqual(dict(hits=0, misses=3), rc.model.get_cache_stats())
+
+    def test_as_json_invalidated_after_deepcopy(self):
+        name = "yoname"
+        rc = K8sReplicationController(config=K8sConfig(kubeconfig=None), name=name, image='redis', replicas=1)
+        rc.add_container(K8sContainer(name="yosidecar", image="busybox"))
+        data = rc.as_json()
+        rc2 = copy.deepcopy(rc)
+        rc2.model.pod_spec.containers[1].set_image(image='busybox:9')
+        containers = json.loads(rc2.as_json())['spec']['template']['spec']['containers']
+        self.assertEqual('busybox:9', containers[1]['image'])
+        self.assertIs(data, rc.as_json())
+        rc.model.pod_spec.containers[1].set_image(image='busybox:8')
+        containers = json.loads(rc.as_json())['spec']['template']['spec']['containers']
+        self.assertEqual('busybox:8', containers[1]['image'])
+
+    def test_create_uses_cached_json(self):
+        name = "yoname"
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            rc = K8sReplicationController(config=config, name=name, image='redis', replicas=1)
+            rc.as_json()
+            rc.create()
+            self.assertEqual(dict(hits=1, misses=1), rc.model.get_cache_stats())
+            self.assertEqual(1, server.objects['replicationcontrollers'][name]['spec']['replicas'])
+            self.assertFalse(rc.model.is_dirty())
+        finally:
+            server.stop()
 
     # -------------------------------------------------------------------------------------  rolling update
 
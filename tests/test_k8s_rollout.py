@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import unittest
+from kubernetes import K8sConfig, K8sReplicationController, K8sRollout
+from kubernetes.K8sObject import K8sObject
+from tests.fake_apiserver import FakeApiServer
+
+
+class K8sRolloutTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeApiServer().start()
+        self.server.run_controllers = True
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.api_host)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _rcs(self, replicas=4):
+        current = K8sReplicationController(config=self.config, name='yorc', image='redis', replicas=replicas).create()
+        following = K8sReplicationController(config=self.config, name='yorc-next', image='nginx', replicas=0)
+        return current, following.create()
+
+    def _pods(self, image=None):
+        return [pod for pod in self.server.objects['pods'].values()
+                if image is None or pod['spec']['containers'][0]['image'] == image]
+
+    def test_init_invalid_rc(self):
+        try:
+            K8sRollout(current_rc=object(), next_rc=object(), replicas=1)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_init_invalid_budgets(self):
+        current, following = self._rcs()
+        for surge, unavailable in [(0, 0), ('x%', 0), (-1, 1), (1, '25')]:
+            try:
+                K8sRollout(current_rc=current, next_rc=following, replicas=4, max_surge=surge,
+                           max_unavailable=unavailable)
+                self.fail("Should not fail.")
+            except Exception as err:
+                self.assertIsInstance(err, SyntaxError)
+
+    def test_init_percentages(self):
+        current, following = self._rcs()
+        rollout = K8sRollout(current_rc=current, next_rc=following, replicas=10, max_surge='25%',
+                             max_unavailable='25%')
+        self.assertEqual(3, rollout.max_surge)
+        self.assertEqual(2, rollout.max_unavailable)
+        rollout = K8sRollout(current_rc=current, next_rc=following, replicas=1, max_surge='0%',
+                             max_unavailable='25%')
+        self.assertEqual(1, rollout.max_unavailable)
+        rollout = K8sRollout(current_rc=current, next_rc=following, replicas=10, max_surge=u'25%',
+                             max_unavailable=u'25%')
+        self.assertEqual(3, rollout.max_surge)
+        self.assertEqual(2, rollout.max_unavailable)
+
+    def test_run_respects_budgets(self):
+        current, following = self._rcs(replicas=6)
+        steps = list()
+        rollout = K8sRollout(current_rc=current, next_rc=following, replicas=6, max_surge=2, max_unavailable=1,
+                             step_timeout=5, callback=steps.append).run()
+        self.assertEqual(6, len(self._pods(image='nginx')))
+        self.assertEqual(0, len(self._pods(image='redis')))
+        for step in steps:
+            self.assertLessEqual(step['old_replicas'] + step['new_replicas'], 8)
+            self.assertGreaterEqual(step['old_replicas'] + step['new_ready'], 5)
+        stats = rollout.get_stats()
+        self.assertEqual(len(steps), stats['steps'])
+        self.assertLess(stats['steps'], 6)
+        self.assertIsNotNone(stats['pods_ready_per_second'])
+
+    def test_run_one_at_a_time(self):
+        current, following = self._rcs(replicas=3)
+        steps = list()
+        K8sRollout(current_rc=current, next_rc=following, replicas=3, step_timeout=5, callback=steps.append).run()
+        self.assertTrue(all(step['old_replicas'] + step['new_replicas'] <= 4 for step in steps))
+        self.assertEqual(3, len(self._pods(image='nginx')))
+
+    def test_rolling_update(self):
+        K8sReplicationController(config=self.config, name='yorc', image='redis', replicas=4).create()
+        steps = list()
+        rc = K8sReplicationController.rolling_update(config=self.config, name='yorc', image='nginx', max_surge='50%',
+                                                     max_unavailable=1, timeout=5, callback=steps.append)
+        self.assertEqual('yorc', rc.name)
+        stored = self.server.objects['replicationcontrollers']
+        self.assertEqual(['yorc'], list(stored))
+        self.assertEqual(4, stored['yorc']['spec']['replicas'])
+        self.assertEqual('nginx', stored['yorc']['spec']['template']['spec']['containers'][0]['image'])
+        self.assertEqual(4, len(self._pods(image='nginx')))
+        self.assertEqual(4, len(self._pods()))
+        self.assertLess(len(steps), 4)
+
+    # -------------------------------------------------------------------------------------  checkpoints
+
+    def test_checkpoints(self):
+        current, following = self._rcs(replicas=2)
+        K8sRollout(current_rc=current, next_rc=following, replicas=2, step_timeout=5).run()
+        checkpoint = K8sRollout.load_checkpoint(following)
+        self.assertEqual('complete', checkpoint['phase'])
+        self.assertEqual(2, checkpoint['new_replicas'])
+        self.assertEqual(0, checkpoint['old_replicas'])
+        stored = self.server.objects['replicationcontrollers']['yorc-next']['metadata']['annotations']
+        self.assertIn('rollout-checkpoint', stored)
+
+    def test_resume_complete(self):
+        current, following = self._rcs(replicas=2)
+        K8sRollout(current_rc=current, next_rc=following, replicas=2, step_timeout=5).run()
+        self.server.reset_counters()
+        checkpoint = K8sRollout.load_checkpoint(following)
+        K8sRollout(current_rc=current, next_rc=following, replicas=2, checkpoint=checkpoint).run()
+        self.assertEqual(0, len(self.server.requests))
+
+    def test_rolling_update_resumes(self):
+        K8sReplicationController(config=self.config, name='yorc', image='redis', replicas=4).create()
+
+        def crash(step):
+            if step['step'] == 2:
+                raise KeyboardInterrupt()
+
+        try:
+            K8sReplicationController.rolling_update(config=self.config, name='yorc', image='nginx', timeout=5,
+                                                    callback=crash)
+            self.fail("Should not fail.")
+        except KeyboardInterrupt:
+            pass
+        rcs = self.server.objects['replicationcontrollers']
+        before = (rcs['yorc']['spec']['replicas'], rcs['yorc-next']['spec']['replicas'])
+        self.server.reset_counters()
+
+        steps = list()
+        rc = K8sReplicationController.rolling_update(config=self.config, name='yorc', image='nginx', timeout=5,
+                                                     callback=steps.append)
+        self.assertEqual(3, steps[0]['step'])
+        self.assertEqual(before[0] - steps[0]['scaled_down'], steps[0]['old_replicas'])
+        self.assertEqual(before[1] + steps[0]['scaled_up'], steps[0]['new_replicas'])
+        posts = [r for r in self.server.requests if r[0] == 'POST']
+        self.assertEqual(1, len(posts))
+        self.assertEqual('yorc', rc.name)
+        self.assertEqual(['yorc'], list(self.server.objects['replicationcontrollers']))
+        self.assertEqual(4, len(self._pods(image='nginx')))
+        self.assertEqual(4, len(self._pods()))
+
+    def test_rolling_update_resumes_rename(self):
+        current, following = self._rcs(replicas=2)
+        current.patch_annotations(annotations={'update-partner': 'yorc-next'})
+        following.patch_annotations(annotations={'desired-replicas': '2'})
+        K8sRollout(current_rc=current, next_rc=following, replicas=2, step_timeout=5).run()
+        current.delete()
+
+        self.server.reset_counters()
+        rc = K8sReplicationController.rolling_update(config=self.config, name='yorc', image='nginx', timeout=5)
+        self.assertEqual(['GET', 'GET', 'POST', 'DELETE'], [r[0] for r in self.server.requests])
+        self.assertEqual(['yorc'], list(self.server.objects['replicationcontrollers']))
+        annotations = self.server.objects['replicationcontrollers']['yorc']['metadata'].get('annotations', dict())
+        self.assertNotIn('rollout-checkpoint', annotations)
+        self.assertEqual('yorc', rc.name)
+
+    def test_rolling_update_resumes_before_partner_annotation(self):
+        K8sReplicationController(config=self.config, name='yorc', image='redis', replicas=3).create()
+
+        def crash(obj, annotations=None):
+            raise KeyboardInterrupt()
+
+        patch_annotations = K8sObject.patch_annotations
+        K8sObject.patch_annotations = crash
+        try:
+            K8sReplicationController.rolling_update(config=self.config, name='yorc', image='nginx', timeout=5)
+            self.fail("Should not fail.")
+        except KeyboardInterrupt:
+            pass
+        finally:
+            K8sObject.patch_annotations = patch_annotations
+        rcs = self.server.objects['replicationcontrollers']
+        self.assertEqual(['yorc', 'yorc-next'], sorted(rcs))
+        self.assertNotIn('update-partner', rcs['yorc']['metadata'].get('annotations', dict()))
+
+        rc = K8sReplicationController.rolling_update(config=self.config, name='yorc', image='nginx', timeout=5)
+        self.assertEqual('yorc', rc.name)
+        self.assertEqual(['yorc'], list(rcs))
+        self.assertEqual(3, rcs['yorc']['spec']['replicas'])
+        self.assertEqual('nginx', rcs['yorc']['spec']['template']['spec']['containers'][0]['image'])
+        self.assertEqual(3, len(self._pods(image='nginx')))
+        self.assertEqual(3, len(self._pods()))
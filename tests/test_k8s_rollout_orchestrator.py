@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import unittest
+from kubernetes import K8sConfig, K8sReplicationController, K8sRolloutOrchestrator
+from tests.fake_apiserver import FakeApiServer
+
+
+class K8sRolloutOrchestratorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeApiServer().start()
+        self.server.run_controllers = True
+        self.config = K8sConfig(kubeconfig=None, api_host=self.server.api_host)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _create(self, names, replicas=2):
+        for name in names:
+            K8sReplicationController(config=self.config, name=name, image='redis', replicas=replicas).create()
+
+    def _image(self, name):
+        rc = self.server.objects['replicationcontrollers'][name]
+        return rc['spec']['template']['spec']['containers'][0]['image']
+
+    def test_init_invalid_targets(self):
+        for targets in [None, [('yorc',)], [('yorc', 'nginx'), ('yorc', 'redis')]]:
+            try:
+                K8sRolloutOrchestrator(config=self.config, targets=targets)
+                self.fail("Should not fail.")
+            except Exception as err:
+                self.assertIsInstance(err, SyntaxError)
+
+    def test_init_unknown_dependency(self):
+        try:
+            K8sRolloutOrchestrator(config=self.config, targets=[('front', 'nginx')], dependencies=dict(front=['back']))
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_init_dependency_cycle(self):
+        targets = [('a', 'nginx'), ('b', 'nginx'), ('c', 'nginx')]
+        try:
+            K8sRolloutOrchestrator(config=self.config, targets=targets, dependencies=dict(a=['b'], b=['c'], c=['a']))
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_run_concurrently(self):
+        names = ['yorc-{0}'.format(i) for i in range(6)]
+        self._create(names)
+        orchestrator = K8sRolloutOrchestrator(config=self.config, targets=[(name, 'nginx') for name in names],
+                                              concurrency=3, timeout=5).run()
+        self.assertEqual([], orchestrator.get_failures())
+        self.assertEqual(names, [result['name'] for result in orchestrator.results])
+        for name in names:
+            self.assertEqual('nginx', self._image(name))
+        spans = [(r['started'], r['started'] + r['latency']) for r in orchestrator.results]
+        overlap = max(len([s for s in spans if s[0] <= start < s[1]]) for start, end in spans)
+        self.assertLessEqual(overlap, 3)
+        stats = orchestrator.get_stats()
+        self.assertEqual(6, stats['succeeded'])
+        self.assertEqual(0, stats['running'])
+        self.assertEqual(0, stats['pending'])
+        self.assertIsNotNone(stats['throughput'])
+        self.assertIsNotNone(stats['p90'])
+
+    def test_dependencies(self):
+        self._create(['back', 'front', 'other'])
+        order = list()
+        targets = [('front', 'nginx'), ('back', 'nginx'), ('other', 'nginx')]
+        orchestrator = K8sRolloutOrchestrator(config=self.config, targets=targets, dependencies=dict(front=['back']),
+                                              timeout=5, callback=lambda result: order.append(result['name'])).run()
+        self.assertEqual([], orchestrator.get_failures())
+        back, front = orchestrator.results[1], orchestrator.results[0]
+        self.assertGreaterEqual(front['started'], back['started'] + back['latency'])
+        self.assertLess(order.index('back'), order.index('front'))
+
+    def test_failure_isolation(self):
+        self._create(['back', 'other'])
+        targets = [('front', 'nginx'), ('missing', 'nginx'), ('back', 'nginx'), ('other', 'nginx')]
+        orchestrator = K8sRolloutOrchestrator(config=self.config, targets=targets,
+                                              dependencies=dict(front=['missing', 'back']), timeout=5).run()
+        results = dict((result['name'], result) for result in orchestrator.results)
+        self.assertTrue(results['back']['success'])
+        self.assertTrue(results['other']['success'])
+        self.assertFalse(results['missing']['success'])
+        self.assertFalse(results['missing']['skipped'])
+        self.assertTrue(results['front']['skipped'])
+        stats = orchestrator.get_stats()
+        self.assertEqual((2, 1, 1), (stats['succeeded'], stats['failed'], stats['skipped']))
@@ -10,6 +10,7 @@ import unittest
 import os
 from kubernetes import K8sService, K8sConfig
 from kubernetes.models.v1 import Service, ObjectMeta
+from tests.fake_apiserver import FakeApiServer
 
 kubeconfig_fallback = '{0}/.kube/config'.format(os.path.abspath(os.path.dirname(os.path.realpath(__file__))))
 
@@ -1141,3 +1142,23 @@ class K8sServiceTest(unittest.TestCase):
             svc.set_service_type(i)
             self.assertIn('type', svc.model.model['spec'])
             self.assertEqual(i, svc.model.model['spec']['type'])
+
+    # ------------------------------------------------------------------------------------- get by name
+
+    def test_get_by_name(self):
+        name = "yoservice"
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host)
+            K8sService(config=config, name=name).add_port(name="http", port=80, target_port=8080).create()
+            server.reset_counters()
+            services = K8sService.get_by_name(config=config, name=name)
+            self.assertEqual(1, len(services))
+            self.assertEqual(1, len(server.requests))
+            self.assertIsInstance(services[0].model, Service)
+            self.assertEqual(name, services[0].name)
+            services = K8sService.get_by_name(config=config, name=name, refetch=True)
+            self.assertEqual(1, len(services))
+            self.assertEqual(3, len(server.requests))
+        finally:
+            server.stop()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import copy
+import os
+import shutil
+import tempfile
+import unittest
+from kubernetes import K8sConfig
+from kubernetes.utils.KubeConfigLoader import load_kubeconfig, clear_kubeconfig_cache, get_kubeconfig_cache_stats
+
+kubeconfig_fallback = '{0}/.kube/config'.format(os.path.abspath(os.path.dirname(os.path.realpath(__file__))))
+
+
+class KubeConfigLoaderTest(unittest.TestCase):
+
+    def setUp(self):
+        clear_kubeconfig_cache()
+        self.tmpdir = tempfile.mkdtemp()
+        self.kubeconfig = os.path.join(self.tmpdir, 'config')
+        shutil.copy(kubeconfig_fallback, self.kubeconfig)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+        clear_kubeconfig_cache()
+
+    # ------------------------------------------------------------------------------------- load
+
+    def test_load_none_path(self):
+        try:
+            load_kubeconfig()
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_load_parses_once(self):
+        first = load_kubeconfig(self.kubeconfig)
+        second = load_kubeconfig(self.kubeconfig)
+        self.assertIs(first, second)
+        self.assertEqual('minikube', first['current-context'])
+        stats = get_kubeconfig_cache_stats()
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(1, stats['hits'])
+        self.assertEqual(1, stats['entries'])
+
+    def test_load_reparses_changed_file(self):
+        first = load_kubeconfig(self.kubeconfig)
+        with open(self.kubeconfig, 'a') as f:
+            f.write('\n# touched\n')
+        second = load_kubeconfig(self.kubeconfig)
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
+        self.assertEqual(2, get_kubeconfig_cache_stats()['misses'])
+
+    def test_load_is_read_only(self):
+        dotconf = load_kubeconfig(self.kubeconfig)
+        self.assertRaises(TypeError, dotconf.__setitem__, 'kind', 'yo')
+        self.assertRaises(TypeError, dotconf['clusters'].append, dict())
+        self.assertRaises(TypeError, dotconf['users'][0]['user'].pop, 'client-key')
+
+    # ------------------------------------------------------------------------------------- K8sConfig
+
+    def test_config_shares_parsed_kubeconfig(self):
+        first = K8sConfig(kubeconfig=self.kubeconfig)
+        second = K8sConfig(kubeconfig=self.kubeconfig)
+        self.assertIs(first.clusters, second.clusters)
+        self.assertIsInstance(first.clusters, list)
+        self.assertIsInstance(first.preferences, dict)
+        self.assertEqual(1, get_kubeconfig_cache_stats()['misses'])
+
+    def test_config_deepcopy(self):
+        config = K8sConfig(kubeconfig=self.kubeconfig)
+        clone = copy.deepcopy(config)
+        self.assertEqual(config.api_host, clone.api_host)
+        self.assertIs(config.users, clone.users)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import unittest
+from kubernetes.models.v1.ReplicationController import ReplicationController
+from kubernetes.utils import copy_model, merge_diff, json_diff
+from tests.fake_apiserver import FakeApiServer
+
+
+class ModelDiffTest(unittest.TestCase):
+
+    def setUp(self):
+        self.old = dict(metadata=dict(name='yo', labels=dict(app='yo', tier='web')), spec=dict(replicas=1, ports=[80]))
+        self.new = dict(metadata=dict(name='yo', labels=dict(app='yo', version='2')), spec=dict(replicas=3, ports=[80]))
+
+    def test_merge_diff_equal(self):
+        self.assertEqual(dict(), merge_diff(self.old, dict(self.old)))
+
+    def test_merge_diff(self):
+        patch = merge_diff(self.old, self.new)
+        self.assertEqual(dict(metadata=dict(labels=dict(tier=None, version='2')), spec=dict(replicas=3)), patch)
+        self.assertEqual(self.new, FakeApiServer.merge_patch(self.old, patch))
+
+    def test_merge_diff_replaces_lists(self):
+        self.new['spec']['ports'] = [80, 443]
+        self.assertEqual([80, 443], merge_diff(self.old, self.new)['spec']['ports'])
+
+    def test_json_diff_equal(self):
+        self.assertEqual(list(), json_diff(self.old, dict(self.old)))
+
+    def test_json_diff(self):
+        self.new['spec']['ports'] = [8080]
+        self.new['metadata']['annotations'] = {'a/b': 'c'}
+        operations = json_diff(self.old, self.new)
+        self.assertIn(dict(op='remove', path='/metadata/labels/tier'), operations)
+        self.assertIn(dict(op='add', path='/metadata/labels/version', value='2'), operations)
+        self.assertIn(dict(op='replace', path='/spec/replicas', value=3), operations)
+        self.assertIn(dict(op='replace', path='/spec/ports/0', value=8080), operations)
+        self.assertIn(dict(op='add', path='/metadata/annotations', value={'a/b': 'c'}), operations)
+        self.assertEqual(self.new, FakeApiServer.json_patch(self.old, operations))
+
+    def test_model_dirty_tracking(self):
+        rc = ReplicationController(name='yorc', replicas=1)
+        self.assertTrue(rc.is_dirty())
+        rc.snapshot()
+        self.assertFalse(rc.is_dirty())
+        self.assertEqual(dict(), rc.diff())
+        rc.set_replicas(replicas=2)
+        rc.add_label(k='tier', v='web')
+        self.assertTrue(rc.is_dirty())
+        self.assertEqual(dict(metadata=dict(labels=dict(tier='web')), spec=dict(replicas=2)), rc.diff())
+        self.assertEqual(2, len(rc.diff(patch_type='json')))
+
+    def test_model_diff_invalid_type(self):
+        try:
+            ReplicationController(name='yorc').diff(patch_type='yotype')
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_copy_model(self):
+        copied = copy_model(self.old)
+        self.assertEqual(self.old, copied)
+        copied['metadata']['labels']['tier'] = 'db'
+        copied['spec']['ports'].append(443)
+        self.assertEqual('web', self.old['metadata']['labels']['tier'])
+        self.assertEqual([80], self.old['spec']['ports'])
+        self.assertIs(self.old['metadata']['name'], copied['metadata']['name'])
+
+    def test_model_clone(self):
+        rc = ReplicationController(name='yorc', image='redis', replicas=1).snapshot()
+        clone = rc.clone()
+        self.assertIsInstance(clone, ReplicationController)
+        self.assertEqual(rc.get(), clone.get())
+        self.assertFalse(clone.is_dirty())
+        clone.set_replicas(replicas=3)
+        clone.add_pod_label(k='tier', v='web')
+        self.assertEqual(1, rc.get_replicas())
+        self.assertIsNone(rc.get_pod_label(k='tier'))
+        self.assertEqual(dict(spec=dict(replicas=3, template=dict(metadata=dict(labels=dict(tier='web'))))),
+                         clone.diff())
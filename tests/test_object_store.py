@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import unittest
+from kubernetes.utils import ObjectStore
+from kubernetes.utils.ObjectStore import DEFAULT_INDEXERS
+
+
+def raw_pod(name=None, labels=None, node=None, image='nginx'):
+    spec = dict(containers=[dict(name='c', image=image)])
+    if node is not None:
+        spec['nodeName'] = node
+    return dict(kind='Pod', metadata=dict(name=name, labels=labels), spec=spec)
+
+
+class ObjectStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = ObjectStore(indexers=DEFAULT_INDEXERS)
+
+    # ------------------------------------------------------------------------------------- init
+
+    def test_init_invalid_indexers(self):
+        try:
+            ObjectStore(indexers=object())
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_add_indexer_not_callable(self):
+        try:
+            self.store.add_indexer(name='yo', func='yo')
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_by_index_unknown(self):
+        try:
+            self.store.by_index(name='yo', value='yo')
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    # ------------------------------------------------------------------------------------- indexes
+
+    def test_add_and_index(self):
+        self.store.add(raw_pod(name='a', labels=dict(app='web'), node='n1', image='nginx'))
+        self.store.add(raw_pod(name='b', labels=dict(app='db'), node='n1', image='redis'))
+        self.assertEqual(2, len(self.store))
+        self.assertEqual(['a'], [p['metadata']['name'] for p in self.store.by_index('labels', 'app=web')])
+        self.assertEqual(['a', 'b'], sorted(p['metadata']['name'] for p in self.store.by_index('node_name', 'n1')))
+        self.assertEqual(['b'], [p['metadata']['name'] for p in self.store.by_index('image', 'redis')])
+
+    def test_update_reindexes(self):
+        self.store.add(raw_pod(name='a', labels=dict(app='web'), node='n1'))
+        self.store.update(raw_pod(name='a', labels=dict(app='db'), node='n2'))
+        self.assertEqual(1, len(self.store))
+        self.assertEqual([], self.store.by_index('labels', 'app=web'))
+        self.assertEqual([], self.store.by_index('node_name', 'n1'))
+        self.assertEqual(['n2'], self.store.index_values('node_name'))
+
+    def test_delete_unindexes(self):
+        pod = raw_pod(name='a', labels=dict(app='web'))
+        self.store.add(pod)
+        self.store.delete(pod)
+        self.assertEqual(0, len(self.store))
+        self.assertEqual([], self.store.index_values('labels'))
+        self.store.delete(pod)
+
+    def test_add_indexer_indexes_existing(self):
+        self.store.add(raw_pod(name='a'))
+        self.store.add_indexer(name='name', func=lambda obj: [obj['metadata']['name']])
+        self.assertEqual(1, len(self.store.by_index('name', 'a')))
+
+    def test_replace(self):
+        self.store.add(raw_pod(name='a', labels=dict(app='web')))
+        self.store.replace([raw_pod(name='b', labels=dict(app='db'))])
+        self.assertIsNone(self.store.get('a'))
+        self.assertEqual([], self.store.by_index('labels', 'app=web'))
+        self.assertEqual(1, len(self.store.by_index('labels', 'app=db')))
+
+    def test_by_selector(self):
+        for i in range(100):
+            self.store.add(raw_pod(name='p{0}'.format(i), labels=dict(app='web', version=str(i % 4))))
+        pods = self.store.by_selector(dict(app='web', version='1'))
+        self.assertEqual(25, len(pods))
+        self.assertEqual([], self.store.by_selector(dict(app='web', version='9')))
+        self.assertEqual(100, len(self.store.by_selector(dict())))
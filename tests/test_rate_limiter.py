@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import copy
+import threading
+import time
+import unittest
+from kubernetes import K8sConfig, K8sService
+from kubernetes.utils import RateLimiter
+from tests.fake_apiserver import FakeApiServer
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def test_init_invalid_qps(self):
+        try:
+            RateLimiter(qps=0)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_init_invalid_burst(self):
+        try:
+            RateLimiter(qps=1, burst=0)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_burst_then_rate(self):
+        limiter = RateLimiter(qps=50, burst=5)
+        waits = [limiter.reserve() for i in range(10)]
+        self.assertEqual([0.0] * 5, waits[:5])
+        for i, wait in enumerate(waits[5:]):
+            self.assertAlmostEqual((i + 1) / 50.0, wait, places=2)
+        stats = limiter.get_stats()
+        self.assertEqual(10, stats['acquired'])
+        self.assertEqual(5, stats['throttled'])
+        self.assertAlmostEqual(0.1, stats['max_wait'], places=2)
+
+    def test_shared_across_threads(self):
+        limiter = RateLimiter(qps=100, burst=1)
+        started = time.time()
+        threads = [threading.Thread(target=lambda: [limiter.acquire() for i in range(5)]) for j in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertGreaterEqual(time.time() - started, 0.18)
+        self.assertEqual(20, limiter.get_stats()['acquired'])
+
+    def test_config(self):
+        self.assertIsNone(K8sConfig(kubeconfig=None).rate_limiter)
+        config = K8sConfig(kubeconfig=None, qps=5, burst=10)
+        self.assertEqual(10, config.rate_limiter.burst)
+        self.assertIs(config.rate_limiter, copy.deepcopy(config).rate_limiter)
+
+    def test_requests_are_limited(self):
+        server = FakeApiServer().start()
+        try:
+            config = K8sConfig(kubeconfig=None, api_host=server.api_host, qps=20, burst=2)
+            started = time.time()
+            for i in range(2):
+                K8sService(config=config, name='svc-{0}'.format(i)).create()
+            for i in range(2):
+                K8sService(config=config, name='svc-{0}'.format(i)).get()
+            self.assertGreaterEqual(time.time() - started, 0.08)
+            stats = config.rate_limiter.get_stats()
+            self.assertEqual(4, stats['acquired'])
+            self.assertEqual(2, stats['throttled'])
+        finally:
+            server.stop()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import copy
+import time
+import unittest
+from email.utils import formatdate
+from kubernetes import K8sConfig, K8sService
+from kubernetes.K8sExceptions import BadRequestException, NotFoundException
+from kubernetes.utils import RetryPolicy
+from tests.fake_apiserver import FakeApiServer
+
+
+class RetryPolicyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeApiServer().start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _config(self, **kwargs):
+        policy = RetryPolicy(**dict(dict(backoff=0.01, max_backoff=0.05), **kwargs))
+        return K8sConfig(kubeconfig=None, api_host=self.server.api_host, retry_policy=policy)
+
+    def _count(self, method):
+        return len([r for r in self.server.requests if r[0] == method])
+
+    def test_init_invalid_max_retries(self):
+        try:
+            RetryPolicy(max_retries=-1)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_init_invalid_deadline(self):
+        try:
+            RetryPolicy(deadline=0)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_config(self):
+        try:
+            K8sConfig(kubeconfig=None, retry_policy=3)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+        config = self._config()
+        self.assertIs(config.retry_policy, copy.deepcopy(config).retry_policy)
+        self.assertIsNone(K8sConfig(kubeconfig=None).retry_policy)
+
+    def test_is_retryable(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.is_retryable(method='GET', status=503))
+        self.assertTrue(policy.is_retryable(method='DELETE', error=True))
+        self.assertFalse(policy.is_retryable(method='GET', status=404))
+        self.assertTrue(policy.is_retryable(method='POST', status=429))
+        self.assertFalse(policy.is_retryable(method='POST', status=503))
+        self.assertFalse(policy.is_retryable(method='POST', error=True))
+
+    def test_delay_is_capped_with_jitter(self):
+        policy = RetryPolicy(backoff=1, max_backoff=4)
+        for retry in range(6):
+            delay = policy.get_delay(retry=retry)
+            self.assertTrue(0 <= delay <= min(4, 2 ** retry))
+        self.assertEqual(2, policy.get_delay(retry=5, retry_after=2))
+        self.assertEqual(60, policy.get_delay(retry=0, retry_after=60))
+
+    def test_parse_retry_after(self):
+        self.assertIsNone(RetryPolicy.parse_retry_after(None))
+        self.assertIsNone(RetryPolicy.parse_retry_after('soon'))
+        self.assertEqual(3.0, RetryPolicy.parse_retry_after('3'))
+        delay = RetryPolicy.parse_retry_after(formatdate(time.time() + 30, usegmt=True))
+        self.assertTrue(25 < delay <= 30)
+
+    def test_get_retried_on_server_errors(self):
+        config = self._config()
+        K8sService(config=config, name='svc').create()
+        self.server.fail_next(status=503, count=2)
+        self.server.reset_counters()
+        K8sService(config=config, name='svc').get()
+        self.assertEqual(3, self._count('GET'))
+        stats = config.retry_policy.get_stats()
+        self.assertEqual(2, stats['retries'])
+        self.assertEqual(1, stats['retried_calls'])
+        self.assertEqual(0, stats['gave_up'])
+
+    def test_get_retried_on_connection_reset(self):
+        config = self._config()
+        K8sService(config=config, name='svc').create()
+        self.server.fail_next(status=None)
+        K8sService(config=config, name='svc').get()
+        self.assertEqual(1, config.retry_policy.get_stats()['retries'])
+
+    def test_post_not_retried_on_server_error(self):
+        config = self._config()
+        self.server.fail_next(status=500)
+        try:
+            K8sService(config=config, name='svc').create()
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, BadRequestException)
+        self.assertEqual(1, self._count('POST'))
+
+    def test_post_retried_on_throttling(self):
+        config = self._config()
+        self.server.fail_next(status=429, headers={'Retry-After': '0'})
+        K8sService(config=config, name='svc').create()
+        self.assertEqual(2, self._count('POST'))
+        self.assertIsNotNone(K8sService(config=config, name='svc').get_model())
+
+    def test_retry_after_is_honoured(self):
+        config = self._config(max_backoff=1)
+        self.server.fail_next(status=429, headers={'Retry-After': '0.3'})
+        started = time.time()
+        K8sService(config=config, name='svc').create()
+        self.assertGreaterEqual(time.time() - started, 0.3)
+
+    def test_retry_after_above_max_backoff(self):
+        config = self._config(max_backoff=0.05)
+        self.server.fail_next(status=429, headers={'Retry-After': '0.3'})
+        started = time.time()
+        K8sService(config=config, name='svc').create()
+        self.assertGreaterEqual(time.time() - started, 0.3)
+
+        config = self._config(max_backoff=0.05, deadline=1)
+        self.server.fail_next(status=429, headers={'Retry-After': '60'})
+        started = time.time()
+        try:
+            K8sService(config=config, name='svc2').create()
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, BadRequestException)
+        self.assertLess(time.time() - started, 1)
+        self.assertEqual(1, config.retry_policy.get_stats()['gave_up'])
+
+    def test_gives_up_after_max_retries(self):
+        config = self._config(max_retries=2)
+        K8sService(config=config, name='svc').create()
+        self.server.fail_next(status=503, count=5)
+        try:
+            K8sService(config=config, name='svc').get()
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, NotFoundException)
+        stats = config.retry_policy.get_stats()
+        self.assertEqual(1, stats['gave_up'])
+        self.assertEqual(1, stats['statuses'][503])
+
+    def test_deadline(self):
+        config = self._config(max_retries=10, max_backoff=5, deadline=0.5)
+        K8sService(config=config, name='svc').create()
+        self.server.fail_next(status=503, count=10, headers={'Retry-After': '0.2'})
+        started = time.time()
+        try:
+            K8sService(config=config, name='svc').get()
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, NotFoundException)
+        self.assertLess(time.time() - started, 0.5)
+        self.assertEqual(2, config.retry_policy.get_stats()['retries'])
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE.md', which is part of this source code package.
+#
+
+import threading
+import time
+import unittest
+from kubernetes.utils import Future, WorkerPool
+from kubernetes.K8sExceptions import TimeoutException
+
+
+class WorkerPoolTest(unittest.TestCase):
+
+    # ------------------------------------------------------------------------------------- future
+
+    def test_future_result(self):
+        future = Future()
+        self.assertFalse(future.done())
+        threading.Timer(0.05, future.set_result, args=(42,)).start()
+        self.assertEqual(42, future.result(timeout=5))
+        self.assertFalse(future.set_result(43))
+        self.assertEqual(42, future.result())
+
+    def test_future_exception(self):
+        future = Future.run(Future(), lambda: 1 / 0)
+        self.assertIsInstance(future.exception(), ZeroDivisionError)
+        self.assertRaises(ZeroDivisionError, future.result)
+
+    def test_future_timeout(self):
+        try:
+            Future().result(timeout=0.05)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, TimeoutException)
+
+    def test_future_callback(self):
+        seen = list()
+        future = Future()
+        future.add_done_callback(lambda f: seen.append(f.result()))
+        future.set_result('yo')
+        future.add_done_callback(lambda f: seen.append(f.result()))
+        self.assertEqual(['yo', 'yo'], seen)
+
+    def test_future_chain(self):
+        first = Future()
+        second = Future()
+        chained = first.chain(lambda result: second).chain(lambda result: result + 1)
+        first.set_result(1)
+        self.assertFalse(chained.done())
+        second.set_result(10)
+        self.assertEqual(11, chained.result(timeout=1))
+        failed = Future.run(Future(), lambda: 1 / 0).chain(lambda result: result)
+        self.assertIsInstance(failed.exception(), ZeroDivisionError)
+
+    def test_future_gather(self):
+        futures = [Future() for i in range(3)]
+        gathered = Future.gather(futures)
+        for i, future in enumerate(reversed(futures)):
+            future.set_result(2 - i)
+        self.assertEqual([0, 1, 2], gathered.result(timeout=1))
+        self.assertEqual([], Future.gather([]).result())
+
+    # ------------------------------------------------------------------------------------- pool
+
+    def test_pool_invalid_workers(self):
+        try:
+            WorkerPool(workers=0)
+            self.fail("Should not fail.")
+        except Exception as err:
+            self.assertIsInstance(err, SyntaxError)
+
+    def test_pool_bounded_concurrency(self):
+        pool = WorkerPool(workers=4)
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def work(i):
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return i * 2
+
+        futures = [pool.submit(work, i) for i in range(40)]
+        self.assertEqual([i * 2 for i in range(40)], Future.gather(futures).result(timeout=5))
+        self.assertEqual(4, running[1])
+
+    def test_pool_call_later(self):
+        pool = WorkerPool(workers=1)
+        seen = list()
+        done = threading.Event()
+        pool.call_later(0.1, seen.append, 'late')
+        pool.call_later(0.02, seen.append, 'early')
+        pool.call_later(0.15, done.set)
+        self.assertTrue(done.wait(5))
+        self.assertEqual(['early', 'late'], seen)